@@ -36,6 +36,7 @@ autodoc_mock_imports = [
     "diskcache",  # Deprecated.
     "dill",  # Deprecated.
     "gurobipy",
+    "highspy",
     "kaleido",
     "matplotlib",
     "multimethod",
@@ -0,0 +1,339 @@
+"""Benchmark script for the optimization problem build / solve pipeline.
+
+This script benchmarks the stages of the optimization problem pipeline, i.e., defining variables, parameters,
+constraints and objective, compiling the standard form, solving and retrieving results / duals. Wall time and
+peak memory are recorded per stage, along with the execution times of all nested `mesmo.utils.log_time()` labels.
+The following cases are considered:
+
+- Synthetic problems, which mimic the structure of the electric grid / DER problem definitions and which are scaled
+  in the number of timesteps, number of DERs and grid size, i.e., number of nodes.
+- Optimal operation problems for the bundled scenarios.
+
+The results are stored as JSON file `benchmark_results.json` in the results directory, to enable comparing
+optimization changes against a baseline. Run with `--help` for the command line options.
+"""
+
+import argparse
+import datetime
+import json
+import numpy as np
+import pandas as pd
+import platform
+import scipy.sparse as sp
+import time
+import tracemalloc
+import typing
+
+import mesmo
+
+logger = mesmo.config.get_logger(__name__)
+
+# Synthetic problem scales, given as (timestep_count, der_count, node_count).
+synthetic_scales = {
+    "timesteps": [(24, 10, 20), (96, 10, 20), (288, 10, 20)],
+    "ders": [(24, 10, 20), (24, 50, 20), (24, 200, 20)],
+    "grid": [(24, 10, 20), (24, 10, 100), (24, 10, 400)],
+}
+synthetic_scales_quick = {
+    "timesteps": [(6, 4, 6), (12, 4, 6)],
+    "ders": [(6, 4, 6), (6, 8, 6)],
+    "grid": [(6, 4, 6), (6, 4, 12)],
+}
+
+# Bundled scenarios.
+scenario_names = ["singapore_6node", "ieee_123node", "singapore_tanjongpagar"]
+
+
+class BenchmarkCase(object):
+    """Benchmark case object, which records wall time and peak memory for each stage of a benchmark case."""
+
+    name: str
+    parameters: dict
+    stages: typing.List[dict]
+    log_times: typing.List[dict]
+    error: typing.Optional[str]
+
+    def __init__(self, name: str, parameters: dict = None):
+        self.name = name
+        self.parameters = dict() if parameters is None else parameters
+        self.stages = list()
+        self.log_times = list()
+        self.error = None
+
+    def run_stage(self, label: str, function: typing.Callable, *args, **kwargs):
+        """Run given function as benchmark stage and record its wall time, peak memory and nested log times."""
+
+        # Collect nested execution time records.
+        mesmo.utils.log_time_records = list()
+        tracemalloc.reset_peak()
+        memory_start, _ = tracemalloc.get_traced_memory()
+        try:
+            mesmo.utils.log_time(label, log_level="info", logger_object=logger)
+            time_start = time.perf_counter()
+            result = function(*args, **kwargs)
+            wall_time = time.perf_counter() - time_start
+            mesmo.utils.log_time(label, log_level="info", logger_object=logger)
+        finally:
+            memory_end, memory_peak = tracemalloc.get_traced_memory()
+            log_time_records = mesmo.utils.log_time_records
+            mesmo.utils.log_time_records = None
+
+        # Store results.
+        self.stages.append(
+            dict(
+                label=label,
+                wall_time=wall_time,
+                peak_memory=memory_peak,
+                peak_memory_increase=memory_peak - memory_start,
+                memory_increase=memory_end - memory_start,
+            )
+        )
+        self.log_times.extend(
+            dict(stage=label, label=record_label, wall_time=duration)
+            for record_label, duration in log_time_records
+            if record_label != label
+        )
+
+        return result
+
+    def to_dict(self) -> dict:
+        return dict(
+            name=self.name,
+            parameters=self.parameters,
+            stages=self.stages,
+            log_times=self.log_times,
+            error=self.error,
+        )
+
+
+def define_synthetic_problem(
+    optimization_problem: mesmo.solutions.OptimizationProblem,
+    case: BenchmarkCase,
+    timestep_count: int,
+    der_count: int,
+    node_count: int,
+    seed: int = 0,
+):
+    """Define synthetic optimization problem, which mimics the structure of the electric grid / DER problem.
+
+    The synthetic problem consists of DER active power variables and storage state variables, which are coupled
+    across timesteps through a state equation, as well as node voltage magnitude and branch power magnitude variables,
+    which are defined through linear sensitivity matrices for each timestep, i.e., block-diagonal parameter
+    matrices. The objective is to minimize the DER active power cost for a given price timeseries.
+    """
+
+    # Obtain random data.
+    random_generator = np.random.default_rng(seed)
+    branch_count = node_count - 1
+    timesteps = pd.date_range("2021-01-01", periods=timestep_count, freq="15T")
+    ders = pd.MultiIndex.from_product([["flexible_load"], [f"{der}" for der in range(der_count)]])
+    nodes = pd.MultiIndex.from_product([["no_source"], [f"{node}" for node in range(node_count)], [1, 2, 3]])
+    branches = pd.MultiIndex.from_product([["line"], [f"{branch}" for branch in range(branch_count)], [1, 2, 3]])
+    sensitivity_voltage_by_der = -0.1 / der_count * random_generator.random((len(nodes), len(ders)))
+    sensitivity_branch_power_by_der = 1.0 / der_count * random_generator.random((len(branches), len(ders)))
+    price_timeseries = random_generator.random(len(timesteps))
+
+    # Define variables.
+    def define_variables():
+        optimization_problem.define_variable("der_active_power_vector", timestep=timesteps, der=ders)
+        optimization_problem.define_variable("der_state_vector", timestep=timesteps, der=ders)
+        optimization_problem.define_variable("node_voltage_magnitude_vector", timestep=timesteps, node=nodes)
+        optimization_problem.define_variable("branch_power_magnitude_vector", timestep=timesteps, branch=branches)
+
+    case.run_stage("define variables", define_variables)
+
+    # Define parameters.
+    def define_parameters():
+        optimization_problem.define_parameter(
+            "voltage_active_term",
+            sp.block_diag([sp.csr_matrix(sensitivity_voltage_by_der)] * len(timesteps)),
+        )
+        optimization_problem.define_parameter(
+            "voltage_constant", np.concatenate([np.ones(len(nodes))] * len(timesteps))
+        )
+        optimization_problem.define_parameter(
+            "branch_power_active_term",
+            sp.block_diag([sp.csr_matrix(sensitivity_branch_power_by_der)] * len(timesteps)),
+        )
+        optimization_problem.define_parameter("der_disturbance", -0.5 * np.ones((len(timesteps) - 1) * len(ders)))
+        optimization_problem.define_parameter("der_state_initial", 0.5 * np.ones(len(ders)))
+        optimization_problem.define_parameter(
+            "der_active_power_cost", np.array([np.repeat(price_timeseries, len(ders))])
+        )
+
+    case.run_stage("define parameters", define_parameters)
+
+    # Define constraints.
+    def define_constraints():
+        optimization_problem.define_constraint(
+            ("variable", 1.0, dict(name="node_voltage_magnitude_vector")),
+            "==",
+            ("variable", "voltage_active_term", dict(name="der_active_power_vector")),
+            ("constant", "voltage_constant"),
+        )
+        optimization_problem.define_constraint(
+            ("variable", 1.0, dict(name="branch_power_magnitude_vector")),
+            "==",
+            ("variable", "branch_power_active_term", dict(name="der_active_power_vector")),
+        )
+        optimization_problem.define_constraint(
+            ("variable", 1.0, dict(name="der_state_vector", timestep=timesteps[0])),
+            "==",
+            ("constant", "der_state_initial"),
+        )
+        optimization_problem.define_constraint(
+            ("variable", 1.0, dict(name="der_state_vector", timestep=timesteps[1:])),
+            "==",
+            ("variable", 1.0, dict(name="der_state_vector", timestep=timesteps[:-1])),
+            ("variable", 1.0, dict(name="der_active_power_vector", timestep=timesteps[:-1])),
+            ("constant", "der_disturbance"),
+        )
+        optimization_problem.define_constraint(
+            ("variable", 1.0, dict(name="node_voltage_magnitude_vector")),
+            ">=",
+            ("constant", 0.9),
+        )
+        optimization_problem.define_constraint(
+            ("variable", 1.0, dict(name="node_voltage_magnitude_vector")),
+            "<=",
+            ("constant", 1.1),
+        )
+        optimization_problem.define_constraint(
+            ("variable", 1.0, dict(name="branch_power_magnitude_vector")),
+            "<=",
+            ("constant", 1.0),
+        )
+        optimization_problem.define_constraint(
+            ("variable", 1.0, dict(name="der_active_power_vector")),
+            ">=",
+            ("constant", 0.0),
+        )
+        optimization_problem.define_constraint(
+            ("variable", 1.0, dict(name="der_active_power_vector")),
+            "<=",
+            ("constant", 1.0),
+        )
+        optimization_problem.define_constraint(
+            ("variable", 1.0, dict(name="der_state_vector")),
+            ">=",
+            ("constant", 0.0),
+        )
+        optimization_problem.define_constraint(
+            ("variable", 1.0, dict(name="der_state_vector")),
+            "<=",
+            ("constant", 2.0),
+        )
+
+    case.run_stage("define constraints", define_constraints)
+
+    # Define objective.
+    def define_objective():
+        optimization_problem.define_objective(
+            ("variable", "der_active_power_cost", dict(name="der_active_power_vector"))
+        )
+
+    case.run_stage("define objective", define_objective)
+
+
+def run_synthetic_case(timestep_count: int, der_count: int, node_count: int) -> BenchmarkCase:
+    """Run benchmark case for synthetic optimization problem of given scale."""
+
+    case = BenchmarkCase(
+        f"synthetic_{timestep_count}timesteps_{der_count}ders_{node_count}nodes",
+        dict(timestep_count=timestep_count, der_count=der_count, node_count=node_count),
+    )
+    try:
+        optimization_problem = mesmo.solutions.OptimizationProblem()
+        define_synthetic_problem(optimization_problem, case, timestep_count, der_count, node_count)
+        run_optimization_problem_stages(optimization_problem, case)
+    except Exception as exception:
+        logger.exception(f"Benchmark case {case.name} failed.")
+        case.error = repr(exception)
+
+    return case
+
+
+def run_scenario_case(scenario_name: str) -> BenchmarkCase:
+    """Run benchmark case for optimal operation problem of given scenario."""
+
+    case = BenchmarkCase(f"scenario_{scenario_name}", dict(scenario_name=scenario_name))
+    try:
+        problem = case.run_stage("build problem", mesmo.problems.OptimalOperationProblem, scenario_name)
+        run_optimization_problem_stages(problem.optimization_problem, case)
+    except Exception as exception:
+        logger.exception(f"Benchmark case {case.name} failed.")
+        case.error = repr(exception)
+
+    return case
+
+
+def run_optimization_problem_stages(optimization_problem: mesmo.solutions.OptimizationProblem, case: BenchmarkCase):
+    """Run the compile, solve and results stages for given optimization problem."""
+
+    standard_form = case.run_stage("compile standard form", optimization_problem.get_standard_form)
+    case.parameters["variable_count"] = len(optimization_problem.variables)
+    case.parameters["constraint_count"] = standard_form.b_vector.shape[0]
+    case.run_stage("solve", optimization_problem.solve)
+    case.run_stage("get results", optimization_problem.get_results)
+    case.run_stage("get duals", optimization_problem.get_duals)
+
+
+def main():
+    # Get command line arguments.
+    parser = argparse.ArgumentParser(description="Benchmark script for the optimization problem pipeline")
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        choices=["synthetic", "scenarios"],
+        default=["synthetic", "scenarios"],
+        help="Benchmark cases to be run",
+    )
+    parser.add_argument("--scenarios", nargs="+", default=scenario_names, help="Scenario names to be benchmarked")
+    parser.add_argument("--quick", action="store_true", help="Use small synthetic scales, e.g. for smoke testing")
+    parser.add_argument("--recreate-database", action="store_true", help="Recreate database before benchmarking")
+    args = parser.parse_args()
+
+    # Settings.
+    results_path = mesmo.utils.get_results_path(__file__)
+
+    # Recreate / overwrite database, to incorporate changes in the CSV files.
+    if args.recreate_database:
+        mesmo.data_interface.recreate_database()
+
+    # Run benchmark cases.
+    cases = list()
+    tracemalloc.start()
+    if "synthetic" in args.cases:
+        for scale_name, scales in (synthetic_scales_quick if args.quick else synthetic_scales).items():
+            for timestep_count, der_count, node_count in scales:
+                case = run_synthetic_case(timestep_count, der_count, node_count)
+                case.parameters["scale_name"] = scale_name
+                cases.append(case)
+    if "scenarios" in args.cases:
+        for scenario_name in args.scenarios:
+            cases.append(run_scenario_case(scenario_name))
+    tracemalloc.stop()
+
+    # Store results to JSON.
+    benchmark_results = dict(
+        timestamp=datetime.datetime.now().isoformat(),
+        python_version=platform.python_version(),
+        solver_name=mesmo.config.config["optimization"]["solver_name"],
+        solver_interface=mesmo.config.config["optimization"]["solver_interface"],
+        cases=[case.to_dict() for case in cases],
+    )
+    with open(results_path / "benchmark_results.json", "w") as file:
+        json.dump(benchmark_results, file, indent=4)
+
+    # Print results.
+    for case in cases:
+        print(f"{case.name}: " + ("failed" if case.error is not None else "ok"))
+        for stage in case.stages:
+            print(f"    {stage['label']}: {stage['wall_time']:.6f} s, {stage['peak_memory'] / 1e6:.1f} MB peak")
+
+    # Print results path.
+    print(f"Results are stored in: {results_path}")
+
+
+if __name__ == "__main__":
+    main()
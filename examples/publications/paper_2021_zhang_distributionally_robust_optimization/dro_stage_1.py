@@ -180,8 +180,11 @@ class Stage1(object):
         )
 
         # Obtain standard form matrix / vector representation.
-        self.r_matrix_1_stage_1 = self.optimization_problem.get_a_matrix()
-        self.t_vector_1 = self.optimization_problem.get_b_vector()
+        # - Inequality form is obtained, i.e., equality constraints are represented as two inequality constraints.
+        (
+            self.r_matrix_1_stage_1,
+            self.t_vector_1,
+        ) = self.optimization_problem.get_standard_form().get_inequality_form()
         self.w_vector_1_stage_1 = self.optimization_problem.get_c_vector()
 
 
@@ -546,11 +546,11 @@ class Stage2(object):
         self.stage_1_index = mesmo.utils.get_index(self.optimization_problem.variables, scenario=self.scenarios_stage_1)
         self.stage_2_index = mesmo.utils.get_index(self.optimization_problem.variables, scenario=self.scenarios_stage_2)
         self.delta_index = mesmo.utils.get_index(self.optimization_problem.variables, scenario=["delta"])
-        a_matrix = self.optimization_problem.get_a_matrix()
+        # - Inequality form is obtained, i.e., equality constraints are represented as two inequality constraints.
+        a_matrix, self.t_vector = self.optimization_problem.get_standard_form().get_inequality_form()
         self.r_matrix_2_stage_1 = a_matrix[:, self.stage_1_index]
         self.r_matrix_2_stage_2 = a_matrix[:, self.stage_2_index]
         self.r_matrix_2_delta = a_matrix[:, self.delta_index]
-        self.t_vector = self.optimization_problem.get_b_vector()
         q_matrix = self.optimization_problem.get_q_matrix()
         self.w_matrix_2_stage_1_delta = q_matrix[np.ix_(self.stage_1_index, self.delta_index)]
         c_vector = self.optimization_problem.get_c_vector()
@@ -53,6 +53,7 @@ def run_optimal_operation_problem(
     store_results: bool = True,
     results_path: str = None,
     solve_method: str = None,
+    use_problem_cache: bool = False,
 ) -> mesmo.problems.Results:
     """Set up and solve an optimal operation problem for the given scenario."""
 
@@ -65,7 +66,9 @@ def run_optimal_operation_problem(
         mesmo.data_interface.recreate_database()
 
     # Obtain operation problem.
-    operation_problem = mesmo.problems.OptimalOperationProblem(scenario_name, solve_method=solve_method)
+    operation_problem = mesmo.problems.OptimalOperationProblem(
+        scenario_name, solve_method=solve_method, use_problem_cache=use_problem_cache
+    )
 
     # Solve operation problem.
     operation_problem.solve()
@@ -46,6 +46,7 @@ def get_config() -> dynaconf.Dynaconf:
     config_object["paths"]["additional_data"] = [parse_path(path) for path in config_object["paths"]["additional_data"]]
     config_object["paths"]["database"] = parse_path(config_object["paths"]["database"])
     config_object["paths"]["results"] = parse_path(config_object["paths"]["results"])
+    config_object["paths"]["problem_cache"] = parse_path(config_object["paths"]["problem_cache"])
     config_object["paths"]["highs_solver"] = parse_path(config_object["paths"]["highs_solver"])
 
     return config_object
@@ -162,6 +163,10 @@ elif config["optimization"]["solver_name"] == "gurobi":
     solver_parameters = dict()
     if config["optimization"]["time_limit"] is not None:
         solver_parameters["TimeLimit"] = config["optimization"]["time_limit"]
+elif config["optimization"]["solver_name"] == "highs":
+    solver_parameters = dict()
+    if config["optimization"]["time_limit"] is not None:
+        solver_parameters["time_limit"] = float(config["optimization"]["time_limit"])
 elif config["optimization"]["solver_name"] == "osqp":
     solver_parameters = dict(max_iter=1000000)
 else:
@@ -1791,7 +1791,7 @@ class DERModelSet(DERModelSetBase):
                             )
                             * -1.0
                             * timestep_interval_hours  # In Wh.
-                            @ sp.block_diag(self.der_active_power_vector_reference)
+                            * self.der_active_power_vector_reference  # Scaled per DER, i.e., for each column.
                         ).ravel()
                     ]
                 ),
@@ -1819,7 +1819,7 @@ class DERModelSet(DERModelSetBase):
                             )
                             * -1.0
                             * timestep_interval_hours  # In Wh.
-                            @ sp.block_diag(self.der_reactive_power_vector_reference)
+                            * self.der_reactive_power_vector_reference  # Scaled per DER, i.e., for each column.
                         ).ravel()
                     ]
                 ),
@@ -1848,7 +1848,7 @@ class DERModelSet(DERModelSetBase):
                             )
                             * -1.0
                             * timestep_interval_hours  # In Wh.
-                            @ sp.block_diag(self.der_thermal_power_vector_reference)
+                            * self.der_thermal_power_vector_reference  # Scaled per DER, i.e., for each column.
                         ).ravel()
                     ]
                 ),
@@ -2088,151 +2088,87 @@ class DERModelSet(DERModelSetBase):
         # Obtain timestep interval in hours, for conversion of power to energy.
         timestep_interval_hours = (self.timesteps[1] - self.timesteps[0]) / pd.Timedelta("1h")
 
-        # Define objective for electric loads.
-        # - Defined as cost of electric power supply at the DER node.
-        # - Cost for load / demand, revenue for generation / supply.
-        # - Only defined here, if not yet defined as cost of electric supply at electric grid source node
-        #   in `mesmo.electric_grid_models.LinearElectricGridModelSet.define_optimization_objective`.
-        if (len(self.electric_ders) > 0) and not optimization_problem.flags.get("has_electric_grid_objective"):
-            optimization_problem.define_objective(
-                (
-                    "variable",
-                    "der_active_power_cost",
-                    dict(
-                        name="der_active_power_vector",
-                        scenario=scenarios,
-                        timestep=self.timesteps,
-                        der=self.electric_ders,
-                    ),
-                ),
-                (
-                    "variable",
-                    "der_active_power_cost_sensitivity",
-                    dict(
-                        name="der_active_power_vector",
-                        scenario=scenarios,
-                        timestep=self.timesteps,
-                        der=self.electric_ders,
-                    ),
-                    dict(
-                        name="der_active_power_vector",
-                        scenario=scenarios,
-                        timestep=self.timesteps,
-                        der=self.electric_ders,
-                    ),
-                ),
-                (
-                    "variable",
-                    "der_reactive_power_cost",
-                    dict(
-                        name="der_reactive_power_vector",
-                        scenario=scenarios,
-                        timestep=self.timesteps,
-                        der=self.electric_ders,
-                    ),
-                ),
-                (
-                    "variable",
-                    "der_reactive_power_cost_sensitivity",
-                    dict(
-                        name="der_reactive_power_vector",
-                        scenario=scenarios,
-                        timestep=self.timesteps,
-                        der=self.electric_ders,
-                    ),
-                    dict(
-                        name="der_reactive_power_vector",
-                        scenario=scenarios,
-                        timestep=self.timesteps,
-                        der=self.electric_ders,
-                    ),
-                ),
-                broadcast="scenario",
-            )
+        # Define objective for electric DERs.
+        # - The objective terms of all electric DERs are defined in a single call, where the price / cost parameters
+        #   are row vectors across all timesteps and DERs.
+        if len(self.electric_ders) > 0:
+            # Obtain variable keys.
+            der_active_power_vector_keys = dict(
+                name="der_active_power_vector", scenario=scenarios, timestep=self.timesteps, der=self.electric_ders
+            )
+            der_reactive_power_vector_keys = dict(
+                name="der_reactive_power_vector", scenario=scenarios, timestep=self.timesteps, der=self.electric_ders
+            )
+            objective_terms = list()
+
+            # Define objective for electric loads.
+            # - Defined as cost of electric power supply at the DER node.
+            # - Cost for load / demand, revenue for generation / supply.
+            # - Only defined here, if not yet defined as cost of electric supply at electric grid source node
+            #   in `mesmo.electric_grid_models.LinearElectricGridModelSet.define_optimization_objective`.
+            if not optimization_problem.flags.get("has_electric_grid_objective"):
+                objective_terms.extend(
+                    [
+                        ("variable", "der_active_power_cost", der_active_power_vector_keys),
+                        (
+                            "variable",
+                            "der_active_power_cost_sensitivity",
+                            der_active_power_vector_keys,
+                            der_active_power_vector_keys,
+                        ),
+                        ("variable", "der_reactive_power_cost", der_reactive_power_vector_keys),
+                        (
+                            "variable",
+                            "der_reactive_power_cost_sensitivity",
+                            der_reactive_power_vector_keys,
+                            der_reactive_power_vector_keys,
+                        ),
+                    ]
+                )
 
-        # Define objective for thermal loads.
-        # - Defined as cost of thermal power supply at the DER node.
-        # - Only defined here, if not yet defined as cost of thermal supply at thermal grid source node
-        #   in `mesmo.thermal_grid_models.LinearThermalGridModelSet.define_optimization_objective`.
-        if (len(self.thermal_ders) > 0) and not optimization_problem.flags.get("has_thermal_grid_objective"):
-            optimization_problem.define_objective(
-                (
-                    "variable",
-                    "der_thermal_power_cost",
-                    dict(
-                        name="der_thermal_power_vector",
-                        scenario=scenarios,
-                        timestep=self.timesteps,
-                        der=self.thermal_ders,
-                    ),
-                ),
-                (
-                    "variable",
-                    "der_thermal_power_cost_sensitivity",
-                    dict(
-                        name="der_thermal_power_vector",
-                        scenario=scenarios,
-                        timestep=self.timesteps,
-                        der=self.thermal_ders,
-                    ),
-                    dict(
-                        name="der_thermal_power_vector",
-                        scenario=scenarios,
-                        timestep=self.timesteps,
-                        der=self.thermal_ders,
-                    ),
-                ),
-                broadcast="scenario",
+            # Define objective for electric generators.
+            # - That is: Active power generation cost.
+            # - Always defined here as the cost of electric power generation at the DER node.
+            objective_terms.extend(
+                [
+                    ("variable", "der_active_power_marginal_cost", der_active_power_vector_keys),
+                    ("variable", "der_reactive_power_marginal_cost", der_reactive_power_vector_keys),
+                ]
             )
 
-        # Define objective for electric generators.
-        # - That is: Active power generation cost.
-        # - Always defined here as the cost of electric power generation at the DER node.
-        if len(self.electric_ders) > 0:
-            optimization_problem.define_objective(
-                (
-                    "variable",
-                    "der_active_power_marginal_cost",
-                    dict(
-                        name="der_active_power_vector",
-                        scenario=scenarios,
-                        timestep=self.timesteps,
-                        der=self.electric_ders,
-                    ),
-                ),
-                broadcast="scenario",
-            )
-            optimization_problem.define_objective(
-                (
-                    "variable",
-                    "der_reactive_power_marginal_cost",
-                    dict(
-                        name="der_reactive_power_vector",
-                        scenario=scenarios,
-                        timestep=self.timesteps,
-                        der=self.electric_ders,
-                    ),
-                ),
-                broadcast="scenario",
-            )
+            optimization_problem.define_objective(*objective_terms, broadcast="scenario")
 
-        # Define objective for thermal generators.
-        # - That is: Thermal power generation cost.
-        # - Always defined here as the cost of thermal power generation at the DER node.
+        # Define objective for thermal DERs.
         if len(self.thermal_ders) > 0:
-            optimization_problem.define_objective(
-                (
-                    "variable",
-                    "der_thermal_power_marginal_cost",
-                    dict(
-                        name="der_thermal_power_vector",
-                        scenario=scenarios,
-                        timestep=self.timesteps,
-                        der=self.thermal_ders,
-                    ),
-                ),
-                broadcast="scenario",
-            )
+            # Obtain variable keys.
+            der_thermal_power_vector_keys = dict(
+                name="der_thermal_power_vector", scenario=scenarios, timestep=self.timesteps, der=self.thermal_ders
+            )
+            objective_terms = list()
+
+            # Define objective for thermal loads.
+            # - Defined as cost of thermal power supply at the DER node.
+            # - Only defined here, if not yet defined as cost of thermal supply at thermal grid source node
+            #   in `mesmo.thermal_grid_models.LinearThermalGridModelSet.define_optimization_objective`.
+            if not optimization_problem.flags.get("has_thermal_grid_objective"):
+                objective_terms.extend(
+                    [
+                        ("variable", "der_thermal_power_cost", der_thermal_power_vector_keys),
+                        (
+                            "variable",
+                            "der_thermal_power_cost_sensitivity",
+                            der_thermal_power_vector_keys,
+                            der_thermal_power_vector_keys,
+                        ),
+                    ]
+                )
+
+            # Define objective for thermal generators.
+            # - That is: Thermal power generation cost.
+            # - Always defined here as the cost of thermal power generation at the DER node.
+            objective_terms.append(("variable", "der_thermal_power_marginal_cost", der_thermal_power_vector_keys))
+
+            optimization_problem.define_objective(*objective_terms, broadcast="scenario")
 
     def evaluate_optimization_objective(
         self,
@@ -2259,7 +2195,7 @@ class DERModelSet(DERModelSetBase):
         if len(self.thermal_ders) > 0:
             objective_variable_names.extend(["der_thermal_power_vector_per_unit"])
         for variable_name in objective_variable_names:
-            index = mesmo.utils.get_index(optimization_problem.variables, name=variable_name.replace("_per_unit", ""))
+            index = optimization_problem.get_variable_index(name=variable_name.replace("_per_unit", ""))
             x_vector[index, 0] = results[variable_name].values.ravel()
 
         # Obtain objective value.
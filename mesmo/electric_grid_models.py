@@ -6,6 +6,7 @@ import natsort
 import numpy as np
 import opendssdirect
 import pandas as pd
+import re
 import scipy.sparse as sp
 import scipy.sparse.linalg
 import typing
@@ -71,7 +72,9 @@ class ElectricGridModel(mesmo.utils.ObjectBase):
         der_incidence_delta_matrix_no_source (sp.spmatrix): Incidence matrix from delta-conn. DERs to no-source nodes.
         node_voltage_vector_reference_no_source (sp.spmatrix): Nodal reference voltage vector for no-source nodes.
         node_voltage_vector_reference_source (sp.spmatrix): Nodal reference voltage vector for source nodes.
-        node_admittance_matrix_no_source_inverse (sp.spmatrix): Inverse of no-source nodal admittance matrix.
+        node_admittance_matrix_no_source_factorization (scipy.sparse.linalg.SuperLU): Sparse LU factorization of
+            no-source nodal admittance matrix, which is obtained via
+            :meth:`get_node_admittance_matrix_no_source_factorization`.
     """
 
     timesteps: pd.Index
@@ -108,7 +111,7 @@ class ElectricGridModel(mesmo.utils.ObjectBase):
     der_incidence_delta_matrix_no_source: sp.spmatrix
     node_voltage_vector_reference_no_source: sp.spmatrix
     node_voltage_vector_reference_source: sp.spmatrix
-    node_admittance_matrix_no_source_inverse: sp.spmatrix
+    node_admittance_matrix_no_source_factorization: typing.Optional[scipy.sparse.linalg.SuperLU]
 
     @multimethod.multimethod
     def __init__(self, scenario_name: str):
@@ -281,8 +284,23 @@ class ElectricGridModel(mesmo.utils.ObjectBase):
         # Obtain index set for DERs.
         self.ders = pd.MultiIndex.from_frame(electric_grid_data.electric_grid_ders[["der_type", "der_name"]])
 
+        # Obtain position maps for nodes / branches, i.e., mapping of node name and phase to node position as well as
+        # mapping of branch type, branch name and phase to branch position.
+        # - This avoids obtaining the positions via `mesmo.utils.get_index()` for each grid element.
+        node_positions = {
+            (node_name, phase): node_position for node_position, (_, node_name, phase) in enumerate(self.nodes)
+        }
+        branch_positions = {branch: branch_position for branch_position, branch in enumerate(self.branches)}
+
+        # Obtain phases vectors for all nodes / lines / transformers / DERs.
+        node_phases_vectors = mesmo.utils.get_element_phases_arrays(electric_grid_data.electric_grid_nodes)
+        line_phases_vectors = mesmo.utils.get_element_phases_arrays(electric_grid_data.electric_grid_lines)
+        transformer_phases_vectors = mesmo.utils.get_element_phases_arrays(
+            electric_grid_data.electric_grid_transformers
+        )
+        der_phases_vectors = mesmo.utils.get_element_phases_arrays(electric_grid_data.electric_grid_ders)
+
         # Obtain reference / no load voltage vector.
-        self.node_voltage_vector_reference = np.zeros(len(self.nodes), dtype=complex)
         voltage_phase_factors = np.array(
             [
                 np.exp(0 * 1j),  # Phase 1.
@@ -290,36 +308,32 @@ class ElectricGridModel(mesmo.utils.ObjectBase):
                 np.exp(2 * np.pi / 3 * 1j),  # Phase 3.
             ]
         )
-        for node_name, node in electric_grid_data.electric_grid_nodes.iterrows():
-            # Obtain phases index & node index for positioning the node voltage in the voltage vector.
-            phases_index = mesmo.utils.get_element_phases_array(node) - 1
-            node_index = mesmo.utils.get_index(self.nodes, node_name=node_name)
-
-            # Insert voltage into voltage vector.
-            self.node_voltage_vector_reference[node_index] = (
-                voltage_phase_factors[phases_index] * node.at["voltage"] / np.sqrt(3)
-            )
+        self.node_voltage_vector_reference = (
+            voltage_phase_factors[self.nodes.get_level_values("phase").values.astype(int) - 1]
+            * electric_grid_data.electric_grid_nodes.loc[self.nodes.get_level_values("node_name"), "voltage"].values
+            / np.sqrt(3)
+        )
 
         # Obtain reference / rated branch power vector.
+        # - For transformers, the total capacity is divided by number of phases.
+        line_names = self.lines.get_level_values("branch_name")
+        transformer_names = self.transformers.get_level_values("branch_name")
         self.branch_power_vector_magnitude_reference = np.zeros(len(self.branches), dtype=float)
-        for line_name, line in electric_grid_data.electric_grid_lines.iterrows():
-            # Obtain branch index.
-            branch_index = mesmo.utils.get_index(self.branches, branch_type="line", branch_name=line_name)
-
-            # Insert rated power into branch power vector.
-            self.branch_power_vector_magnitude_reference[branch_index] = (
-                line.at["maximum_current"]
-                * electric_grid_data.electric_grid_nodes.at[line.at["node_1_name"], "voltage"]
-                / np.sqrt(3)
-            )
-        for transformer_name, transformer in electric_grid_data.electric_grid_transformers.iterrows():
-            # Obtain branch index.
-            branch_index = mesmo.utils.get_index(self.branches, branch_type="transformer", branch_name=transformer_name)
-
-            # Insert rated power into branch flow vector.
-            self.branch_power_vector_magnitude_reference[branch_index] = transformer.at["apparent_power"] / len(
-                branch_index
-            )  # Divide total capacity by number of phases.
+        self.branch_power_vector_magnitude_reference[
+            mesmo.utils.get_index(self.branches, raise_empty_index_error=False, branch_type="line")
+        ] = (
+            electric_grid_data.electric_grid_lines.loc[line_names, "maximum_current"].values
+            * electric_grid_data.electric_grid_nodes.loc[
+                electric_grid_data.electric_grid_lines.loc[line_names, "node_1_name"], "voltage"
+            ].values
+            / np.sqrt(3)
+        )
+        self.branch_power_vector_magnitude_reference[
+            mesmo.utils.get_index(self.branches, raise_empty_index_error=False, branch_type="transformer")
+        ] = (
+            electric_grid_data.electric_grid_transformers.loc[transformer_names, "apparent_power"].values
+            / transformer_names.value_counts().loc[transformer_names].values
+        )
 
         # Obtain reference / nominal DER power vector.
         self.der_power_vector_reference = (
@@ -341,35 +355,37 @@ class ElectricGridModel(mesmo.utils.ObjectBase):
         if self.is_single_phase_equivalent:
             self.branch_power_vector_magnitude_reference[mesmo.utils.get_index(self.branches, branch_type="line")] *= 3
 
-        # Define sparse matrices for nodal admittance, nodal transformation,
+        # Define sparse matrix blocks for nodal admittance, nodal transformation,
         # branch admittance, branch incidence and der incidence matrix entries.
-        self.node_admittance_matrix = sp.dok_matrix((len(self.nodes), len(self.nodes)), dtype=complex)
-        self.node_transformation_matrix = sp.dok_matrix((len(self.nodes), len(self.nodes)), dtype=int)
-        self.branch_admittance_1_matrix = sp.dok_matrix((len(self.branches), len(self.nodes)), dtype=complex)
-        self.branch_admittance_2_matrix = sp.dok_matrix((len(self.branches), len(self.nodes)), dtype=complex)
-        self.branch_incidence_1_matrix = sp.dok_matrix((len(self.branches), len(self.nodes)), dtype=int)
-        self.branch_incidence_2_matrix = sp.dok_matrix((len(self.branches), len(self.nodes)), dtype=int)
-        self.der_incidence_wye_matrix = sp.dok_matrix((len(self.nodes), len(self.ders)), dtype=float)
-        self.der_incidence_delta_matrix = sp.dok_matrix((len(self.nodes), len(self.ders)), dtype=float)
+        # - Blocks are collected as tuples of row index, column index and block matrix for all elements and
+        #   the sparse matrices are obtained at once via `mesmo.utils.get_sparse_matrix_from_blocks()`.
+        node_admittance_blocks = list()
+        node_transformation_blocks = list()
+        branch_admittance_1_blocks = list()
+        branch_admittance_2_blocks = list()
+        branch_incidence_1_blocks = list()
+        branch_incidence_2_blocks = list()
+        der_incidence_wye_blocks = list()
+        der_incidence_delta_blocks = list()
+
+        # Obtain line resistance / reactance / capacitance matrix entries for each line type.
+        line_types_matrices = {
+            line_type: (
+                line_type_matrices.loc[:, "resistance"].values,
+                line_type_matrices.loc[:, "reactance"].values,
+                line_type_matrices.loc[:, "capacitance"].values,
+            )
+            for line_type, line_type_matrices in electric_grid_data.electric_grid_line_types_matrices.groupby(
+                "line_type"
+            )
+        }
 
         # Add lines to admittance, transformation and incidence matrices.
-        for line_index, line in electric_grid_data.electric_grid_lines.iterrows():
-            # Obtain phases vector.
-            phases_vector = mesmo.utils.get_element_phases_array(line)
-
+        for line, phases_vector in zip(
+            electric_grid_data.electric_grid_lines.to_dict(orient="records"), line_phases_vectors
+        ):
             # Obtain line resistance / reactance / capacitance matrix entries for the line.
-            matrices_index = (
-                electric_grid_data.electric_grid_line_types_matrices.loc[:, "line_type"] == line["line_type"]
-            )
-            resistance_matrix = electric_grid_data.electric_grid_line_types_matrices.loc[
-                matrices_index, "resistance"
-            ].values
-            reactance_matrix = electric_grid_data.electric_grid_line_types_matrices.loc[
-                matrices_index, "reactance"
-            ].values
-            capacitance_matrix = electric_grid_data.electric_grid_line_types_matrices.loc[
-                matrices_index, "capacitance"
-            ].values
+            resistance_matrix, reactance_matrix, capacitance_matrix = line_types_matrices[line["line_type"]]
 
             # Obtain the full line resistance and reactance matrices.
             # Data only contains upper half entries.
@@ -404,29 +420,25 @@ class ElectricGridModel(mesmo.utils.ObjectBase):
 
             # Obtain indexes for positioning the line element matrices
             # in the full admittance matrices.
-            node_index_1 = mesmo.utils.get_index(self.nodes, node_name=line["node_1_name"], phase=phases_vector)
-            node_index_2 = mesmo.utils.get_index(self.nodes, node_name=line["node_2_name"], phase=phases_vector)
-            branch_index = mesmo.utils.get_index(self.branches, branch_type="line", branch_name=line["line_name"])
+            node_index_1 = [node_positions[line["node_1_name"], phase] for phase in phases_vector]
+            node_index_2 = [node_positions[line["node_2_name"], phase] for phase in phases_vector]
+            branch_index = [branch_positions["line", line["line_name"], phase] for phase in phases_vector]
 
             # Add line element matrices to the nodal admittance matrix.
-            self.node_admittance_matrix[np.ix_(node_index_1, node_index_1)] += admittance_matrix_11
-            self.node_admittance_matrix[np.ix_(node_index_1, node_index_2)] += admittance_matrix_12
-            self.node_admittance_matrix[np.ix_(node_index_2, node_index_1)] += admittance_matrix_21
-            self.node_admittance_matrix[np.ix_(node_index_2, node_index_2)] += admittance_matrix_22
+            node_admittance_blocks.append((node_index_1, node_index_1, admittance_matrix_11))
+            node_admittance_blocks.append((node_index_1, node_index_2, admittance_matrix_12))
+            node_admittance_blocks.append((node_index_2, node_index_1, admittance_matrix_21))
+            node_admittance_blocks.append((node_index_2, node_index_2, admittance_matrix_22))
 
             # Add line element matrices to the branch admittance matrices.
-            self.branch_admittance_1_matrix[np.ix_(branch_index, node_index_1)] += admittance_matrix_11
-            self.branch_admittance_1_matrix[np.ix_(branch_index, node_index_2)] += admittance_matrix_12
-            self.branch_admittance_2_matrix[np.ix_(branch_index, node_index_1)] += admittance_matrix_21
-            self.branch_admittance_2_matrix[np.ix_(branch_index, node_index_2)] += admittance_matrix_22
+            branch_admittance_1_blocks.append((branch_index, node_index_1, admittance_matrix_11))
+            branch_admittance_1_blocks.append((branch_index, node_index_2, admittance_matrix_12))
+            branch_admittance_2_blocks.append((branch_index, node_index_1, admittance_matrix_21))
+            branch_admittance_2_blocks.append((branch_index, node_index_2, admittance_matrix_22))
 
             # Add line element matrices to the branch incidence matrices.
-            self.branch_incidence_1_matrix[np.ix_(branch_index, node_index_1)] += np.identity(
-                len(branch_index), dtype=int
-            )
-            self.branch_incidence_2_matrix[np.ix_(branch_index, node_index_2)] += np.identity(
-                len(branch_index), dtype=int
-            )
+            branch_incidence_1_blocks.append((branch_index, node_index_1, np.identity(len(branch_index), dtype=int)))
+            branch_incidence_2_blocks.append((branch_index, node_index_2, np.identity(len(branch_index), dtype=int)))
 
         # Add transformers to admittance, transformation and incidence matrices.
         # - Note: This setup only works for transformers with exactly two windings
@@ -439,59 +451,58 @@ class ElectricGridModel(mesmo.utils.ObjectBase):
         transformer_factors_3 = 1 / np.sqrt(3) * np.array([[-1, 1, 0], [0, -1, 1], [1, 0, -1]])
 
         # Add transformers to admittance matrix.
-        for transformer_index, transformer in electric_grid_data.electric_grid_transformers.iterrows():
+        for transformer, phases_vector in zip(
+            electric_grid_data.electric_grid_transformers.to_dict(orient="records"), transformer_phases_vectors
+        ):
             # Raise error if transformer nominal power is not valid.
-            if not (transformer.at["apparent_power"] > 0):
+            if not (transformer["apparent_power"] > 0):
                 raise ValueError(
-                    f"At transformer '{transformer.at['transformer_name']}', "
-                    f"found invalid value for `apparent_power`: {transformer.at['apparent_power']}`"
+                    f"At transformer '{transformer['transformer_name']}', "
+                    f"found invalid value for `apparent_power`: {transformer['apparent_power']}`"
                 )
 
             # Calculate transformer admittance.
             admittance = (
-                (2 * transformer.at["resistance_percentage"] / 100 + 1j * transformer.at["reactance_percentage"] / 100)
+                (2 * transformer["resistance_percentage"] / 100 + 1j * transformer["reactance_percentage"] / 100)
                 * (
-                    electric_grid_data.electric_grid_nodes.at[transformer.at["node_2_name"], "voltage"] ** 2
-                    / transformer.at["apparent_power"]
+                    electric_grid_data.electric_grid_nodes.at[transformer["node_2_name"], "voltage"] ** 2
+                    / transformer["apparent_power"]
                 )
             ) ** -1
 
             # Calculate turn ratio.
             turn_ratio = (
                 1.0  # TODO: Replace `1.0` with actual tap position.
-                * electric_grid_data.electric_grid_nodes.at[transformer.at["node_1_name"], "voltage"]
+                * electric_grid_data.electric_grid_nodes.at[transformer["node_1_name"], "voltage"]
             ) / (
                 1.0  # TODO: Replace `1.0` with actual tap position.
-                * electric_grid_data.electric_grid_nodes.at[transformer.at["node_2_name"], "voltage"]
+                * electric_grid_data.electric_grid_nodes.at[transformer["node_2_name"], "voltage"]
             )
 
             # Construct transformer element admittance matrices according to:
             # https://doi.org/10.1109/TPWRS.2017.2728618
-            if transformer.at["connection"] == "wye-wye":
+            if transformer["connection"] == "wye-wye":
                 admittance_matrix_11 = admittance * transformer_factors_1 / turn_ratio**2
                 admittance_matrix_12 = -1 * admittance * transformer_factors_1 / turn_ratio
                 admittance_matrix_21 = -1 * admittance * transformer_factors_1 / turn_ratio
                 admittance_matrix_22 = admittance * transformer_factors_1
-            elif transformer.at["connection"] == "delta-wye":
+            elif transformer["connection"] == "delta-wye":
                 admittance_matrix_11 = admittance * transformer_factors_2 / turn_ratio**2
                 admittance_matrix_12 = -1 * admittance * -1 * np.transpose(transformer_factors_3) / turn_ratio
                 admittance_matrix_21 = -1 * admittance * -1 * transformer_factors_3 / turn_ratio
                 admittance_matrix_22 = admittance * transformer_factors_1
-            elif transformer.at["connection"] == "wye-delta":
+            elif transformer["connection"] == "wye-delta":
                 admittance_matrix_11 = admittance * transformer_factors_1 / turn_ratio**2
                 admittance_matrix_12 = -1 * admittance * -1 * transformer_factors_3 / turn_ratio
                 admittance_matrix_21 = -1 * admittance * -1 * np.transpose(transformer_factors_3) / turn_ratio
                 admittance_matrix_22 = admittance * transformer_factors_2
-            elif transformer.at["connection"] == "delta-delta":
+            elif transformer["connection"] == "delta-delta":
                 admittance_matrix_11 = admittance * transformer_factors_2 / turn_ratio**2
                 admittance_matrix_12 = -1 * admittance * transformer_factors_2 / turn_ratio
                 admittance_matrix_21 = -1 * admittance * transformer_factors_2 / turn_ratio
                 admittance_matrix_22 = admittance * transformer_factors_2
             else:
-                raise ValueError(f"Unknown transformer type: {transformer.at['connection']}")
-
-            # Obtain phases vector.
-            phases_vector = mesmo.utils.get_element_phases_array(transformer)
+                raise ValueError(f"Unknown transformer type: {transformer['connection']}")
 
             # Obtain element admittance matrices for correct phases.
             admittance_matrix_11 = admittance_matrix_11[np.ix_(phases_vector - 1, phases_vector - 1)]
@@ -501,73 +512,65 @@ class ElectricGridModel(mesmo.utils.ObjectBase):
 
             # Obtain indexes for positioning the transformer element
             # matrices in the full matrices.
-            node_index_1 = mesmo.utils.get_index(
-                self.nodes, node_name=transformer.at["node_1_name"], phase=phases_vector
-            )
-            node_index_2 = mesmo.utils.get_index(
-                self.nodes, node_name=transformer.at["node_2_name"], phase=phases_vector
-            )
-            branch_index = mesmo.utils.get_index(
-                self.branches, branch_type="transformer", branch_name=transformer["transformer_name"]
-            )
+            node_index_1 = [node_positions[transformer["node_1_name"], phase] for phase in phases_vector]
+            node_index_2 = [node_positions[transformer["node_2_name"], phase] for phase in phases_vector]
+            branch_index = [
+                branch_positions["transformer", transformer["transformer_name"], phase] for phase in phases_vector
+            ]
 
             # Add transformer element matrices to the nodal admittance matrix.
-            self.node_admittance_matrix[np.ix_(node_index_1, node_index_1)] += admittance_matrix_11
-            self.node_admittance_matrix[np.ix_(node_index_1, node_index_2)] += admittance_matrix_12
-            self.node_admittance_matrix[np.ix_(node_index_2, node_index_1)] += admittance_matrix_21
-            self.node_admittance_matrix[np.ix_(node_index_2, node_index_2)] += admittance_matrix_22
+            node_admittance_blocks.append((node_index_1, node_index_1, admittance_matrix_11))
+            node_admittance_blocks.append((node_index_1, node_index_2, admittance_matrix_12))
+            node_admittance_blocks.append((node_index_2, node_index_1, admittance_matrix_21))
+            node_admittance_blocks.append((node_index_2, node_index_2, admittance_matrix_22))
 
             # Add transformer element matrices to the branch admittance matrices.
-            self.branch_admittance_1_matrix[np.ix_(branch_index, node_index_1)] += admittance_matrix_11
-            self.branch_admittance_1_matrix[np.ix_(branch_index, node_index_2)] += admittance_matrix_12
-            self.branch_admittance_2_matrix[np.ix_(branch_index, node_index_1)] += admittance_matrix_21
-            self.branch_admittance_2_matrix[np.ix_(branch_index, node_index_2)] += admittance_matrix_22
+            branch_admittance_1_blocks.append((branch_index, node_index_1, admittance_matrix_11))
+            branch_admittance_1_blocks.append((branch_index, node_index_2, admittance_matrix_12))
+            branch_admittance_2_blocks.append((branch_index, node_index_1, admittance_matrix_21))
+            branch_admittance_2_blocks.append((branch_index, node_index_2, admittance_matrix_22))
 
             # Add transformer element matrices to the branch incidence matrices.
-            self.branch_incidence_1_matrix[np.ix_(branch_index, node_index_1)] += np.identity(
-                len(branch_index), dtype=int
-            )
-            self.branch_incidence_2_matrix[np.ix_(branch_index, node_index_2)] += np.identity(
-                len(branch_index), dtype=int
-            )
+            branch_incidence_1_blocks.append((branch_index, node_index_1, np.identity(len(branch_index), dtype=int)))
+            branch_incidence_2_blocks.append((branch_index, node_index_2, np.identity(len(branch_index), dtype=int)))
 
         # Define transformation matrix according to:
         # https://doi.org/10.1109/TPWRS.2018.2823277
         transformation_entries = np.array([[1, -1, 0], [0, 1, -1], [-1, 0, 1]])
-        for node_name, node in electric_grid_data.electric_grid_nodes.iterrows():
+        for node_name, phases_vector in zip(electric_grid_data.electric_grid_nodes["node_name"], node_phases_vectors):
             # Obtain node phases index.
-            phases_index = mesmo.utils.get_element_phases_array(node) - 1
+            phases_index = phases_vector - 1
 
             # Construct node transformation matrix.
             transformation_matrix = transformation_entries[np.ix_(phases_index, phases_index)]
 
             # Obtain index for positioning node transformation matrix in full transformation matrix.
-            node_index = mesmo.utils.get_index(self.nodes, node_name=node["node_name"])
+            node_index = [node_positions[node_name, phase] for phase in phases_vector]
 
             # Add node transformation matrix to full transformation matrix.
-            self.node_transformation_matrix[np.ix_(node_index, node_index)] = transformation_matrix
+            node_transformation_blocks.append((node_index, node_index, transformation_matrix))
 
         # Add DERs to DER incidence matrix.
-        for der_name, der in electric_grid_data.electric_grid_ders.iterrows():
+        for der_position, (der, phases_vector) in enumerate(
+            zip(electric_grid_data.electric_grid_ders.to_dict(orient="records"), der_phases_vectors)
+        ):
             # Obtain der connection type.
             connection = der["connection"]
 
             # Obtain indexes for positioning the DER in the incidence matrix.
-            node_index = mesmo.utils.get_index(
-                self.nodes, node_name=der["node_name"], phase=mesmo.utils.get_element_phases_array(der)
-            )
-            der_index = mesmo.utils.get_index(self.ders, der_name=der["der_name"])
+            node_index = [node_positions[der["node_name"], phase] for phase in phases_vector]
+            der_index = [der_position]
 
             if connection == "wye":
                 # Define incidence matrix entries.
                 # - Wye ders are represented as balanced ders across all
                 #   their connected phases.
                 incidence_matrix = np.ones((len(node_index), 1), dtype=float) / len(node_index)
-                self.der_incidence_wye_matrix[np.ix_(node_index, der_index)] = incidence_matrix
+                der_incidence_wye_blocks.append((node_index, der_index, incidence_matrix))
 
             elif connection == "delta":
                 # Obtain phases of the delta der.
-                phases_list = mesmo.utils.get_element_phases_array(der).tolist()
+                phases_list = phases_vector.tolist()
 
                 # Select connection node based on phase arrangement of delta der.
                 # TODO: Why no multi-phase delta DERs?
@@ -582,29 +585,45 @@ class ElectricGridModel(mesmo.utils.ObjectBase):
                 # Define incidence matrix entry.
                 # - Delta ders are assumed to be single-phase.
                 incidence_matrix = np.array([1])
-                self.der_incidence_delta_matrix[np.ix_(node_index, der_index)] = incidence_matrix
+                der_incidence_delta_blocks.append((node_index, der_index, incidence_matrix))
 
             else:
                 raise ValueError(f"Unknown der connection type: {connection}")
 
+        # Obtain sparse matrices for nodal admittance, nodal transformation,
+        # branch admittance, branch incidence and der incidence matrices.
+        # - Using CSR format for more efficient calculations
+        #   according to <https://docs.scipy.org/doc/scipy/reference/sparse.html>.
+        self.node_admittance_matrix = mesmo.utils.get_sparse_matrix_from_blocks(
+            node_admittance_blocks, (len(self.nodes), len(self.nodes)), dtype=complex
+        )
+        self.node_transformation_matrix = mesmo.utils.get_sparse_matrix_from_blocks(
+            node_transformation_blocks, (len(self.nodes), len(self.nodes)), dtype=int
+        )
+        self.branch_admittance_1_matrix = mesmo.utils.get_sparse_matrix_from_blocks(
+            branch_admittance_1_blocks, (len(self.branches), len(self.nodes)), dtype=complex
+        )
+        self.branch_admittance_2_matrix = mesmo.utils.get_sparse_matrix_from_blocks(
+            branch_admittance_2_blocks, (len(self.branches), len(self.nodes)), dtype=complex
+        )
+        self.branch_incidence_1_matrix = mesmo.utils.get_sparse_matrix_from_blocks(
+            branch_incidence_1_blocks, (len(self.branches), len(self.nodes)), dtype=int
+        )
+        self.branch_incidence_2_matrix = mesmo.utils.get_sparse_matrix_from_blocks(
+            branch_incidence_2_blocks, (len(self.branches), len(self.nodes)), dtype=int
+        )
+        self.der_incidence_wye_matrix = mesmo.utils.get_sparse_matrix_from_blocks(
+            der_incidence_wye_blocks, (len(self.nodes), len(self.ders)), dtype=float
+        )
+        self.der_incidence_delta_matrix = mesmo.utils.get_sparse_matrix_from_blocks(
+            der_incidence_delta_blocks, (len(self.nodes), len(self.ders)), dtype=float
+        )
+
         # Make modifications for single-phase-equivalent modelling.
         if self.is_single_phase_equivalent:
             self.der_incidence_wye_matrix /= 3
             # Note that there won't be any delta loads in the single-phase-equivalent grid.
 
-        # Convert sparse matrices for nodal admittance, nodal transformation,
-        # branch admittance, branch incidence and der incidence matrices.
-        # - Converting from DOK to CSR format for more efficient calculations
-        #   according to <https://docs.scipy.org/doc/scipy/reference/sparse.html>.
-        self.node_admittance_matrix = self.node_admittance_matrix.tocsr()
-        self.node_transformation_matrix = self.node_transformation_matrix.tocsr()
-        self.branch_admittance_1_matrix = self.branch_admittance_1_matrix.tocsr()
-        self.branch_admittance_2_matrix = self.branch_admittance_2_matrix.tocsr()
-        self.branch_incidence_1_matrix = self.branch_incidence_1_matrix.tocsr()
-        self.branch_incidence_2_matrix = self.branch_incidence_2_matrix.tocsr()
-        self.der_incidence_wye_matrix = self.der_incidence_wye_matrix.tocsr()
-        self.der_incidence_delta_matrix = self.der_incidence_delta_matrix.tocsr()
-
         # Define shorthands for no-source variables.
         # TODO: Add in class documentation.
         # TODO: Replace local variables in power flow / linear models.
@@ -639,20 +658,43 @@ class ElectricGridModel(mesmo.utils.ObjectBase):
             mesmo.utils.get_index(self.nodes, node_type="source")
         ]
 
-        # Calculate inverse of no-source node admittance matrix.
+        # Calculate factorization of no-source node admittance matrix.
         # - Raise error if not invertible.
         # - Only checking invertibility of no-source node admittance matrix, because full node admittance matrix may
         #   be non-invertible, e.g. zero entries when connecting a multi-phase line at three-phase source node.
+        # - Using sparse LU factorization instead of the inverse, because the inverse is dense.
+        self.node_admittance_matrix_no_source_factorization = None
         try:
-            self.node_admittance_matrix_no_source_inverse = scipy.sparse.linalg.inv(
-                self.node_admittance_matrix_no_source.tocsc()
-            )
-            assert not np.isnan(self.node_admittance_matrix_no_source_inverse.data).any()
+            assert np.isfinite(self.get_node_admittance_matrix_no_source_factorization().U.data).all()
         except (RuntimeError, AssertionError) as exception:
             raise (
                 ValueError(f"Node admittance matrix could not be inverted. Please check electric grid definition.")
             ) from exception
 
+    def __getstate__(self):
+        # Exclude factorization from pickling / copying, because `SuperLU` objects cannot be pickled.
+        # - The factorization is recomputed when first needed.
+        state = self.__dict__.copy()
+        state["node_admittance_matrix_no_source_factorization"] = None
+        return state
+
+    def get_node_admittance_matrix_no_source_factorization(self) -> scipy.sparse.linalg.SuperLU:
+        """Get sparse LU factorization of the no-source nodal admittance matrix.
+
+        - The factorization is computed upon first call and reused for subsequent calls, such that solving for
+          the no-source nodal admittance matrix, e.g. in each power flow iteration, only requires triangular solves.
+        - Linear equations are solved via ``factorization.solve(right_hand_side)``.
+        - If `node_admittance_matrix_no_source` is redefined, `node_admittance_matrix_no_source_factorization` must
+          be reset to None.
+        """
+
+        if self.node_admittance_matrix_no_source_factorization is None:
+            self.node_admittance_matrix_no_source_factorization = scipy.sparse.linalg.splu(
+                self.node_admittance_matrix_no_source.tocsc()
+            )
+
+        return self.node_admittance_matrix_no_source_factorization
+
     @staticmethod
     def process_line_types_overhead(
         electric_grid_data: mesmo.data_interface.ElectricGridData,
@@ -1288,8 +1330,7 @@ class PowerFlowSolutionFixedPoint(PowerFlowSolutionBase):
             np.sum(
                 np.abs(
                     (electric_grid_model.node_voltage_vector_reference_no_source**-1)
-                    * scipy.sparse.linalg.spsolve(
-                        electric_grid_model.node_admittance_matrix_no_source,
+                    * electric_grid_model.get_node_admittance_matrix_no_source_factorization().solve(
                         (
                             (electric_grid_model.node_voltage_vector_reference_no_source**-1)
                             * node_power_vector_wye_initial_no_source
@@ -1302,8 +1343,7 @@ class PowerFlowSolutionFixedPoint(PowerFlowSolutionBase):
             np.sum(
                 np.abs(
                     (electric_grid_model.node_voltage_vector_reference_no_source**-1)
-                    * scipy.sparse.linalg.spsolve(
-                        electric_grid_model.node_admittance_matrix_no_source,
+                    * electric_grid_model.get_node_admittance_matrix_no_source_factorization().solve(
                         (
                             (
                                 electric_grid_model.node_transformation_matrix_no_source
@@ -1326,8 +1366,7 @@ class PowerFlowSolutionFixedPoint(PowerFlowSolutionBase):
             np.sum(
                 np.abs(
                     (electric_grid_model.node_voltage_vector_reference_no_source**-1)
-                    * scipy.sparse.linalg.spsolve(
-                        electric_grid_model.node_admittance_matrix_no_source,
+                    * electric_grid_model.get_node_admittance_matrix_no_source_factorization().solve(
                         (
                             (electric_grid_model.node_voltage_vector_reference_no_source**-1)
                             * (node_power_vector_wye_candidate_no_source - node_power_vector_wye_initial_no_source)
@@ -1340,8 +1379,7 @@ class PowerFlowSolutionFixedPoint(PowerFlowSolutionBase):
             np.sum(
                 np.abs(
                     (electric_grid_model.node_voltage_vector_reference_no_source**-1)
-                    * scipy.sparse.linalg.spsolve(
-                        electric_grid_model.node_admittance_matrix_no_source,
+                    * electric_grid_model.get_node_admittance_matrix_no_source_factorization().solve(
                         (
                             (
                                 electric_grid_model.node_transformation_matrix_no_source
@@ -1391,27 +1429,51 @@ class PowerFlowSolutionFixedPoint(PowerFlowSolutionBase):
         return is_valid
 
     @staticmethod
-    def get_voltage(
+    def get_voltage(electric_grid_model: ElectricGridModel, der_power_vector: np.ndarray, **kwargs) -> np.ndarray:
+        """Get nodal voltage vector by solving with the fixed point algorithm.
+
+        - Keyword arguments are passed to `get_voltage_with_iteration_count()`.
+        """
+
+        return PowerFlowSolutionFixedPoint.get_voltage_with_iteration_count(
+            electric_grid_model, der_power_vector, **kwargs
+        )[0]
+
+    @staticmethod
+    def get_voltage_with_iteration_count(
         electric_grid_model: ElectricGridModel,
         der_power_vector: np.ndarray,
+        node_voltage_vector_initial: np.ndarray = None,
         outer_iteration_limit=100,
         outer_solution_algorithm="check_solution",  # Choices: `check_conditions`, `check_solution`.
         power_candidate_iteration_limit=100,
         power_candidate_reduction_factor=0.5,
         voltage_iteration_limit=100,
         voltage_tolerance=1e-2,
-    ) -> np.ndarray:
-        """Get nodal voltage vector by solving with the fixed point algorithm.
+    ) -> typing.Tuple[np.ndarray, int]:
+        """Get nodal voltage vector by solving with the fixed point algorithm, along with the total number of
+        fixed point voltage iterations.
 
         - Initial DER power vector / node voltage vector must be a valid
           solution to te fixed-point equation, e.g., a previous solution from a past
           operation point.
         - Fixed point equation according to: <https://arxiv.org/pdf/1702.03310.pdf>
+        - If `node_voltage_vector_initial` is given, e.g. the solution of the previous timestep, the fixed point
+          iteration is warm-started from this voltage vector. If the warm-started iteration converges, the power
+          candidate reduction of the outer solution algorithm is skipped. Otherwise, the outer solution algorithm
+          proceeds from the no-load voltage. Only valid for outer solution algorithm `check_solution`.
         """
 
         # TODO: Add proper documentation.
         # TODO: Validate fixed-point solution conditions.
 
+        # Check validity of warm start.
+        if (node_voltage_vector_initial is not None) and (outer_solution_algorithm != "check_solution"):
+            raise ValueError(
+                f"Initial nodal voltage vector is only valid for outer solution algorithm `check_solution`, "
+                f"but outer solution algorithm `{outer_solution_algorithm}` was given."
+            )
+
         # Debug message.
         logger.debug("Starting fixed point solution algorithm...")
 
@@ -1424,10 +1486,16 @@ class PowerFlowSolutionFixedPoint(PowerFlowSolutionBase):
         ).ravel()
 
         # Obtain initial nodal power and voltage vectors, assuming no power conditions.
-        # TODO: Enable passing previous solution for fixed-point initialization.
+        # - If initial nodal voltage vector is given, the initial nodal voltage vector is used for warm start.
         node_power_vector_wye_initial_no_source = np.zeros(node_power_vector_wye_no_source.shape, dtype=complex)
         node_power_vector_delta_initial_no_source = np.zeros(node_power_vector_delta_no_source.shape, dtype=complex)
-        node_voltage_vector_initial_no_source = electric_grid_model.node_voltage_vector_reference_no_source.copy()
+        if node_voltage_vector_initial is not None:
+            node_voltage_vector_initial_no_source = np.array(
+                node_voltage_vector_initial[mesmo.utils.get_index(electric_grid_model.nodes, node_type="no_source")],
+                dtype=complex,
+            )
+        else:
+            node_voltage_vector_initial_no_source = electric_grid_model.node_voltage_vector_reference_no_source.copy()
 
         # Define nodal power vector candidate to the desired nodal power vector.
         node_power_vector_wye_candidate_no_source = node_power_vector_wye_no_source.copy()
@@ -1436,6 +1504,7 @@ class PowerFlowSolutionFixedPoint(PowerFlowSolutionBase):
         # Instantiate outer iteration variables.
         is_final = False
         outer_iteration = 0
+        voltage_iteration_count = 0
 
         # Outer iteration between power vector candidate selection and fixed point voltage solution algorithm
         # until a final solution is found.
@@ -1503,8 +1572,7 @@ class PowerFlowSolutionFixedPoint(PowerFlowSolutionBase):
                     np.transpose([electric_grid_model.node_voltage_vector_reference_no_source])
                     + np.transpose(
                         [
-                            scipy.sparse.linalg.spsolve(
-                                electric_grid_model.node_admittance_matrix_no_source,
+                            electric_grid_model.get_node_admittance_matrix_no_source_factorization().solve(
                                 (
                                     (
                                         (np.conj(np.transpose([node_voltage_vector_initial_no_source])) ** -1)
@@ -1539,6 +1607,7 @@ class PowerFlowSolutionFixedPoint(PowerFlowSolutionBase):
 
                 # Increment voltage iteration counter.
                 voltage_iteration += 1
+            voltage_iteration_count += voltage_iteration
 
             # Outer solution algorithm based on voltage solution check.
             # - Checks if voltage solution exceeded iteration limit and adjusts power vector candidate if needed.
@@ -1584,7 +1653,10 @@ class PowerFlowSolutionFixedPoint(PowerFlowSolutionBase):
             )
 
         # Debug message.
-        logger.debug("Completed fixed point solution algorithm. " f"Outer wrapper iterations: {outer_iteration}")
+        logger.debug(
+            "Completed fixed point solution algorithm. "
+            f"Outer wrapper iterations: {outer_iteration} / Voltage iterations: {voltage_iteration_count}"
+        )
 
         # Get full voltage vector.
         node_voltage_vector = np.zeros(len(electric_grid_model.nodes), dtype=complex)
@@ -1595,7 +1667,183 @@ class PowerFlowSolutionFixedPoint(PowerFlowSolutionBase):
             mesmo.utils.get_index(electric_grid_model.nodes, node_type="no_source")
         ] += node_voltage_vector_initial_no_source  # Takes value of `node_voltage_vector_estimate_no_source`.
 
-        return node_voltage_vector
+        return (node_voltage_vector, voltage_iteration_count)
+
+    @staticmethod
+    def get_voltage_sequential(
+        electric_grid_model: ElectricGridModel,
+        der_power_vectors: np.ndarray,
+        use_warm_start: bool = True,
+        **kwargs,
+    ) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """Get nodal voltage vectors for a sequence of DER power vectors, e.g. for consecutive timesteps, by solving
+        with the fixed point algorithm for each DER power vector in sequence.
+
+        - DER power vectors are given as matrix of dimension (number of DER power vectors, number of DERs) and nodal
+          voltage vectors are returned as matrix of dimension (number of DER power vectors, number of nodes), along
+          with the number of fixed point voltage iterations for each DER power vector.
+        - If `use_warm_start`, the solution for each DER power vector is warm-started from the solution of the
+          previous DER power vector, see `get_voltage_with_iteration_count()`.
+        - Keyword arguments are passed to `get_voltage_with_iteration_count()`.
+        """
+
+        # Instantiate results.
+        node_voltage_vectors = np.zeros((len(der_power_vectors), len(electric_grid_model.nodes)), dtype=complex)
+        voltage_iteration_counts = np.zeros(len(der_power_vectors), dtype=int)
+
+        # Obtain solutions in sequence.
+        node_voltage_vector_initial = None
+        for index, der_power_vector in enumerate(der_power_vectors):
+            (
+                node_voltage_vectors[index, :],
+                voltage_iteration_counts[index],
+            ) = PowerFlowSolutionFixedPoint.get_voltage_with_iteration_count(
+                electric_grid_model, der_power_vector, node_voltage_vector_initial=node_voltage_vector_initial, **kwargs
+            )
+            if use_warm_start:
+                node_voltage_vector_initial = node_voltage_vectors[index, :]
+
+        return (node_voltage_vectors, voltage_iteration_counts)
+
+    @staticmethod
+    def get_voltage_batch(
+        electric_grid_model: ElectricGridModel,
+        der_power_vectors: np.ndarray,
+        outer_iteration_limit=100,
+        power_candidate_reduction_factor=0.5,
+        voltage_iteration_limit=100,
+        voltage_tolerance=1e-2,
+    ) -> np.ndarray:
+        """Get nodal voltage vectors for multiple DER power vectors, e.g. for all timesteps, by solving with the
+        fixed point algorithm in batch.
+
+        - DER power vectors are given as matrix of dimension (number of DER power vectors, number of DERs) and nodal
+          voltage vectors are returned as matrix of dimension (number of DER power vectors, number of nodes).
+        - The fixed point equation is evaluated for all DER power vectors at once, i.e., as single solve with
+          multiple right-hand sides for each iteration, where the DER power vectors for which the voltage
+          solution has converged are masked out.
+        - Per DER power vector, the solution is equivalent to `get_voltage()` with outer solution algorithm
+          `check_solution`.
+        """
+
+        # Debug message.
+        logger.debug("Starting batch fixed point solution algorithm...")
+
+        # Obtain nodal power matrices, where each column corresponds to a DER power vector.
+        node_power_matrix_wye_no_source = np.array(
+            electric_grid_model.der_incidence_wye_matrix_no_source @ np.transpose(der_power_vectors), dtype=complex
+        )
+        node_power_matrix_delta_no_source = np.array(
+            electric_grid_model.der_incidence_delta_matrix_no_source @ np.transpose(der_power_vectors), dtype=complex
+        )
+        solution_count = node_power_matrix_wye_no_source.shape[1]
+
+        # Obtain initial nodal voltage matrix, assuming no power conditions.
+        node_voltage_vector_reference_no_source = np.transpose(
+            [electric_grid_model.node_voltage_vector_reference_no_source]
+        )
+        node_voltage_matrix_initial_no_source = np.repeat(
+            node_voltage_vector_reference_no_source, solution_count, axis=1
+        )
+
+        # Define nodal power matrix candidate to the desired nodal power matrix.
+        node_power_matrix_wye_candidate_no_source = node_power_matrix_wye_no_source.copy()
+        node_power_matrix_delta_candidate_no_source = node_power_matrix_delta_no_source.copy()
+
+        # Instantiate outer iteration variables.
+        is_final = np.zeros(solution_count, dtype=bool)
+        outer_iteration = 0
+
+        # Outer iteration between power vector candidate selection and fixed point voltage solution algorithm
+        # until a final solution is found for all DER power vectors.
+        while (~is_final).any() & (outer_iteration < outer_iteration_limit):
+            # Instantiate fixed point iteration variables.
+            is_active = ~is_final
+            voltage_iteration = np.zeros(solution_count, dtype=int)
+            voltage_change = np.full(solution_count, np.inf)
+            is_iterating = is_active.copy()
+            while is_iterating.any():
+                # Calculate fixed point equation for non-converged columns.
+                columns = np.flatnonzero(is_iterating)
+                node_voltage_matrix_estimate_no_source = (
+                    node_voltage_vector_reference_no_source
+                    + electric_grid_model.get_node_admittance_matrix_no_source_factorization().solve(
+                        (
+                            (np.conj(node_voltage_matrix_initial_no_source[:, columns]) ** -1)
+                            * np.conj(node_power_matrix_wye_candidate_no_source[:, columns])
+                        )
+                        + (
+                            np.transpose(electric_grid_model.node_transformation_matrix_no_source)
+                            @ (
+                                (
+                                    (
+                                        electric_grid_model.node_transformation_matrix_no_source
+                                        @ np.conj(node_voltage_matrix_initial_no_source[:, columns])
+                                    )
+                                    ** -1
+                                )
+                                * np.conj(node_power_matrix_delta_candidate_no_source[:, columns])
+                            )
+                        )
+                    )
+                )
+
+                # Calculate voltage change from previous iteration.
+                voltage_change[columns] = np.max(
+                    np.abs(node_voltage_matrix_estimate_no_source - node_voltage_matrix_initial_no_source[:, columns]),
+                    axis=0,
+                )
+
+                # Set voltage solution as initial voltage for next iteration.
+                node_voltage_matrix_initial_no_source[:, columns] = node_voltage_matrix_estimate_no_source
+
+                # Increment voltage iteration counter and update non-converged columns.
+                voltage_iteration[columns] += 1
+                is_iterating = (
+                    is_active & (voltage_iteration < voltage_iteration_limit) & (voltage_change > voltage_tolerance)
+                )
+
+            # Outer solution algorithm based on voltage solution check.
+            # - Checks if voltage solution exceeded iteration limit and adjusts power vector candidate if needed.
+            is_reduced = (node_power_matrix_wye_candidate_no_source != node_power_matrix_wye_no_source).any(axis=0) | (
+                node_power_matrix_delta_candidate_no_source != node_power_matrix_delta_no_source
+            ).any(axis=0)
+            is_exceeded = is_active & (voltage_iteration >= voltage_iteration_limit)
+            is_raised = is_active & ~is_exceeded & is_reduced
+
+            # If voltage solution exceeds iteration limit, reduce power and re-try voltage solution.
+            node_power_matrix_wye_candidate_no_source[:, is_exceeded] *= power_candidate_reduction_factor
+            node_power_matrix_delta_candidate_no_source[:, is_exceeded] *= power_candidate_reduction_factor
+            node_voltage_matrix_initial_no_source[:, is_exceeded] = node_voltage_vector_reference_no_source
+
+            # Otherwise, if power has previously been reduced, raise back power and re-try voltage solution.
+            node_power_matrix_wye_candidate_no_source[:, is_raised] *= power_candidate_reduction_factor**-1
+            node_power_matrix_delta_candidate_no_source[:, is_raised] *= power_candidate_reduction_factor**-1
+            is_final |= is_active & ~is_exceeded & ~is_reduced
+
+            # Increment outer iteration counter.
+            outer_iteration += 1
+
+        # Reaching the outer iteration limit is considered undesired and triggers a warning.
+        if outer_iteration >= outer_iteration_limit:
+            logger.warning(
+                "Outer wrapper algorithm for batch fixed-point solution reached "
+                f"maximum limit of {outer_iteration_limit} iterations."
+            )
+
+        # Debug message.
+        logger.debug("Completed batch fixed point solution algorithm. " f"Outer wrapper iterations: {outer_iteration}")
+
+        # Get full voltage matrix.
+        node_voltage_vectors = np.zeros((solution_count, len(electric_grid_model.nodes)), dtype=complex)
+        node_voltage_vectors[
+            :, mesmo.utils.get_index(electric_grid_model.nodes, node_type="source")
+        ] += electric_grid_model.node_voltage_vector_reference_source
+        node_voltage_vectors[
+            :, mesmo.utils.get_index(electric_grid_model.nodes, node_type="no_source")
+        ] += np.transpose(node_voltage_matrix_initial_no_source)
+
+        return node_voltage_vectors
 
     @staticmethod
     def get_branch_power(electric_grid_model: ElectricGridModel, node_voltage_vector: np.ndarray):
@@ -1652,6 +1900,54 @@ class PowerFlowSolutionFixedPoint(PowerFlowSolutionBase):
 
         return loss
 
+    @staticmethod
+    def get_branch_power_batch(electric_grid_model: ElectricGridModel, node_voltage_vectors: np.ndarray):
+        """Get branch power vectors for multiple nodal voltage vectors, e.g. for all timesteps, where nodal voltage
+        vectors are given as matrix of dimension (number of nodal voltage vectors, number of nodes).
+
+        - Returns two branch power matrices of dimension (number of nodal voltage vectors, number of branches), where
+          `branch_power_vectors_1` represents the "from"-direction and `branch_power_vectors_2` represents
+          the "to"-direction.
+        """
+
+        # Calculate branch power matrices.
+        branch_power_vectors_1 = np.transpose(
+            (electric_grid_model.branch_incidence_1_matrix @ np.transpose(node_voltage_vectors))
+            * np.conj(electric_grid_model.branch_admittance_1_matrix @ np.transpose(node_voltage_vectors))
+        )
+        branch_power_vectors_2 = np.transpose(
+            (electric_grid_model.branch_incidence_2_matrix @ np.transpose(node_voltage_vectors))
+            * np.conj(electric_grid_model.branch_admittance_2_matrix @ np.transpose(node_voltage_vectors))
+        )
+
+        # Make modifications for single-phase-equivalent modelling.
+        if electric_grid_model.is_single_phase_equivalent:
+            branch_power_vectors_1 *= 3
+            branch_power_vectors_2 *= 3
+
+        return (branch_power_vectors_1, branch_power_vectors_2)
+
+    @staticmethod
+    def get_loss_batch(electric_grid_model: ElectricGridModel, node_voltage_vectors: np.ndarray) -> np.ndarray:
+        """Get total electric losses for multiple nodal voltage vectors, e.g. for all timesteps, where nodal voltage
+        vectors are given as matrix of dimension (number of nodal voltage vectors, number of nodes).
+        """
+
+        # Calculate total losses.
+        losses = np.sum(
+            node_voltage_vectors
+            * np.transpose(
+                np.conj(electric_grid_model.node_admittance_matrix) @ np.transpose(np.conj(node_voltage_vectors))
+            ),
+            axis=1,
+        )
+
+        # Make modifications for single-phase-equivalent modelling.
+        if electric_grid_model.is_single_phase_equivalent:
+            losses *= 3
+
+        return losses
+
 
 class PowerFlowSolutionZBus(PowerFlowSolutionFixedPoint):
     """Implicit Z-bus power flow solution object."""
@@ -1684,15 +1980,10 @@ class PowerFlowSolutionZBus(PowerFlowSolutionFixedPoint):
         ).ravel()
 
         # Obtain utility variables.
-        node_admittance_matrix_no_source_inverse = scipy.sparse.linalg.inv(
-            electric_grid_model.node_admittance_matrix_no_source.tocsc()
+        node_admittance_matrix_no_source_factorization = (
+            electric_grid_model.get_node_admittance_matrix_no_source_factorization()
         )
-        node_admittance_matrix_source_to_no_source = electric_grid_model.node_admittance_matrix[
-            np.ix_(
-                mesmo.utils.get_index(electric_grid_model.nodes, node_type="no_source"),
-                mesmo.utils.get_index(electric_grid_model.nodes, node_type="source"),
-            )
-        ]
+        node_admittance_matrix_source_to_no_source = electric_grid_model.node_admittance_matrix_source_to_no_source
         node_voltage_vector_initial_no_source = electric_grid_model.node_voltage_vector_reference_no_source.copy()
 
         # Instantiate implicit Z-bus power flow iteration variables.
@@ -1700,36 +1991,18 @@ class PowerFlowSolutionZBus(PowerFlowSolutionFixedPoint):
         voltage_change = np.inf
         while (voltage_iteration < voltage_iteration_limit) & (voltage_change > voltage_tolerance):
             # Calculate current injections.
-            node_current_injection_delta_in_wye_no_source = (
-                electric_grid_model.node_transformation_matrix_no_source.transpose()
-                @ np.conj(
-                    np.linalg.inv(
-                        np.diag(
-                            (
-                                electric_grid_model.node_transformation_matrix_no_source
-                                @ node_voltage_vector_initial_no_source
-                            ).ravel()
-                        )
-                    )
-                    @ node_power_vector_wye_no_source
-                )
-            )
-            node_current_injection_wye_no_source = np.conj(node_power_vector_delta_no_source) / np.conj(
-                node_voltage_vector_initial_no_source
-            )
-            node_current_injection_no_source = (
-                node_current_injection_delta_in_wye_no_source + node_current_injection_wye_no_source
+            node_current_injection_no_source = PowerFlowSolutionZBus.get_current_injection(
+                electric_grid_model,
+                node_power_vector_wye_no_source,
+                node_power_vector_delta_no_source,
+                node_voltage_vector_initial_no_source,
             )
 
             # Calculate voltage.
-            node_voltage_vector_estimate_no_source = node_admittance_matrix_no_source_inverse @ (
+            node_voltage_vector_estimate_no_source = node_admittance_matrix_no_source_factorization.solve(
                 -node_admittance_matrix_source_to_no_source @ electric_grid_model.node_voltage_vector_reference_source
                 + node_current_injection_no_source
             )
-            # node_voltage_vector_estimate_no_source = (
-            #     electric_grid_model.node_voltage_vector_reference_no_source
-            #     + node_admittance_matrix_no_source_inverse @ node_current_injection_no_source
-            # )
 
             # Calculate voltage change from previous iteration.
             voltage_change = np.max(
@@ -1759,75 +2032,343 @@ class PowerFlowSolutionZBus(PowerFlowSolutionFixedPoint):
 
         return node_voltage_vector
 
+    @staticmethod
+    def get_current_injection(
+        electric_grid_model: ElectricGridModel,
+        node_power_wye_no_source: np.ndarray,
+        node_power_delta_no_source: np.ndarray,
+        node_voltage_no_source: np.ndarray,
+    ) -> np.ndarray:
+        """Get no-source nodal current injection for given no-source nodal wye / delta power and voltage, which are
+        given either as vectors or as matrices with one column per DER power vector.
 
-class PowerFlowSolutionOpenDSS(PowerFlowSolutionBase):
-    """OpenDSS power flow solution object."""
+        - Uses elementwise reciprocal scaling instead of inverting diagonal matrices.
+        """
 
-    @multimethod.multimethod
-    def __init__(self, scenario_name: str, **kwargs):
-        # Obtain `electric_grid_model`.
-        electric_grid_model = ElectricGridModelOpenDSS(scenario_name)
+        # Calculate current injections.
+        node_current_injection_wye_no_source = np.conj(node_power_wye_no_source / node_voltage_no_source)
+        node_current_injection_delta_in_wye_no_source = (
+            electric_grid_model.node_transformation_matrix_no_source.transpose()
+            @ np.conj(
+                node_power_delta_no_source
+                / (electric_grid_model.node_transformation_matrix_no_source @ node_voltage_no_source)
+            )
+        )
 
-        self.__init__(electric_grid_model, **kwargs)
+        return node_current_injection_wye_no_source + node_current_injection_delta_in_wye_no_source
 
-    @multimethod.multimethod
-    def __init__(self, electric_grid_model: ElectricGridModelOpenDSS, **kwargs):
-        # Obtain `der_power_vector`, assuming nominal power conditions.
-        der_power_vector = electric_grid_model.der_power_vector_reference
+    @staticmethod
+    def get_voltage_batch(
+        electric_grid_model: ElectricGridModel,
+        der_power_vectors: np.ndarray,
+        voltage_iteration_limit=100,
+        voltage_tolerance=1e-2,
+        **kwargs,
+    ) -> np.ndarray:
+        """Get nodal voltage vectors for multiple DER power vectors, e.g. for all timesteps, by solving with the
+        implicit Z-bus method in batch.
+
+        - DER power vectors are given as matrix of dimension (number of DER power vectors, number of DERs) and nodal
+          voltage vectors are returned as matrix of dimension (number of DER power vectors, number of nodes).
+        - The Z-bus iteration is evaluated for all DER power vectors at once, i.e., as single solve with
+          multiple right-hand sides for each iteration, where the DER power vectors for which the voltage
+          solution has converged are masked out.
+        """
 
-        self.__init__(electric_grid_model, der_power_vector, **kwargs)
+        # Obtain nodal power matrices, where each column corresponds to a DER power vector.
+        node_power_matrix_wye_no_source = np.array(
+            electric_grid_model.der_incidence_wye_matrix_no_source @ np.transpose(der_power_vectors), dtype=complex
+        )
+        node_power_matrix_delta_no_source = np.array(
+            electric_grid_model.der_incidence_delta_matrix_no_source @ np.transpose(der_power_vectors), dtype=complex
+        )
+        solution_count = node_power_matrix_wye_no_source.shape[1]
 
-    @multimethod.multimethod
-    def __init__(self, electric_grid_model: ElectricGridModelOpenDSS, der_power_vector: np.ndarray, **kwargs):
-        # Store DER power vector.
-        self.der_power_vector = der_power_vector.ravel()
+        # Obtain utility variables.
+        node_admittance_matrix_no_source_factorization = (
+            electric_grid_model.get_node_admittance_matrix_no_source_factorization()
+        )
+        node_current_source_to_no_source = np.transpose(
+            [
+                -electric_grid_model.node_admittance_matrix_source_to_no_source
+                @ electric_grid_model.node_voltage_vector_reference_source
+            ]
+        )
+        node_voltage_matrix_initial_no_source = np.repeat(
+            np.transpose([electric_grid_model.node_voltage_vector_reference_no_source]), solution_count, axis=1
+        )
 
-        # Check if correct OpenDSS circuit is initialized, otherwise reinitialize.
-        if opendssdirect.Circuit.Name() != electric_grid_model.circuit_name:
-            electric_grid_model.__init__(electric_grid_model.electric_grid_data)
+        # Instantiate implicit Z-bus power flow iteration variables.
+        voltage_iteration = np.zeros(solution_count, dtype=int)
+        voltage_change = np.full(solution_count, np.inf)
+        is_iterating = np.ones(solution_count, dtype=bool)
+        while is_iterating.any():
+            # Calculate current injections and voltage for non-converged columns.
+            columns = np.flatnonzero(is_iterating)
+            node_voltage_matrix_estimate_no_source = node_admittance_matrix_no_source_factorization.solve(
+                node_current_source_to_no_source
+                + PowerFlowSolutionZBus.get_current_injection(
+                    electric_grid_model,
+                    node_power_matrix_wye_no_source[:, columns],
+                    node_power_matrix_delta_no_source[:, columns],
+                    node_voltage_matrix_initial_no_source[:, columns],
+                )
+            )
 
-        # Set DER power vector in OpenDSS model.
-        for der_index, der_name in enumerate(electric_grid_model.der_names):
-            # TODO: For OpenDSS, all DERs are assumed to be loads.
-            opendss_command_string = (
-                f"load.{der_name}.kw = {- np.real(self.der_power_vector[der_index]) / 1000.0}"
-                + f"\nload.{der_name}.kvar = {- np.imag(self.der_power_vector[der_index]) / 1000.0}"
+            # Calculate voltage change from previous iteration.
+            voltage_change[columns] = np.max(
+                np.abs(node_voltage_matrix_estimate_no_source - node_voltage_matrix_initial_no_source[:, columns]),
+                axis=0,
             )
-            logger.debug(f"opendss_command_string = \n{opendss_command_string}")
-            opendssdirect.run_command(opendss_command_string)
 
-        # Solve OpenDSS model.
-        opendssdirect.run_command("solve")
+            # Set voltage estimate as new initial voltage for next iteration.
+            node_voltage_matrix_initial_no_source[:, columns] = node_voltage_matrix_estimate_no_source
 
-        # Obtain voltage solution.
-        self.node_voltage_vector = self.get_voltage(electric_grid_model)
+            # Increment voltage iteration counter and update non-converged columns.
+            voltage_iteration[columns] += 1
+            is_iterating = (voltage_iteration < voltage_iteration_limit) & (voltage_change > voltage_tolerance)
 
-        # Obtain branch flow solution.
-        (self.branch_power_vector_1, self.branch_power_vector_2) = self.get_branch_power()
+        # Reaching the iteration limit is considered undesired and triggers a warning.
+        if (voltage_iteration >= voltage_iteration_limit).any():
+            logger.warning(
+                "Z-bus solution algorithm reached "
+                f"maximum limit of {voltage_iteration_limit} iterations "
+                f"for {np.sum(voltage_iteration >= voltage_iteration_limit)} of {solution_count} DER power vectors."
+            )
 
-        # Obtain loss solution.
-        self.loss = self.get_loss()
+        # Get full voltage matrix.
+        node_voltage_vectors = np.zeros((solution_count, len(electric_grid_model.nodes)), dtype=complex)
+        node_voltage_vectors[
+            :, mesmo.utils.get_index(electric_grid_model.nodes, node_type="source")
+        ] += electric_grid_model.node_voltage_vector_reference_source
+        node_voltage_vectors[
+            :, mesmo.utils.get_index(electric_grid_model.nodes, node_type="no_source")
+        ] += np.transpose(node_voltage_matrix_initial_no_source)
 
-    @staticmethod
-    def get_voltage(electric_grid_model: ElectricGridModelOpenDSS):
-        """Get nodal voltage vector by solving OpenDSS model.
+        return node_voltage_vectors
 
-        - OpenDSS model must be readily set up, with the desired power being set for all DERs.
-        """
 
-        # Create index for OpenDSS nodes.
-        opendss_nodes = pd.Series(opendssdirect.Circuit.AllNodeNames()).str.split(".", expand=True)
-        opendss_nodes.columns = ["node_name", "phase"]
-        opendss_nodes.loc[:, "phase"] = opendss_nodes.loc[:, "phase"].astype(int)
-        opendss_nodes = pd.MultiIndex.from_frame(opendss_nodes)
+class PowerFlowSolutionNewtonRaphson(PowerFlowSolutionFixedPoint):
+    """Newton-Raphson power flow solution object.
 
-        # Extract nodal voltage vector and reindex to match MESMO nodes order.
-        node_voltage_vector_solution = (
-            pd.Series(
-                (
-                    np.array(opendssdirect.Circuit.AllBusVolts()[0::2])
-                    + 1j * np.array(opendssdirect.Circuit.AllBusVolts()[1::2])
-                ),
+    - The Newton-Raphson method is formulated in terms of the no-source nodal current injection mismatch
+      in rectangular coordinates, which is solved for the real and imaginary parts of the no-source nodal voltage
+      vector with a sparse Jacobian matrix based on the nodal admittance matrix.
+    - Wye-connected and delta-connected DER power injections are considered via `get_current_injection()`
+      of the Z-bus power flow.
+    """
+
+    # Overwrite `check_solution_conditions`, which is invalid for the Newton-Raphson power flow.
+    @staticmethod
+    def check_solution_conditions(*args, **kwargs):
+        raise NotImplementedError("This method is invalid for the Newton-Raphson power flow.")
+
+    @staticmethod
+    def get_voltage(
+        electric_grid_model: ElectricGridModel,
+        der_power_vector: np.ndarray,
+        node_voltage_vector_initial: np.ndarray = None,
+        voltage_iteration_limit=100,
+        voltage_tolerance=1e-2,
+        **kwargs,
+    ) -> np.ndarray:
+        """Get nodal voltage vector by solving with the Newton-Raphson method.
+
+        - The iteration is initialized with the no-load voltage, unless `node_voltage_vector_initial` is given,
+          e.g. the solution of the previous timestep.
+        """
+
+        # Obtain nodal power vectors.
+        node_power_vector_wye_no_source = np.array(
+            electric_grid_model.der_incidence_wye_matrix_no_source @ der_power_vector, dtype=complex
+        ).ravel()
+        node_power_vector_delta_no_source = np.array(
+            electric_grid_model.der_incidence_delta_matrix_no_source @ der_power_vector, dtype=complex
+        ).ravel()
+
+        # Obtain utility variables.
+        node_admittance_matrix_no_source = sp.csr_matrix(electric_grid_model.node_admittance_matrix_no_source)
+        node_transformation_matrix_no_source = sp.csr_matrix(electric_grid_model.node_transformation_matrix_no_source)
+        node_current_source_to_no_source = (
+            electric_grid_model.node_admittance_matrix_source_to_no_source
+            @ electric_grid_model.node_voltage_vector_reference_source
+        )
+        if node_voltage_vector_initial is not None:
+            node_voltage_vector_initial_no_source = np.array(
+                node_voltage_vector_initial[mesmo.utils.get_index(electric_grid_model.nodes, node_type="no_source")],
+                dtype=complex,
+            )
+        else:
+            node_voltage_vector_initial_no_source = electric_grid_model.node_voltage_vector_reference_no_source.copy()
+
+        # Instantiate Newton-Raphson iteration variables.
+        voltage_iteration = 0
+        voltage_change = np.inf
+        while (voltage_iteration < voltage_iteration_limit) & (voltage_change > voltage_tolerance):
+            # Calculate current injection mismatch.
+            # - Mismatch is defined as the difference of the nodal currents based on the admittance matrix
+            #   and the nodal current injections based on the DER power injections.
+            node_current_mismatch_no_source = (
+                node_admittance_matrix_no_source @ node_voltage_vector_initial_no_source
+                + node_current_source_to_no_source
+                - PowerFlowSolutionZBus.get_current_injection(
+                    electric_grid_model,
+                    node_power_vector_wye_no_source,
+                    node_power_vector_delta_no_source,
+                    node_voltage_vector_initial_no_source,
+                )
+            )
+
+            # Calculate Jacobian matrix.
+            # - The mismatch depends on the voltage via the admittance matrix and on the conjugate voltage via
+            #   the current injections, i.e., d_mismatch = Y @ d_voltage + B @ conj(d_voltage).
+            node_voltage_vector_delta_no_source = node_transformation_matrix_no_source @ (
+                node_voltage_vector_initial_no_source
+            )
+            conjugate_sensitivity_matrix = sp.csr_matrix(
+                sp.diags(np.conj(node_power_vector_wye_no_source / (node_voltage_vector_initial_no_source**2)))
+                + node_transformation_matrix_no_source.transpose()
+                @ sp.diags(np.conj(node_power_vector_delta_no_source / (node_voltage_vector_delta_no_source**2)))
+                @ node_transformation_matrix_no_source
+            )
+            jacobian_matrix = sp.bmat(
+                [
+                    [
+                        np.real(node_admittance_matrix_no_source) + np.real(conjugate_sensitivity_matrix),
+                        -np.imag(node_admittance_matrix_no_source) + np.imag(conjugate_sensitivity_matrix),
+                    ],
+                    [
+                        np.imag(node_admittance_matrix_no_source) + np.imag(conjugate_sensitivity_matrix),
+                        np.real(node_admittance_matrix_no_source) - np.real(conjugate_sensitivity_matrix),
+                    ],
+                ],
+                format="csc",
+            )
+
+            # Calculate voltage change.
+            voltage_step = scipy.sparse.linalg.spsolve(
+                jacobian_matrix,
+                -np.concatenate([np.real(node_current_mismatch_no_source), np.imag(node_current_mismatch_no_source)]),
+            )
+            node_voltage_vector_change_no_source = (
+                voltage_step[: len(node_voltage_vector_initial_no_source)]
+                + 1.0j * voltage_step[len(node_voltage_vector_initial_no_source) :]
+            )
+            voltage_change = np.max(np.abs(node_voltage_vector_change_no_source))
+
+            # Set voltage estimate as new initial voltage for next iteration.
+            node_voltage_vector_initial_no_source = (
+                node_voltage_vector_initial_no_source + node_voltage_vector_change_no_source
+            )
+
+            # Increment voltage iteration counter.
+            voltage_iteration += 1
+
+        # Reaching the iteration limit is considered undesired and triggers a warning.
+        if voltage_iteration >= voltage_iteration_limit:
+            logger.warning(
+                "Newton-Raphson solution algorithm reached " f"maximum limit of {voltage_iteration_limit} iterations."
+            )
+
+        # Get full voltage vector.
+        node_voltage_vector = np.zeros(len(electric_grid_model.nodes), dtype=complex)
+        node_voltage_vector[
+            mesmo.utils.get_index(electric_grid_model.nodes, node_type="source")
+        ] += electric_grid_model.node_voltage_vector_reference_source
+        node_voltage_vector[
+            mesmo.utils.get_index(electric_grid_model.nodes, node_type="no_source")
+        ] += node_voltage_vector_initial_no_source  # Takes value of `node_voltage_vector_estimate_no_source`.
+
+        return node_voltage_vector
+
+    @staticmethod
+    def get_voltage_batch(
+        electric_grid_model: ElectricGridModel, der_power_vectors: np.ndarray, **kwargs
+    ) -> np.ndarray:
+        """Get nodal voltage vectors for multiple DER power vectors, e.g. for all timesteps, by solving with the
+        Newton-Raphson method for each DER power vector.
+
+        - DER power vectors are given as matrix of dimension (number of DER power vectors, number of DERs) and nodal
+          voltage vectors are returned as matrix of dimension (number of DER power vectors, number of nodes).
+        - Keyword arguments are passed to `get_voltage()`.
+        """
+
+        return np.array(
+            [
+                PowerFlowSolutionNewtonRaphson.get_voltage(electric_grid_model, der_power_vector, **kwargs)
+                for der_power_vector in der_power_vectors
+            ]
+        ).reshape((len(der_power_vectors), len(electric_grid_model.nodes)))
+
+
+class PowerFlowSolutionOpenDSS(PowerFlowSolutionBase):
+    """OpenDSS power flow solution object."""
+
+    @multimethod.multimethod
+    def __init__(self, scenario_name: str, **kwargs):
+        # Obtain `electric_grid_model`.
+        electric_grid_model = ElectricGridModelOpenDSS(scenario_name)
+
+        self.__init__(electric_grid_model, **kwargs)
+
+    @multimethod.multimethod
+    def __init__(self, electric_grid_model: ElectricGridModelOpenDSS, **kwargs):
+        # Obtain `der_power_vector`, assuming nominal power conditions.
+        der_power_vector = electric_grid_model.der_power_vector_reference
+
+        self.__init__(electric_grid_model, der_power_vector, **kwargs)
+
+    @multimethod.multimethod
+    def __init__(self, electric_grid_model: ElectricGridModelOpenDSS, der_power_vector: np.ndarray, **kwargs):
+        # Store DER power vector.
+        self.der_power_vector = der_power_vector.ravel()
+
+        # Check if correct OpenDSS circuit is initialized, otherwise reinitialize.
+        if opendssdirect.Circuit.Name() != electric_grid_model.circuit_name:
+            electric_grid_model.__init__(electric_grid_model.electric_grid_data)
+
+        # Set DER power vector in OpenDSS model.
+        for der_index, der_name in enumerate(electric_grid_model.der_names):
+            # TODO: For OpenDSS, all DERs are assumed to be loads.
+            opendss_command_string = (
+                f"load.{der_name}.kw = {- np.real(self.der_power_vector[der_index]) / 1000.0}"
+                + f"\nload.{der_name}.kvar = {- np.imag(self.der_power_vector[der_index]) / 1000.0}"
+            )
+            logger.debug(f"opendss_command_string = \n{opendss_command_string}")
+            opendssdirect.run_command(opendss_command_string)
+
+        # Solve OpenDSS model.
+        opendssdirect.run_command("solve")
+
+        # Obtain voltage solution.
+        self.node_voltage_vector = self.get_voltage(electric_grid_model)
+
+        # Obtain branch flow solution.
+        (self.branch_power_vector_1, self.branch_power_vector_2) = self.get_branch_power()
+
+        # Obtain loss solution.
+        self.loss = self.get_loss()
+
+    @staticmethod
+    def get_voltage(electric_grid_model: ElectricGridModelOpenDSS):
+        """Get nodal voltage vector by solving OpenDSS model.
+
+        - OpenDSS model must be readily set up, with the desired power being set for all DERs.
+        """
+
+        # Create index for OpenDSS nodes.
+        opendss_nodes = pd.Series(opendssdirect.Circuit.AllNodeNames()).str.split(".", expand=True)
+        opendss_nodes.columns = ["node_name", "phase"]
+        opendss_nodes.loc[:, "phase"] = opendss_nodes.loc[:, "phase"].astype(int)
+        opendss_nodes = pd.MultiIndex.from_frame(opendss_nodes)
+
+        # Extract nodal voltage vector and reindex to match MESMO nodes order.
+        node_voltage_vector_solution = (
+            pd.Series(
+                (
+                    np.array(opendssdirect.Circuit.AllBusVolts()[0::2])
+                    + 1j * np.array(opendssdirect.Circuit.AllBusVolts()[1::2])
+                ),
                 index=opendss_nodes,
             )
             .reindex(electric_grid_model.nodes.droplevel("node_type"))
@@ -1929,9 +2470,30 @@ class PowerFlowSolution(PowerFlowSolutionFixedPoint):
 
 
 class PowerFlowSolutionSet(mesmo.utils.ObjectBase):
+    """Power flow solution set object, consisting of the power flow solutions for all timesteps of the given
+    DER power vector timeseries.
+
+    - For the fixed point, Z-bus and Newton-Raphson power flow, i.e. if `power_flow_solution_method` is
+      `PowerFlowSolutionFixedPoint`, `PowerFlowSolution`, `PowerFlowSolutionZBus` or
+      `PowerFlowSolutionNewtonRaphson`, the power flow is solved for all timesteps in batch via
+      `get_voltage_batch()` of the respective power flow solution class, unless `use_batch_solution` is set to False.
+      Otherwise, the power flow is solved separately for each timestep via `power_flow_solution_method`.
+    - For the fixed point power flow, if `use_warm_start` is set to True, the power flow is instead solved for
+      consecutive timesteps in sequence via `PowerFlowSolutionFixedPoint.get_voltage_sequential()`, where each
+      timestep is warm-started from the solution of the previous timestep. The number of fixed point voltage
+      iterations per timestep is stored in `voltage_iteration_count`.
+    - Solutions are stored as timeseries in `node_voltage_vector`, `branch_power_vector_1`, `branch_power_vector_2`
+      and `loss`, as well as per timestep in `power_flow_solutions`.
+    """
+
     power_flow_solutions: typing.Dict[pd.Timestamp, PowerFlowSolutionBase]
     electric_grid_model: ElectricGridModel
     der_power_vector: pd.DataFrame
+    node_voltage_vector: pd.DataFrame
+    branch_power_vector_1: pd.DataFrame
+    branch_power_vector_2: pd.DataFrame
+    loss: pd.DataFrame
+    voltage_iteration_count: typing.Optional[pd.Series]
     timesteps: pd.Index
 
     @multimethod.multimethod
@@ -1953,45 +2515,92 @@ class PowerFlowSolutionSet(mesmo.utils.ObjectBase):
         electric_grid_model: ElectricGridModel,
         der_power_vector: pd.DataFrame,
         power_flow_solution_method=PowerFlowSolutionFixedPoint,
+        use_batch_solution: bool = True,
+        use_warm_start: bool = False,
     ):
         # Store attributes.
         self.electric_grid_model = electric_grid_model
         self.der_power_vector = der_power_vector
         self.timesteps = self.electric_grid_model.timesteps
+        self.voltage_iteration_count = None
 
         # Obtain power flow solutions.
-        power_flow_solutions = mesmo.utils.starmap(
-            power_flow_solution_method, zip(itertools.repeat(self.electric_grid_model), der_power_vector.values)
-        )
+        if (use_batch_solution or use_warm_start) and (
+            power_flow_solution_method
+            in [PowerFlowSolutionFixedPoint, PowerFlowSolution, PowerFlowSolutionZBus, PowerFlowSolutionNewtonRaphson]
+        ):
+            der_power_vectors = der_power_vector.values.astype(complex)
+            if use_warm_start and (power_flow_solution_method in [PowerFlowSolutionFixedPoint, PowerFlowSolution]):
+                # Solve for consecutive timesteps in sequence with warm start.
+                node_voltage_vectors, voltage_iteration_counts = PowerFlowSolutionFixedPoint.get_voltage_sequential(
+                    self.electric_grid_model, der_power_vectors
+                )
+                self.voltage_iteration_count = pd.Series(voltage_iteration_counts, index=self.timesteps)
+            else:
+                # Solve for all timesteps in batch.
+                node_voltage_vectors = power_flow_solution_method.get_voltage_batch(
+                    self.electric_grid_model, der_power_vectors
+                )
+            branch_power_vectors_1, branch_power_vectors_2 = PowerFlowSolutionFixedPoint.get_branch_power_batch(
+                self.electric_grid_model, node_voltage_vectors
+            )
+            losses = PowerFlowSolutionFixedPoint.get_loss_batch(self.electric_grid_model, node_voltage_vectors)
+
+            # Obtain power flow solution objects for each timestep.
+            power_flow_solutions = list()
+            for index in range(len(der_power_vectors)):
+                power_flow_solution = PowerFlowSolutionBase()
+                power_flow_solution.der_power_vector = der_power_vectors[index, :]
+                power_flow_solution.node_voltage_vector = node_voltage_vectors[index, :]
+                power_flow_solution.branch_power_vector_1 = branch_power_vectors_1[index, :]
+                power_flow_solution.branch_power_vector_2 = branch_power_vectors_2[index, :]
+                power_flow_solution.loss = losses[[index]]
+                power_flow_solutions.append(power_flow_solution)
+        else:
+            # Solve separately for each timestep.
+            power_flow_solutions = mesmo.utils.starmap(
+                power_flow_solution_method, zip(itertools.repeat(self.electric_grid_model), der_power_vector.values)
+            )
+            node_voltage_vectors = np.array(
+                [power_flow_solution.node_voltage_vector for power_flow_solution in power_flow_solutions]
+            )
+            branch_power_vectors_1 = np.array(
+                [power_flow_solution.branch_power_vector_1 for power_flow_solution in power_flow_solutions]
+            )
+            branch_power_vectors_2 = np.array(
+                [power_flow_solution.branch_power_vector_2 for power_flow_solution in power_flow_solutions]
+            )
+            losses = np.array([power_flow_solution.loss for power_flow_solution in power_flow_solutions]).ravel()
         self.power_flow_solutions = dict(zip(self.timesteps, power_flow_solutions))
 
-    def get_results(self) -> ElectricGridOperationResults:
-        # Instantiate results variables.
-        der_power_vector = pd.DataFrame(columns=self.electric_grid_model.ders, index=self.timesteps, dtype=complex)
-        node_voltage_vector = pd.DataFrame(columns=self.electric_grid_model.nodes, index=self.timesteps, dtype=complex)
-        branch_power_vector_1 = pd.DataFrame(
-            columns=self.electric_grid_model.branches, index=self.timesteps, dtype=complex
+        # Store solution timeseries.
+        self.node_voltage_vector = pd.DataFrame(
+            node_voltage_vectors, index=self.timesteps, columns=self.electric_grid_model.nodes
         )
-        branch_power_vector_2 = pd.DataFrame(
-            columns=self.electric_grid_model.branches, index=self.timesteps, dtype=complex
+        self.branch_power_vector_1 = pd.DataFrame(
+            branch_power_vectors_1, index=self.timesteps, columns=self.electric_grid_model.branches
         )
-        loss = pd.DataFrame(columns=["total"], index=self.timesteps, dtype=complex)
+        self.branch_power_vector_2 = pd.DataFrame(
+            branch_power_vectors_2, index=self.timesteps, columns=self.electric_grid_model.branches
+        )
+        self.loss = pd.DataFrame(losses, index=self.timesteps, columns=["total"])
 
+    def get_results(self) -> ElectricGridOperationResults:
         # Obtain results.
-        for timestep in self.timesteps:
-            power_flow_solution = self.power_flow_solutions[timestep]
-            der_power_vector.loc[timestep, :] = power_flow_solution.der_power_vector
-            node_voltage_vector.loc[timestep, :] = power_flow_solution.node_voltage_vector
-            branch_power_vector_1.loc[timestep, :] = power_flow_solution.branch_power_vector_1
-            branch_power_vector_2.loc[timestep, :] = power_flow_solution.branch_power_vector_2
-            loss.loc[timestep, :] = power_flow_solution.loss
-        der_active_power_vector = der_power_vector.apply(np.real)
-        der_reactive_power_vector = der_power_vector.apply(np.imag)
-        node_voltage_magnitude_vector = np.abs(node_voltage_vector)
-        branch_power_magnitude_vector_1 = np.abs(branch_power_vector_1)
-        branch_power_magnitude_vector_2 = np.abs(branch_power_vector_2)
-        loss_active = loss.apply(np.real)
-        loss_reactive = loss.apply(np.imag)
+        # - Results are obtained from the solution timeseries, i.e., with a single dataframe construction for each
+        #   result rather than by filling the dataframes for each timestep.
+        der_power_vector = self.der_power_vector.values.astype(complex)
+        der_active_power_vector = pd.DataFrame(
+            np.real(der_power_vector), index=self.timesteps, columns=self.electric_grid_model.ders
+        )
+        der_reactive_power_vector = pd.DataFrame(
+            np.imag(der_power_vector), index=self.timesteps, columns=self.electric_grid_model.ders
+        )
+        node_voltage_magnitude_vector = np.abs(self.node_voltage_vector)
+        branch_power_magnitude_vector_1 = np.abs(self.branch_power_vector_1)
+        branch_power_magnitude_vector_2 = np.abs(self.branch_power_vector_2)
+        loss_active = pd.DataFrame(np.real(self.loss.values), index=self.timesteps, columns=["total"])
+        loss_reactive = pd.DataFrame(np.imag(self.loss.values), index=self.timesteps, columns=["total"])
 
         # Obtain per-unit values.
         der_active_power_vector_per_unit = der_active_power_vector * mesmo.utils.get_inverse_with_zeros(
@@ -2208,373 +2817,224 @@ class LinearElectricGridModelGlobal(LinearElectricGridModelBase):
         scenario_name (str): MESMO scenario name.
 
     Attributes / variables are the same as in :class:`LinearElectricGridModelBase`.
+
+    Note:
+        Only the sensitivity matrices by DER power are stored upon instantiation. The sensitivity matrices by nodal
+        wye / delta power, e.g. `sensitivity_voltage_by_power_wye_active`, are calculated upon first access via
+        :meth:`get_sensitivity_matrices` and retained for subsequent accesses, because these are of dimension
+        (..., number of nodes) and are not needed in all use cases.
     """
 
+    sensitivity_matrices_by_node_power: typing.Dict[str, typing.Dict[typing.Tuple[str, str], sp.spmatrix]]
+
     @multimethod.multimethod
     def __init__(
         self,
         scenario_name: str,
     ):
         # Obtain electric grid model.
-        electric_grid_model = ElectricGridModel(scenario_name)
-
-        # Obtain der power vector.
-        der_power_vector = electric_grid_model.der_power_vector_reference
-
-        # Obtain power flow solution.
-        power_flow_solution = PowerFlowSolutionFixedPoint(electric_grid_model, der_power_vector)
-
-        self.__init__(electric_grid_model, power_flow_solution)
-
-    @multimethod.multimethod
-    def __init__(self, electric_grid_model: ElectricGridModel, power_flow_solution: PowerFlowSolutionBase):
-        # TODO: Validate linear model with delta DERs.
-
-        # Store power flow solution.
-        self.power_flow_solution = power_flow_solution
-
-        # Store electric grid model.
-        self.electric_grid_model = electric_grid_model
-
-        # Obtain shorthands for no-source matrices and vectors.
-        electric_grid_model.node_admittance_matrix_no_source = electric_grid_model.node_admittance_matrix[
-            np.ix_(
-                mesmo.utils.get_index(electric_grid_model.nodes, node_type="no_source"),
-                mesmo.utils.get_index(electric_grid_model.nodes, node_type="no_source"),
-            )
-        ]
-        electric_grid_model.node_transformation_matrix_no_source = electric_grid_model.node_transformation_matrix[
-            np.ix_(
-                mesmo.utils.get_index(electric_grid_model.nodes, node_type="no_source"),
-                mesmo.utils.get_index(electric_grid_model.nodes, node_type="no_source"),
-            )
-        ]
-        node_voltage_no_source = self.power_flow_solution.node_voltage_vector[
-            mesmo.utils.get_index(electric_grid_model.nodes, node_type="no_source")
-        ]
-
-        # Instantiate voltage sensitivity matrices.
-        self.sensitivity_voltage_by_power_wye_active = sp.dok_matrix(
-            (len(electric_grid_model.nodes), len(electric_grid_model.nodes)), dtype=complex
-        )
-        self.sensitivity_voltage_by_power_wye_reactive = sp.dok_matrix(
-            (len(electric_grid_model.nodes), len(electric_grid_model.nodes)), dtype=complex
-        )
-        self.sensitivity_voltage_by_power_delta_active = sp.dok_matrix(
-            (len(electric_grid_model.nodes), len(electric_grid_model.nodes)), dtype=complex
-        )
-        self.sensitivity_voltage_by_power_delta_reactive = sp.dok_matrix(
-            (len(electric_grid_model.nodes), len(electric_grid_model.nodes)), dtype=complex
-        )
-
-        # Calculate voltage sensitivity matrices.
-        # TODO: Document the change in sign in the reactive part.
-        self.sensitivity_voltage_by_power_wye_active[
-            np.ix_(
-                mesmo.utils.get_index(electric_grid_model.nodes, node_type="no_source"),
-                mesmo.utils.get_index(electric_grid_model.nodes, node_type="no_source"),
-            )
-        ] = scipy.sparse.linalg.spsolve(
-            electric_grid_model.node_admittance_matrix_no_source.tocsc(),
-            sp.diags(np.conj(node_voltage_no_source) ** -1, format="csc"),
-        )
-        self.sensitivity_voltage_by_power_wye_reactive[
-            np.ix_(
-                mesmo.utils.get_index(electric_grid_model.nodes, node_type="no_source"),
-                mesmo.utils.get_index(electric_grid_model.nodes, node_type="no_source"),
-            )
-        ] = scipy.sparse.linalg.spsolve(
-            1.0j * electric_grid_model.node_admittance_matrix_no_source.tocsc(),
-            sp.diags(np.conj(node_voltage_no_source) ** -1, format="csc"),
-        )
-        self.sensitivity_voltage_by_power_delta_active[
-            np.ix_(
-                mesmo.utils.get_index(electric_grid_model.nodes, node_type="no_source"),
-                mesmo.utils.get_index(electric_grid_model.nodes, node_type="no_source"),
-            )
-        ] = scipy.sparse.linalg.spsolve(
-            electric_grid_model.node_admittance_matrix_no_source.tocsc(),
-            np.transpose(electric_grid_model.node_transformation_matrix_no_source),
-        ) @ sp.diags(
-            ((electric_grid_model.node_transformation_matrix_no_source @ np.conj(node_voltage_no_source)) ** -1).ravel()
-        )
-        self.sensitivity_voltage_by_power_delta_reactive[
-            np.ix_(
-                mesmo.utils.get_index(electric_grid_model.nodes, node_type="no_source"),
-                mesmo.utils.get_index(electric_grid_model.nodes, node_type="no_source"),
-            )
-        ] = scipy.sparse.linalg.spsolve(
-            1.0j * electric_grid_model.node_admittance_matrix_no_source.tocsc(),
-            np.transpose(electric_grid_model.node_transformation_matrix_no_source),
-        ) @ sp.diags(
-            ((electric_grid_model.node_transformation_matrix_no_source * np.conj(node_voltage_no_source)) ** -1).ravel()
-        )
-
-        self.sensitivity_voltage_by_der_power_active = (
-            self.sensitivity_voltage_by_power_wye_active @ electric_grid_model.der_incidence_wye_matrix
-            + self.sensitivity_voltage_by_power_delta_active @ electric_grid_model.der_incidence_delta_matrix
-        )
-        self.sensitivity_voltage_by_der_power_reactive = (
-            self.sensitivity_voltage_by_power_wye_reactive @ electric_grid_model.der_incidence_wye_matrix
-            + self.sensitivity_voltage_by_power_delta_reactive @ electric_grid_model.der_incidence_delta_matrix
-        )
-
-        self.sensitivity_voltage_magnitude_by_power_wye_active = sp.diags(
-            abs(self.power_flow_solution.node_voltage_vector) ** -1
-        ) @ np.real(
-            sp.diags(np.conj(self.power_flow_solution.node_voltage_vector))
-            @ self.sensitivity_voltage_by_power_wye_active
-        )
-        self.sensitivity_voltage_magnitude_by_power_wye_reactive = sp.diags(
-            abs(self.power_flow_solution.node_voltage_vector) ** -1
-        ) @ np.real(
-            sp.diags(np.conj(self.power_flow_solution.node_voltage_vector))
-            @ self.sensitivity_voltage_by_power_wye_reactive
-        )
-        self.sensitivity_voltage_magnitude_by_power_delta_active = sp.diags(
-            abs(self.power_flow_solution.node_voltage_vector) ** -1
-        ) @ np.real(
-            sp.diags(np.conj(self.power_flow_solution.node_voltage_vector))
-            @ self.sensitivity_voltage_by_power_delta_active
-        )
-        self.sensitivity_voltage_magnitude_by_power_delta_reactive = sp.diags(
-            abs(self.power_flow_solution.node_voltage_vector) ** -1
-        ) @ np.real(
-            sp.diags(np.conj(self.power_flow_solution.node_voltage_vector))
-            @ self.sensitivity_voltage_by_power_delta_reactive
-        )
-
-        self.sensitivity_voltage_magnitude_by_der_power_active = (
-            self.sensitivity_voltage_magnitude_by_power_wye_active @ electric_grid_model.der_incidence_wye_matrix
-            + self.sensitivity_voltage_magnitude_by_power_delta_active @ electric_grid_model.der_incidence_delta_matrix
-        )
-        self.sensitivity_voltage_magnitude_by_der_power_reactive = (
-            self.sensitivity_voltage_magnitude_by_power_wye_reactive @ electric_grid_model.der_incidence_wye_matrix
-            + self.sensitivity_voltage_magnitude_by_power_delta_reactive
-            @ electric_grid_model.der_incidence_delta_matrix
-        )
-
-        # Calculate branch power sensitivity matrices.
-        # TODO: Document the empirical fixes.
-        sensitivity_branch_power_1_by_voltage_active = (
-            sp.diags(
-                np.conj(
-                    self.electric_grid_model.branch_incidence_1_matrix
-                    @ np.transpose([self.power_flow_solution.node_voltage_vector])
-                ).ravel()
-            )
-            @ self.electric_grid_model.branch_admittance_1_matrix
-        )
-        sensitivity_branch_power_1_by_voltage_reactive = (
-            sp.diags(
-                -1.0
-                * np.conj(
-                    self.electric_grid_model.branch_incidence_1_matrix
-                    @ np.transpose([self.power_flow_solution.node_voltage_vector])
-                ).ravel()
-            )
-            @ self.electric_grid_model.branch_admittance_1_matrix
-        )
-        sensitivity_branch_power_2_by_voltage_active = (
-            sp.diags(
-                np.conj(
-                    self.electric_grid_model.branch_incidence_2_matrix
-                    @ np.transpose([self.power_flow_solution.node_voltage_vector])
-                ).ravel()
-            )
-            @ self.electric_grid_model.branch_admittance_2_matrix
-        )
-        sensitivity_branch_power_2_by_voltage_reactive = (
-            sp.diags(
-                -1.0
-                * np.conj(
-                    self.electric_grid_model.branch_incidence_2_matrix
-                    @ np.transpose([self.power_flow_solution.node_voltage_vector])
-                ).ravel()
-            )
-            @ self.electric_grid_model.branch_admittance_2_matrix
-        )
-
-        self.sensitivity_branch_power_1_by_power_wye_active = np.conj(
-            sensitivity_branch_power_1_by_voltage_active @ self.sensitivity_voltage_by_power_wye_active
-        )
-        self.sensitivity_branch_power_1_by_power_wye_reactive = -1.0 * np.conj(
-            sensitivity_branch_power_1_by_voltage_reactive @ self.sensitivity_voltage_by_power_wye_reactive
-        )
-        self.sensitivity_branch_power_1_by_power_delta_active = np.conj(
-            sensitivity_branch_power_1_by_voltage_active @ self.sensitivity_voltage_by_power_delta_active
-        )
-        self.sensitivity_branch_power_1_by_power_delta_reactive = -1.0 * np.conj(
-            sensitivity_branch_power_1_by_voltage_reactive @ self.sensitivity_voltage_by_power_delta_reactive
-        )
-        self.sensitivity_branch_power_2_by_power_wye_active = np.conj(
-            sensitivity_branch_power_2_by_voltage_active @ self.sensitivity_voltage_by_power_wye_active
-        )
-        self.sensitivity_branch_power_2_by_power_wye_reactive = -1.0 * np.conj(
-            sensitivity_branch_power_2_by_voltage_reactive @ self.sensitivity_voltage_by_power_wye_reactive
-        )
-        self.sensitivity_branch_power_2_by_power_delta_active = np.conj(
-            sensitivity_branch_power_2_by_voltage_active @ self.sensitivity_voltage_by_power_delta_active
-        )
-        self.sensitivity_branch_power_2_by_power_delta_reactive = -1.0 * np.conj(
-            sensitivity_branch_power_2_by_voltage_reactive @ self.sensitivity_voltage_by_power_delta_reactive
-        )
-
-        self.sensitivity_branch_power_1_by_der_power_active = (
-            self.sensitivity_branch_power_1_by_power_wye_active @ electric_grid_model.der_incidence_wye_matrix
-            + self.sensitivity_branch_power_1_by_power_delta_active @ electric_grid_model.der_incidence_delta_matrix
-        )
-        self.sensitivity_branch_power_1_by_der_power_reactive = (
-            self.sensitivity_branch_power_1_by_power_wye_reactive @ electric_grid_model.der_incidence_wye_matrix
-            + self.sensitivity_branch_power_1_by_power_delta_reactive @ electric_grid_model.der_incidence_delta_matrix
-        )
-        self.sensitivity_branch_power_2_by_der_power_active = (
-            self.sensitivity_branch_power_2_by_power_wye_active @ electric_grid_model.der_incidence_wye_matrix
-            + self.sensitivity_branch_power_2_by_power_delta_active @ electric_grid_model.der_incidence_delta_matrix
-        )
-        self.sensitivity_branch_power_2_by_der_power_reactive = (
-            self.sensitivity_branch_power_2_by_power_wye_reactive @ electric_grid_model.der_incidence_wye_matrix
-            + self.sensitivity_branch_power_2_by_power_delta_reactive @ electric_grid_model.der_incidence_delta_matrix
-        )
-
-        self.sensitivity_branch_power_1_magnitude_by_power_wye_active = sp.diags(
-            abs(self.power_flow_solution.branch_power_vector_1) ** -1
-        ) @ np.real(
-            sp.diags(np.conj(self.power_flow_solution.branch_power_vector_1))
-            @ self.sensitivity_branch_power_1_by_power_wye_active
-        )
-        self.sensitivity_branch_power_1_magnitude_by_power_wye_reactive = sp.diags(
-            abs(self.power_flow_solution.branch_power_vector_1) ** -1
-        ) @ np.real(
-            sp.diags(np.conj(self.power_flow_solution.branch_power_vector_1))
-            @ self.sensitivity_branch_power_1_by_power_wye_reactive
-        )
-        self.sensitivity_branch_power_1_magnitude_by_power_delta_active = sp.diags(
-            abs(self.power_flow_solution.branch_power_vector_1) ** -1
-        ) @ np.real(
-            sp.diags(np.conj(self.power_flow_solution.branch_power_vector_1))
-            @ self.sensitivity_branch_power_1_by_power_delta_active
-        )
-        self.sensitivity_branch_power_1_magnitude_by_power_delta_reactive = sp.diags(
-            abs(self.power_flow_solution.branch_power_vector_1) ** -1
-        ) @ np.real(
-            sp.diags(np.conj(self.power_flow_solution.branch_power_vector_1))
-            @ self.sensitivity_branch_power_1_by_power_delta_reactive
-        )
-        self.sensitivity_branch_power_2_magnitude_by_power_wye_active = sp.diags(
-            abs(self.power_flow_solution.branch_power_vector_2) ** -1
-        ) @ np.real(
-            sp.diags(np.conj(self.power_flow_solution.branch_power_vector_2))
-            @ self.sensitivity_branch_power_2_by_power_wye_active
-        )
-        self.sensitivity_branch_power_2_magnitude_by_power_wye_reactive = sp.diags(
-            abs(self.power_flow_solution.branch_power_vector_2) ** -1
-        ) @ np.real(
-            sp.diags(np.conj(self.power_flow_solution.branch_power_vector_2))
-            @ self.sensitivity_branch_power_2_by_power_wye_reactive
-        )
-        self.sensitivity_branch_power_2_magnitude_by_power_delta_active = sp.diags(
-            abs(self.power_flow_solution.branch_power_vector_2) ** -1
-        ) @ np.real(
-            sp.diags(np.conj(self.power_flow_solution.branch_power_vector_2))
-            @ self.sensitivity_branch_power_2_by_power_delta_active
-        )
-        self.sensitivity_branch_power_2_magnitude_by_power_delta_reactive = sp.diags(
-            abs(self.power_flow_solution.branch_power_vector_2) ** -1
-        ) @ np.real(
-            sp.diags(np.conj(self.power_flow_solution.branch_power_vector_2))
-            @ self.sensitivity_branch_power_2_by_power_delta_reactive
-        )
+        electric_grid_model = ElectricGridModel(scenario_name)
 
-        self.sensitivity_branch_power_1_magnitude_by_der_power_active = (
-            self.sensitivity_branch_power_1_magnitude_by_power_wye_active @ electric_grid_model.der_incidence_wye_matrix
-            + self.sensitivity_branch_power_1_magnitude_by_power_delta_active
-            @ electric_grid_model.der_incidence_delta_matrix
+        # Obtain der power vector.
+        der_power_vector = electric_grid_model.der_power_vector_reference
+
+        # Obtain power flow solution.
+        power_flow_solution = PowerFlowSolutionFixedPoint(electric_grid_model, der_power_vector)
+
+        self.__init__(electric_grid_model, power_flow_solution)
+
+    @multimethod.multimethod
+    def __init__(self, electric_grid_model: ElectricGridModel, power_flow_solution: PowerFlowSolutionBase):
+        # TODO: Validate linear model with delta DERs.
+
+        # Store power flow solution.
+        self.power_flow_solution = power_flow_solution
+
+        # Store electric grid model.
+        self.electric_grid_model = electric_grid_model
+
+        # Instantiate sensitivity matrices by nodal wye / delta power, which are obtained upon first access.
+        self.sensitivity_matrices_by_node_power = dict()
+
+        # Obtain sensitivity matrices by DER power.
+        # - Only the sensitivity matrices by DER power are stored, such that the memory scales with the number of
+        #   nodes times the number of DERs. Sensitivity matrices by nodal wye / delta power are obtained on demand.
+        sensitivity_matrices = self.get_sensitivity_matrices(
+            electric_grid_model.der_incidence_wye_matrix, electric_grid_model.der_incidence_delta_matrix
+        )
+        self.sensitivity_voltage_by_der_power_active = sensitivity_matrices["voltage", "active"]
+        self.sensitivity_voltage_by_der_power_reactive = sensitivity_matrices["voltage", "reactive"]
+        self.sensitivity_voltage_magnitude_by_der_power_active = sensitivity_matrices["voltage_magnitude", "active"]
+        self.sensitivity_voltage_magnitude_by_der_power_reactive = sensitivity_matrices["voltage_magnitude", "reactive"]
+        self.sensitivity_branch_power_1_by_der_power_active = sensitivity_matrices["branch_power_1", "active"]
+        self.sensitivity_branch_power_1_by_der_power_reactive = sensitivity_matrices["branch_power_1", "reactive"]
+        self.sensitivity_branch_power_2_by_der_power_active = sensitivity_matrices["branch_power_2", "active"]
+        self.sensitivity_branch_power_2_by_der_power_reactive = sensitivity_matrices["branch_power_2", "reactive"]
+        self.sensitivity_branch_power_1_magnitude_by_der_power_active = sensitivity_matrices[
+            "branch_power_1_magnitude", "active"
+        ]
+        self.sensitivity_branch_power_1_magnitude_by_der_power_reactive = sensitivity_matrices[
+            "branch_power_1_magnitude", "reactive"
+        ]
+        self.sensitivity_branch_power_2_magnitude_by_der_power_active = sensitivity_matrices[
+            "branch_power_2_magnitude", "active"
+        ]
+        self.sensitivity_branch_power_2_magnitude_by_der_power_reactive = sensitivity_matrices[
+            "branch_power_2_magnitude", "reactive"
+        ]
+        self.sensitivity_loss_active_by_der_power_active = sensitivity_matrices["loss_active", "active"]
+        self.sensitivity_loss_active_by_der_power_reactive = sensitivity_matrices["loss_active", "reactive"]
+        self.sensitivity_loss_reactive_by_der_power_active = sensitivity_matrices["loss_reactive", "active"]
+        self.sensitivity_loss_reactive_by_der_power_reactive = sensitivity_matrices["loss_reactive", "reactive"]
+
+    def __getstate__(self):
+        # Exclude sensitivity matrices by nodal wye / delta power from pickling / copying, to limit the size.
+        # - The sensitivity matrices are recomputed when first needed.
+        state = self.__dict__.copy()
+        state["sensitivity_matrices_by_node_power"] = dict()
+        return state
+
+    def __getattr__(self, attribute_name):
+        # Obtain sensitivity matrices by nodal wye / delta power on demand.
+        # - Note that `__getattr__` is only invoked if the attribute is not found otherwise.
+        # - Sensitivity matrices by nodal power are of dimension (..., number of nodes), hence are only calculated
+        #   upon first access for each connection type and then retained, e.g. for repeated access when obtaining
+        #   DLMPs for each timestep.
+        match = re.fullmatch(r"sensitivity_(\w+)_by_power_(wye|delta)_(active|reactive)", attribute_name)
+        if match is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{attribute_name}'")
+        sensitivity_type, connection, power_type = match.groups()
+        if connection not in self.sensitivity_matrices_by_node_power:
+            node_incidence_matrix = sp.identity(len(self.electric_grid_model.nodes), format="csr")
+            node_incidence_matrix_zero = sp.csr_matrix(node_incidence_matrix.shape)
+            self.sensitivity_matrices_by_node_power[connection] = self.get_sensitivity_matrices(
+                node_incidence_matrix if connection == "wye" else node_incidence_matrix_zero,
+                node_incidence_matrix if connection == "delta" else node_incidence_matrix_zero,
+            )
+        sensitivity_matrices = self.sensitivity_matrices_by_node_power[connection]
+        if (sensitivity_type, power_type) not in sensitivity_matrices:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{attribute_name}'")
+
+        return sensitivity_matrices[sensitivity_type, power_type]
+
+    def get_sensitivity_matrices(
+        self, power_incidence_wye_matrix: sp.spmatrix, power_incidence_delta_matrix: sp.spmatrix
+    ) -> typing.Dict[typing.Tuple[str, str], sp.spmatrix]:
+        """Get sensitivity matrices for voltage / voltage magnitude / branch power / branch power magnitude /
+        active loss / reactive loss by active / reactive power of the given power injections.
+
+        - Power injections are defined by the wye / delta incidence matrices of dimension (number of nodes,
+          number of power injections), e.g., the DER incidence matrices for obtaining sensitivity matrices by DER power
+          or the identity matrix for obtaining sensitivity matrices by nodal wye / delta power.
+        - Sensitivity matrices are returned as dictionary with keys (sensitivity type, power type), e.g.,
+          ``("voltage_magnitude", "active")``.
+        - The voltage sensitivity matrices are obtained with a single solve of the factorized no-source nodal
+          admittance matrix for all power injections.
+        """
+
+        # Obtain shorthands for no-source matrices and vectors.
+        # - The factorization of the no-source nodal admittance matrix is shared with the power flow solution.
+        node_admittance_matrix_no_source_factorization = (
+            self.electric_grid_model.get_node_admittance_matrix_no_source_factorization()
         )
-        self.sensitivity_branch_power_1_magnitude_by_der_power_reactive = (
-            self.sensitivity_branch_power_1_magnitude_by_power_wye_reactive
-            @ electric_grid_model.der_incidence_wye_matrix
-            + self.sensitivity_branch_power_1_magnitude_by_power_delta_reactive
-            @ electric_grid_model.der_incidence_delta_matrix
+        node_index_no_source = mesmo.utils.get_index(self.electric_grid_model.nodes, node_type="no_source")
+        node_voltage_no_source = self.power_flow_solution.node_voltage_vector[node_index_no_source]
+        power_incidence_wye_matrix_no_source = sp.csr_matrix(power_incidence_wye_matrix)[node_index_no_source, :]
+        power_incidence_delta_matrix_no_source = sp.csr_matrix(power_incidence_delta_matrix)[node_index_no_source, :]
+
+        # Instantiate sensitivity matrices.
+        sensitivity_matrices = dict()
+
+        # Calculate voltage sensitivity matrices.
+        # - Note that solving for `1.0j * node_admittance_matrix_no_source` is equivalent to solving for
+        #   `node_admittance_matrix_no_source` with `-1.0j` times the right-hand side, such that the reactive part
+        #   is obtained from the active part without additional solve.
+        # TODO: Document the change in sign in the reactive part.
+        node_current_by_power_active_no_source = (
+            sp.diags(np.conj(node_voltage_no_source) ** -1) @ power_incidence_wye_matrix_no_source
+            + np.transpose(self.electric_grid_model.node_transformation_matrix_no_source)
+            @ sp.diags(
+                (
+                    (self.electric_grid_model.node_transformation_matrix_no_source @ np.conj(node_voltage_no_source))
+                    ** -1
+                )
+            )
+            @ power_incidence_delta_matrix_no_source
         )
-        self.sensitivity_branch_power_2_magnitude_by_der_power_active = (
-            self.sensitivity_branch_power_2_magnitude_by_power_wye_active @ electric_grid_model.der_incidence_wye_matrix
-            + self.sensitivity_branch_power_2_magnitude_by_power_delta_active
-            @ electric_grid_model.der_incidence_delta_matrix
+        sensitivity_voltage_by_power_active = np.zeros(
+            (len(self.electric_grid_model.nodes), power_incidence_wye_matrix.shape[1]), dtype=complex
         )
-        self.sensitivity_branch_power_2_magnitude_by_der_power_reactive = (
-            self.sensitivity_branch_power_2_magnitude_by_power_wye_reactive
-            @ electric_grid_model.der_incidence_wye_matrix
-            + self.sensitivity_branch_power_2_magnitude_by_power_delta_reactive
-            @ electric_grid_model.der_incidence_delta_matrix
+        sensitivity_voltage_by_power_active[node_index_no_source, :] = (
+            node_admittance_matrix_no_source_factorization.solve(node_current_by_power_active_no_source.toarray())
         )
+        sensitivity_matrices["voltage", "active"] = sp.csr_matrix(sensitivity_voltage_by_power_active)
+        sensitivity_matrices["voltage", "reactive"] = sp.csr_matrix(-1.0j * sensitivity_voltage_by_power_active)
 
-        # Calculate loss sensitivity matrices.
-        self.sensitivity_loss_active_by_power_wye_active = sum(
-            np.real(
-                self.sensitivity_branch_power_1_by_power_wye_active
-                + self.sensitivity_branch_power_2_by_power_wye_active
+        for power_type in ["active", "reactive"]:
+            sensitivity_matrices["voltage_magnitude", power_type] = sp.diags(
+                abs(self.power_flow_solution.node_voltage_vector) ** -1
+            ) @ np.real(
+                sp.diags(np.conj(self.power_flow_solution.node_voltage_vector))
+                @ sensitivity_matrices["voltage", power_type]
             )
-        )
-        self.sensitivity_loss_active_by_power_wye_reactive = sum(
-            np.real(
-                self.sensitivity_branch_power_1_by_power_wye_reactive
-                + self.sensitivity_branch_power_2_by_power_wye_reactive
+
+        # Calculate branch power sensitivity matrices.
+        # TODO: Document the empirical fixes.
+        sensitivity_branch_power_1_by_voltage = (
+            sp.diags(
+                np.conj(
+                    self.electric_grid_model.branch_incidence_1_matrix
+                    @ np.transpose([self.power_flow_solution.node_voltage_vector])
+                ).ravel()
             )
+            @ self.electric_grid_model.branch_admittance_1_matrix
         )
-        self.sensitivity_loss_active_by_power_delta_active = sum(
-            np.real(
-                self.sensitivity_branch_power_1_by_power_delta_active
-                + self.sensitivity_branch_power_2_by_power_delta_active
+        sensitivity_branch_power_2_by_voltage = (
+            sp.diags(
+                np.conj(
+                    self.electric_grid_model.branch_incidence_2_matrix
+                    @ np.transpose([self.power_flow_solution.node_voltage_vector])
+                ).ravel()
             )
+            @ self.electric_grid_model.branch_admittance_2_matrix
         )
-        self.sensitivity_loss_active_by_power_delta_reactive = sum(
-            np.real(
-                self.sensitivity_branch_power_1_by_power_delta_reactive
-                + self.sensitivity_branch_power_2_by_power_delta_reactive
+
+        for power_type in ["active", "reactive"]:
+            sensitivity_matrices["branch_power_1", power_type] = np.conj(
+                sensitivity_branch_power_1_by_voltage @ sensitivity_matrices["voltage", power_type]
             )
-        )
-        self.sensitivity_loss_reactive_by_power_wye_active = sum(
-            np.imag(
-                self.sensitivity_branch_power_1_by_power_wye_active
-                + self.sensitivity_branch_power_2_by_power_wye_active
+            sensitivity_matrices["branch_power_2", power_type] = np.conj(
+                sensitivity_branch_power_2_by_voltage @ sensitivity_matrices["voltage", power_type]
             )
-        )
-        self.sensitivity_loss_reactive_by_power_wye_reactive = sum(
-            np.imag(
-                self.sensitivity_branch_power_1_by_power_wye_reactive
-                + self.sensitivity_branch_power_2_by_power_wye_reactive
+
+            sensitivity_matrices["branch_power_1_magnitude", power_type] = sp.diags(
+                abs(self.power_flow_solution.branch_power_vector_1) ** -1
+            ) @ np.real(
+                sp.diags(np.conj(self.power_flow_solution.branch_power_vector_1))
+                @ sensitivity_matrices["branch_power_1", power_type]
             )
-        )
-        self.sensitivity_loss_reactive_by_power_delta_active = sum(
-            np.imag(
-                self.sensitivity_branch_power_1_by_power_delta_active
-                + self.sensitivity_branch_power_2_by_power_delta_active
+            sensitivity_matrices["branch_power_2_magnitude", power_type] = sp.diags(
+                abs(self.power_flow_solution.branch_power_vector_2) ** -1
+            ) @ np.real(
+                sp.diags(np.conj(self.power_flow_solution.branch_power_vector_2))
+                @ sensitivity_matrices["branch_power_2", power_type]
             )
-        )
-        self.sensitivity_loss_reactive_by_power_delta_reactive = sum(
-            np.imag(
-                self.sensitivity_branch_power_1_by_power_delta_reactive
-                + self.sensitivity_branch_power_2_by_power_delta_reactive
+
+            # Calculate loss sensitivity matrices.
+            sensitivity_matrices["loss_active", power_type] = sp.csr_matrix(
+                np.real(
+                    sensitivity_matrices["branch_power_1", power_type]
+                    + sensitivity_matrices["branch_power_2", power_type]
+                ).sum(axis=0)
+            )
+            sensitivity_matrices["loss_reactive", power_type] = sp.csr_matrix(
+                np.imag(
+                    sensitivity_matrices["branch_power_1", power_type]
+                    + sensitivity_matrices["branch_power_2", power_type]
+                ).sum(axis=0)
             )
-        )
 
-        self.sensitivity_loss_active_by_der_power_active = (
-            self.sensitivity_loss_active_by_power_wye_active @ electric_grid_model.der_incidence_wye_matrix
-            + self.sensitivity_loss_active_by_power_delta_active @ electric_grid_model.der_incidence_delta_matrix
-        )
-        self.sensitivity_loss_active_by_der_power_reactive = (
-            self.sensitivity_loss_active_by_power_wye_reactive @ electric_grid_model.der_incidence_wye_matrix
-            + self.sensitivity_loss_active_by_power_delta_reactive @ electric_grid_model.der_incidence_delta_matrix
-        )
-        self.sensitivity_loss_reactive_by_der_power_active = (
-            self.sensitivity_loss_reactive_by_power_wye_active @ electric_grid_model.der_incidence_wye_matrix
-            + self.sensitivity_loss_reactive_by_power_delta_active @ electric_grid_model.der_incidence_delta_matrix
-        )
-        self.sensitivity_loss_reactive_by_der_power_reactive = (
-            self.sensitivity_loss_reactive_by_power_wye_reactive @ electric_grid_model.der_incidence_wye_matrix
-            + self.sensitivity_loss_reactive_by_power_delta_reactive @ electric_grid_model.der_incidence_delta_matrix
-        )
+        return sensitivity_matrices
 
 
 class LinearElectricGridModelLocal(LinearElectricGridModelBase):
@@ -2622,18 +3082,7 @@ class LinearElectricGridModelLocal(LinearElectricGridModelBase):
         self.electric_grid_model = electric_grid_model
 
         # Obtain shorthands for no-source matrices and vectors.
-        electric_grid_model.node_admittance_matrix_no_source = electric_grid_model.node_admittance_matrix[
-            np.ix_(
-                mesmo.utils.get_index(electric_grid_model.nodes, node_type="no_source"),
-                mesmo.utils.get_index(electric_grid_model.nodes, node_type="no_source"),
-            )
-        ]
-        electric_grid_model.node_transformation_matrix_no_source = electric_grid_model.node_transformation_matrix[
-            np.ix_(
-                mesmo.utils.get_index(electric_grid_model.nodes, node_type="no_source"),
-                mesmo.utils.get_index(electric_grid_model.nodes, node_type="no_source"),
-            )
-        ]
+        # - No-source nodal admittance / transformation matrices are obtained from the electric grid model.
         node_voltage_no_source = self.power_flow_solution.node_voltage_vector[
             mesmo.utils.get_index(electric_grid_model.nodes, node_type="no_source")
         ]
@@ -3029,9 +3478,12 @@ class LinearElectricGridModelSet(mesmo.utils.ObjectBase):
         self.check_linear_electric_grid_model_method(linear_electric_grid_model_method)
 
         # Obtain linear electric grid models.
+        # - Electric grid model is passed as shared argument, such that it is not serialized for each timestep
+        #   in parallel execution.
         linear_electric_grid_models = mesmo.utils.starmap(
             linear_electric_grid_model_method,
-            zip(itertools.repeat(electric_grid_model), power_flow_solution_set.power_flow_solutions.values()),
+            zip(power_flow_solution_set.power_flow_solutions.values()),
+            shared_arguments=(electric_grid_model,),
         )
         linear_electric_grid_models = dict(zip(electric_grid_model.timesteps, linear_electric_grid_models))
 
@@ -3056,6 +3508,69 @@ class LinearElectricGridModelSet(mesmo.utils.ObjectBase):
         if not issubclass(linear_electric_grid_model_method, LinearElectricGridModelBase):
             raise ValueError(f"Invalid linear electric grid model method: {linear_electric_grid_model_method}")
 
+    def update_linear_electric_grid_models(
+        self,
+        power_flow_solution_set: PowerFlowSolutionSet,
+        linear_electric_grid_model_method: typing.Type[LinearElectricGridModelBase] = LinearElectricGridModelLocal,
+        voltage_change_tolerance: float = 1e-6,
+    ) -> pd.Index:
+        """Update linear electric grid models incrementally for given power flow solution set and return the
+        timesteps for which linear electric grid models were recomputed.
+
+        - Linear electric grid models are only recomputed for timesteps at which the maximum per-unit change of the
+          node voltage vector, compared to the reference power flow solution of the current linear electric grid
+          model, exceeds `voltage_change_tolerance`, or at which the current linear electric grid model is not of
+          type `linear_electric_grid_model_method`. For all other timesteps, the current linear electric grid
+          models are retained.
+        - This is intended for iterative methods, e.g. trust-region iterations, where the operation point changes
+          only for a subset of timesteps between iterations.
+        """
+
+        self.check_linear_electric_grid_model_method(linear_electric_grid_model_method)
+
+        # Obtain maximum per-unit voltage change for each timestep.
+        node_voltage_vector_reference = np.array(
+            [
+                self.linear_electric_grid_models[timestep].power_flow_solution.node_voltage_vector
+                for timestep in self.timesteps
+            ]
+        )
+        node_voltage_change = np.max(
+            np.abs(
+                power_flow_solution_set.node_voltage_vector.loc[self.timesteps, :].values
+                - node_voltage_vector_reference
+            )
+            / np.abs(self.electric_grid_model.node_voltage_vector_reference),
+            axis=1,
+        )
+
+        # Obtain timesteps for which linear electric grid models are recomputed.
+        timesteps_update = self.timesteps[
+            (node_voltage_change > voltage_change_tolerance)
+            | np.array(
+                [
+                    type(self.linear_electric_grid_models[timestep]) is not linear_electric_grid_model_method
+                    for timestep in self.timesteps
+                ]
+            )
+        ]
+        logger.debug(
+            f"Updating linear electric grid models for {len(timesteps_update)} of {len(self.timesteps)} timesteps."
+        )
+
+        # Recompute linear electric grid models.
+        linear_electric_grid_models = mesmo.utils.starmap(
+            linear_electric_grid_model_method,
+            zip(power_flow_solution_set.power_flow_solutions[timestep] for timestep in timesteps_update),
+            shared_arguments=(self.electric_grid_model,),
+        )
+        self.linear_electric_grid_models = {
+            **self.linear_electric_grid_models,
+            **dict(zip(timesteps_update, linear_electric_grid_models)),
+        }
+
+        return timesteps_update
+
     def define_optimization_problem(
         self,
         optimization_problem: mesmo.solutions.OptimizationProblem,
@@ -3126,27 +3641,49 @@ class LinearElectricGridModelSet(mesmo.utils.ObjectBase):
         # Obtain timestep interval in hours, for conversion of power to energy.
         timestep_interval_hours = (self.timesteps[1] - self.timesteps[0]) / pd.Timedelta("1h")
 
+        # Obtain linear electric grid models for the parameter definitions.
+        # - If the same linear electric grid model applies to all timesteps, e.g., for the global approximation,
+        #   parameters are obtained only once and repeated for all timesteps. Variable terms are defined as
+        #   block-diagonal matrix objects, which retain only a single block rather than copies for all timesteps.
+        linear_electric_grid_models = list(self.linear_electric_grid_models.values())
+        if all(
+            linear_electric_grid_model is linear_electric_grid_models[0]
+            for linear_electric_grid_model in linear_electric_grid_models
+        ):
+            linear_electric_grid_models = linear_electric_grid_models[:1]
+        block_count = len(self.timesteps) // len(linear_electric_grid_models)
+
         # Define voltage variable terms.
         optimization_problem.define_parameter(
             "voltage_active_term",
-            sp.block_diag(
-                [
-                    sp.diags(np.abs(linear_electric_grid_model.electric_grid_model.node_voltage_vector_reference) ** -1)
-                    @ linear_electric_grid_model.sensitivity_voltage_magnitude_by_der_power_active
-                    @ sp.diags(np.real(linear_electric_grid_model.electric_grid_model.der_power_vector_reference))
-                    for linear_electric_grid_model in self.linear_electric_grid_models.values()
-                ]
+            mesmo.solutions.OptimizationBlockDiagonalMatrix(
+                sp.block_diag(
+                    [
+                        sp.diags(
+                            np.abs(linear_electric_grid_model.electric_grid_model.node_voltage_vector_reference) ** -1
+                        )
+                        @ linear_electric_grid_model.sensitivity_voltage_magnitude_by_der_power_active
+                        @ sp.diags(np.real(linear_electric_grid_model.electric_grid_model.der_power_vector_reference))
+                        for linear_electric_grid_model in linear_electric_grid_models
+                    ]
+                ),
+                block_count,
             ),
         )
         optimization_problem.define_parameter(
             "voltage_reactive_term",
-            sp.block_diag(
-                [
-                    sp.diags(np.abs(linear_electric_grid_model.electric_grid_model.node_voltage_vector_reference) ** -1)
-                    @ linear_electric_grid_model.sensitivity_voltage_magnitude_by_der_power_reactive
-                    @ sp.diags(np.imag(linear_electric_grid_model.electric_grid_model.der_power_vector_reference))
-                    for linear_electric_grid_model in self.linear_electric_grid_models.values()
-                ]
+            mesmo.solutions.OptimizationBlockDiagonalMatrix(
+                sp.block_diag(
+                    [
+                        sp.diags(
+                            np.abs(linear_electric_grid_model.electric_grid_model.node_voltage_vector_reference) ** -1
+                        )
+                        @ linear_electric_grid_model.sensitivity_voltage_magnitude_by_der_power_reactive
+                        @ sp.diags(np.imag(linear_electric_grid_model.electric_grid_model.der_power_vector_reference))
+                        for linear_electric_grid_model in linear_electric_grid_models
+                    ]
+                ),
+                block_count,
             ),
         )
 
@@ -3163,36 +3700,43 @@ class LinearElectricGridModelSet(mesmo.utils.ObjectBase):
                         - linear_electric_grid_model.sensitivity_voltage_magnitude_by_der_power_reactive
                         @ np.transpose([np.imag(linear_electric_grid_model.power_flow_solution.der_power_vector)])
                     )
-                    for linear_electric_grid_model in self.linear_electric_grid_models.values()
+                    for linear_electric_grid_model in linear_electric_grid_models
                 ]
+                * block_count
             ),
         )
 
         # Define branch flow (direction 1) variable terms.
         optimization_problem.define_parameter(
             "branch_power_1_active_term",
-            sp.block_diag(
-                [
-                    sp.diags(
-                        linear_electric_grid_model.electric_grid_model.branch_power_vector_magnitude_reference**-1
-                    )
-                    @ linear_electric_grid_model.sensitivity_branch_power_1_magnitude_by_der_power_active
-                    @ sp.diags(np.real(linear_electric_grid_model.electric_grid_model.der_power_vector_reference))
-                    for linear_electric_grid_model in self.linear_electric_grid_models.values()
-                ]
+            mesmo.solutions.OptimizationBlockDiagonalMatrix(
+                sp.block_diag(
+                    [
+                        sp.diags(
+                            linear_electric_grid_model.electric_grid_model.branch_power_vector_magnitude_reference**-1
+                        )
+                        @ linear_electric_grid_model.sensitivity_branch_power_1_magnitude_by_der_power_active
+                        @ sp.diags(np.real(linear_electric_grid_model.electric_grid_model.der_power_vector_reference))
+                        for linear_electric_grid_model in linear_electric_grid_models
+                    ]
+                ),
+                block_count,
             ),
         )
         optimization_problem.define_parameter(
             "branch_power_1_reactive_term",
-            sp.block_diag(
-                [
-                    sp.diags(
-                        linear_electric_grid_model.electric_grid_model.branch_power_vector_magnitude_reference**-1
-                    )
-                    @ linear_electric_grid_model.sensitivity_branch_power_1_magnitude_by_der_power_reactive
-                    @ sp.diags(np.imag(linear_electric_grid_model.electric_grid_model.der_power_vector_reference))
-                    for linear_electric_grid_model in self.linear_electric_grid_models.values()
-                ]
+            mesmo.solutions.OptimizationBlockDiagonalMatrix(
+                sp.block_diag(
+                    [
+                        sp.diags(
+                            linear_electric_grid_model.electric_grid_model.branch_power_vector_magnitude_reference**-1
+                        )
+                        @ linear_electric_grid_model.sensitivity_branch_power_1_magnitude_by_der_power_reactive
+                        @ sp.diags(np.imag(linear_electric_grid_model.electric_grid_model.der_power_vector_reference))
+                        for linear_electric_grid_model in linear_electric_grid_models
+                    ]
+                ),
+                block_count,
             ),
         )
 
@@ -3211,36 +3755,43 @@ class LinearElectricGridModelSet(mesmo.utils.ObjectBase):
                         - linear_electric_grid_model.sensitivity_branch_power_1_magnitude_by_der_power_reactive
                         @ np.transpose([np.imag(linear_electric_grid_model.power_flow_solution.der_power_vector)])
                     )
-                    for linear_electric_grid_model in self.linear_electric_grid_models.values()
+                    for linear_electric_grid_model in linear_electric_grid_models
                 ]
+                * block_count
             ),
         )
 
         # Define branch flow (direction 2) variable terms.
         optimization_problem.define_parameter(
             "branch_power_2_active_term",
-            sp.block_diag(
-                [
-                    sp.diags(
-                        linear_electric_grid_model.electric_grid_model.branch_power_vector_magnitude_reference**-1
-                    )
-                    @ linear_electric_grid_model.sensitivity_branch_power_2_magnitude_by_der_power_active
-                    @ sp.diags(np.real(linear_electric_grid_model.electric_grid_model.der_power_vector_reference))
-                    for linear_electric_grid_model in self.linear_electric_grid_models.values()
-                ]
+            mesmo.solutions.OptimizationBlockDiagonalMatrix(
+                sp.block_diag(
+                    [
+                        sp.diags(
+                            linear_electric_grid_model.electric_grid_model.branch_power_vector_magnitude_reference**-1
+                        )
+                        @ linear_electric_grid_model.sensitivity_branch_power_2_magnitude_by_der_power_active
+                        @ sp.diags(np.real(linear_electric_grid_model.electric_grid_model.der_power_vector_reference))
+                        for linear_electric_grid_model in linear_electric_grid_models
+                    ]
+                ),
+                block_count,
             ),
         )
         optimization_problem.define_parameter(
             "branch_power_2_reactive_term",
-            sp.block_diag(
-                [
-                    sp.diags(
-                        linear_electric_grid_model.electric_grid_model.branch_power_vector_magnitude_reference**-1
-                    )
-                    @ linear_electric_grid_model.sensitivity_branch_power_2_magnitude_by_der_power_reactive
-                    @ sp.diags(np.imag(linear_electric_grid_model.electric_grid_model.der_power_vector_reference))
-                    for linear_electric_grid_model in self.linear_electric_grid_models.values()
-                ]
+            mesmo.solutions.OptimizationBlockDiagonalMatrix(
+                sp.block_diag(
+                    [
+                        sp.diags(
+                            linear_electric_grid_model.electric_grid_model.branch_power_vector_magnitude_reference**-1
+                        )
+                        @ linear_electric_grid_model.sensitivity_branch_power_2_magnitude_by_der_power_reactive
+                        @ sp.diags(np.imag(linear_electric_grid_model.electric_grid_model.der_power_vector_reference))
+                        for linear_electric_grid_model in linear_electric_grid_models
+                    ]
+                ),
+                block_count,
             ),
         )
 
@@ -3259,30 +3810,37 @@ class LinearElectricGridModelSet(mesmo.utils.ObjectBase):
                         - linear_electric_grid_model.sensitivity_branch_power_2_magnitude_by_der_power_reactive
                         @ np.transpose([np.imag(linear_electric_grid_model.power_flow_solution.der_power_vector)])
                     )
-                    for linear_electric_grid_model in self.linear_electric_grid_models.values()
+                    for linear_electric_grid_model in linear_electric_grid_models
                 ]
+                * block_count
             ),
         )
 
         # Define active loss variable terms.
         optimization_problem.define_parameter(
             "loss_active_active_term",
-            sp.block_diag(
-                [
-                    linear_electric_grid_model.sensitivity_loss_active_by_der_power_active
-                    @ sp.diags(np.real(linear_electric_grid_model.electric_grid_model.der_power_vector_reference))
-                    for linear_electric_grid_model in self.linear_electric_grid_models.values()
-                ]
+            mesmo.solutions.OptimizationBlockDiagonalMatrix(
+                sp.block_diag(
+                    [
+                        linear_electric_grid_model.sensitivity_loss_active_by_der_power_active
+                        @ sp.diags(np.real(linear_electric_grid_model.electric_grid_model.der_power_vector_reference))
+                        for linear_electric_grid_model in linear_electric_grid_models
+                    ]
+                ),
+                block_count,
             ),
         )
         optimization_problem.define_parameter(
             "loss_active_reactive_term",
-            sp.block_diag(
-                [
-                    linear_electric_grid_model.sensitivity_loss_active_by_der_power_reactive
-                    @ sp.diags(np.imag(linear_electric_grid_model.electric_grid_model.der_power_vector_reference))
-                    for linear_electric_grid_model in self.linear_electric_grid_models.values()
-                ]
+            mesmo.solutions.OptimizationBlockDiagonalMatrix(
+                sp.block_diag(
+                    [
+                        linear_electric_grid_model.sensitivity_loss_active_by_der_power_reactive
+                        @ sp.diags(np.imag(linear_electric_grid_model.electric_grid_model.der_power_vector_reference))
+                        for linear_electric_grid_model in linear_electric_grid_models
+                    ]
+                ),
+                block_count,
             ),
         )
 
@@ -3296,30 +3854,37 @@ class LinearElectricGridModelSet(mesmo.utils.ObjectBase):
                     @ np.transpose([np.real(linear_electric_grid_model.power_flow_solution.der_power_vector)])
                     - linear_electric_grid_model.sensitivity_loss_active_by_der_power_reactive
                     @ np.transpose([np.imag(linear_electric_grid_model.power_flow_solution.der_power_vector)])
-                    for linear_electric_grid_model in self.linear_electric_grid_models.values()
+                    for linear_electric_grid_model in linear_electric_grid_models
                 ]
+                * block_count
             ),
         )
 
         # Define reactive loss variable terms.
         optimization_problem.define_parameter(
             "loss_reactive_active_term",
-            sp.block_diag(
-                [
-                    linear_electric_grid_model.sensitivity_loss_reactive_by_der_power_active
-                    @ sp.diags(np.real(linear_electric_grid_model.electric_grid_model.der_power_vector_reference))
-                    for linear_electric_grid_model in self.linear_electric_grid_models.values()
-                ]
+            mesmo.solutions.OptimizationBlockDiagonalMatrix(
+                sp.block_diag(
+                    [
+                        linear_electric_grid_model.sensitivity_loss_reactive_by_der_power_active
+                        @ sp.diags(np.real(linear_electric_grid_model.electric_grid_model.der_power_vector_reference))
+                        for linear_electric_grid_model in linear_electric_grid_models
+                    ]
+                ),
+                block_count,
             ),
         )
         optimization_problem.define_parameter(
             "loss_reactive_reactive_term",
-            sp.block_diag(
-                [
-                    linear_electric_grid_model.sensitivity_loss_reactive_by_der_power_reactive
-                    @ sp.diags(np.imag(linear_electric_grid_model.electric_grid_model.der_power_vector_reference))
-                    for linear_electric_grid_model in self.linear_electric_grid_models.values()
-                ]
+            mesmo.solutions.OptimizationBlockDiagonalMatrix(
+                sp.block_diag(
+                    [
+                        linear_electric_grid_model.sensitivity_loss_reactive_by_der_power_reactive
+                        @ sp.diags(np.imag(linear_electric_grid_model.electric_grid_model.der_power_vector_reference))
+                        for linear_electric_grid_model in linear_electric_grid_models
+                    ]
+                ),
+                block_count,
             ),
         )
 
@@ -3333,8 +3898,9 @@ class LinearElectricGridModelSet(mesmo.utils.ObjectBase):
                     @ np.transpose([np.real(linear_electric_grid_model.power_flow_solution.der_power_vector)])
                     - linear_electric_grid_model.sensitivity_loss_reactive_by_der_power_reactive
                     @ np.transpose([np.imag(linear_electric_grid_model.power_flow_solution.der_power_vector)])
-                    for linear_electric_grid_model in self.linear_electric_grid_models.values()
+                    for linear_electric_grid_model in linear_electric_grid_models
                 ]
+                * block_count
             ),
         )
 
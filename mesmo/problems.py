@@ -1,6 +1,6 @@
 """Problems module for mathematical optimization and simulation problem type definitions."""
 
-import itertools
+import hashlib
 from multimethod import multimethod
 import numpy as np
 import pandas as pd
@@ -97,6 +97,7 @@ class NominalOperationProblem(ProblemBase):
     electric_grid_model: mesmo.electric_grid_models.ElectricGridModel = None
     thermal_grid_model: mesmo.thermal_grid_models.ThermalGridModel = None
     der_model_set: mesmo.der_models.DERModelSet
+    power_flow_solution_method: typing.Type[mesmo.electric_grid_models.PowerFlowSolutionBase]
     results: Results
 
     @multimethod
@@ -106,7 +107,13 @@ class NominalOperationProblem(ProblemBase):
         electric_grid_model: mesmo.electric_grid_models.ElectricGridModel = None,
         thermal_grid_model: mesmo.thermal_grid_models.ThermalGridModel = None,
         der_model_set: mesmo.der_models.DERModelSet = None,
+        power_flow_solution_method: typing.Type[
+            mesmo.electric_grid_models.PowerFlowSolutionBase
+        ] = mesmo.electric_grid_models.PowerFlowSolutionFixedPoint,
     ):
+        # Store power flow solution method.
+        self.power_flow_solution_method = power_flow_solution_method
+
         # Obtain data.
         scenario_data = mesmo.data_interface.ScenarioData(scenario_name)
         self.price_data = mesmo.data_interface.PriceData(scenario_name)
@@ -141,89 +148,88 @@ class NominalOperationProblem(ProblemBase):
             mesmo.utils.log_time("DER model instantiation")
 
     def solve(self):
-        # Instantiate results variables.
+        # Obtain nominal DER power vector.
+        # TODO: Use ders instead of der_names for der_models index.
         if self.electric_grid_model is not None:
-            der_power_vector = pd.DataFrame(columns=self.electric_grid_model.ders, index=self.timesteps, dtype=complex)
-            node_voltage_vector = pd.DataFrame(
-                columns=self.electric_grid_model.nodes, index=self.timesteps, dtype=complex
-            )
-            branch_power_vector_1 = pd.DataFrame(
-                columns=self.electric_grid_model.branches, index=self.timesteps, dtype=complex
-            )
-            branch_power_vector_2 = pd.DataFrame(
-                columns=self.electric_grid_model.branches, index=self.timesteps, dtype=complex
+            der_power_vector = pd.DataFrame(
+                {
+                    der: (
+                        self.der_model_set.der_models[der[1]].active_power_nominal_timeseries
+                        + 1.0j * self.der_model_set.der_models[der[1]].reactive_power_nominal_timeseries
+                    )
+                    for der in self.electric_grid_model.ders
+                },
+                index=self.timesteps,
+                columns=self.electric_grid_model.ders,
+                dtype=complex,
             )
-            loss = pd.DataFrame(columns=["total"], index=self.timesteps, dtype=complex)
         if self.thermal_grid_model is not None:
             der_thermal_power_vector = pd.DataFrame(
-                columns=self.thermal_grid_model.ders, index=self.timesteps, dtype=float
-            )
-            node_head_vector = pd.DataFrame(columns=self.thermal_grid_model.nodes, index=self.timesteps, dtype=float)
-            branch_flow_vector = pd.DataFrame(
-                columns=self.thermal_grid_model.branches, index=self.timesteps, dtype=float
+                {
+                    der: self.der_model_set.der_models[der[1]].thermal_power_nominal_timeseries
+                    for der in self.thermal_grid_model.ders
+                },
+                index=self.timesteps,
+                columns=self.thermal_grid_model.ders,
+                dtype=float,
             )
-            pump_power = pd.DataFrame(columns=["total"], index=self.timesteps, dtype=float)
-
-        # Obtain nominal DER power vector.
-        if self.electric_grid_model is not None:
-            for der in self.electric_grid_model.ders:
-                # TODO: Use ders instead of der_names for der_models index.
-                der_name = der[1]
-                der_power_vector.loc[:, der] = self.der_model_set.der_models[
-                    der_name
-                ].active_power_nominal_timeseries + (
-                    1.0j * self.der_model_set.der_models[der_name].reactive_power_nominal_timeseries
-                )
-        if self.thermal_grid_model is not None:
-            for der in self.thermal_grid_model.ders:
-                der_name = der[1]
-                der_thermal_power_vector.loc[:, der] = self.der_model_set.der_models[
-                    der_name
-                ].thermal_power_nominal_timeseries
 
         # Solve power flow.
         mesmo.utils.log_time("power flow solution")
         if self.electric_grid_model is not None:
-            power_flow_solutions = mesmo.utils.starmap(
-                mesmo.electric_grid_models.PowerFlowSolutionFixedPoint,
-                zip(itertools.repeat(self.electric_grid_model), der_power_vector.values),
+            power_flow_solution_set = mesmo.electric_grid_models.PowerFlowSolutionSet(
+                self.electric_grid_model, der_power_vector, power_flow_solution_method=self.power_flow_solution_method
             )
-            power_flow_solutions = dict(zip(self.timesteps, power_flow_solutions))
         if self.thermal_grid_model is not None:
-            thermal_power_flow_solutions = mesmo.utils.starmap(
-                mesmo.thermal_grid_models.ThermalPowerFlowSolution,
-                [(self.thermal_grid_model, row) for row in der_thermal_power_vector.values],
+            thermal_power_flow_solution_set = mesmo.thermal_grid_models.ThermalPowerFlowSolutionSet(
+                self.thermal_grid_model, der_thermal_power_vector
             )
-            thermal_power_flow_solutions = dict(zip(self.timesteps, thermal_power_flow_solutions))
         mesmo.utils.log_time("power flow solution")
 
         # Obtain results.
+        # - Results are obtained from the stacked solution arrays (timesteps x nodes / branches), i.e., with a single
+        #   dataframe construction for each result rather than by filling the dataframes for each timestep.
         if self.electric_grid_model is not None:
-            for timestep in self.timesteps:
-                power_flow_solution = power_flow_solutions[timestep]
-                # TODO: Flatten power flow solution arrays.
-                node_voltage_vector.loc[timestep, :] = power_flow_solution.node_voltage_vector
-                branch_power_vector_1.loc[timestep, :] = power_flow_solution.branch_power_vector_1
-                branch_power_vector_2.loc[timestep, :] = power_flow_solution.branch_power_vector_2
-                loss.loc[timestep, :] = power_flow_solution.loss
-            der_active_power_vector = der_power_vector.apply(np.real)
-            der_reactive_power_vector = der_power_vector.apply(np.imag)
-            node_voltage_magnitude_vector = np.abs(node_voltage_vector)
-            node_voltage_angle_vector = np.angle(node_voltage_vector)
-            branch_power_magnitude_vector_1 = np.abs(branch_power_vector_1)
-            branch_active_power_vector_1 = np.real(branch_power_vector_1)
-            branch_reactive_power_vector_1 = np.imag(branch_power_vector_1)
-            branch_power_magnitude_vector_2 = np.abs(branch_power_vector_2)
-            branch_active_power_vector_2 = np.real(branch_power_vector_2)
-            branch_reactive_power_vector_2 = np.imag(branch_power_vector_2)
-            loss_active = loss.apply(np.real)
-            loss_reactive = loss.apply(np.imag)
+            nodes = self.electric_grid_model.nodes
+            branches = self.electric_grid_model.branches
+            node_voltage_vector = power_flow_solution_set.node_voltage_vector.values
+            branch_power_vector_1 = power_flow_solution_set.branch_power_vector_1.values
+            branch_power_vector_2 = power_flow_solution_set.branch_power_vector_2.values
+            loss = power_flow_solution_set.loss.values
+            der_active_power_vector = pd.DataFrame(
+                np.real(der_power_vector.values), index=self.timesteps, columns=self.electric_grid_model.ders
+            )
+            der_reactive_power_vector = pd.DataFrame(
+                np.imag(der_power_vector.values), index=self.timesteps, columns=self.electric_grid_model.ders
+            )
+            node_voltage_magnitude_vector = pd.DataFrame(
+                np.abs(node_voltage_vector), index=self.timesteps, columns=nodes
+            )
+            node_voltage_angle_vector = pd.DataFrame(np.angle(node_voltage_vector), index=self.timesteps, columns=nodes)
+            branch_power_magnitude_vector_1 = pd.DataFrame(
+                np.abs(branch_power_vector_1), index=self.timesteps, columns=branches
+            )
+            branch_active_power_vector_1 = pd.DataFrame(
+                np.real(branch_power_vector_1), index=self.timesteps, columns=branches
+            )
+            branch_reactive_power_vector_1 = pd.DataFrame(
+                np.imag(branch_power_vector_1), index=self.timesteps, columns=branches
+            )
+            branch_power_magnitude_vector_2 = pd.DataFrame(
+                np.abs(branch_power_vector_2), index=self.timesteps, columns=branches
+            )
+            branch_active_power_vector_2 = pd.DataFrame(
+                np.real(branch_power_vector_2), index=self.timesteps, columns=branches
+            )
+            branch_reactive_power_vector_2 = pd.DataFrame(
+                np.imag(branch_power_vector_2), index=self.timesteps, columns=branches
+            )
+            loss_active = pd.DataFrame(np.real(loss), index=self.timesteps, columns=["total"])
+            loss_reactive = pd.DataFrame(np.imag(loss), index=self.timesteps, columns=["total"])
         if self.thermal_grid_model is not None:
-            for timestep in self.timesteps:
-                thermal_power_flow_solution = thermal_power_flow_solutions[timestep]
-                node_head_vector.loc[timestep, :] = thermal_power_flow_solution.node_head_vector
-                branch_flow_vector.loc[timestep, :] = thermal_power_flow_solution.branch_flow_vector
-                pump_power.loc[timestep, :] = thermal_power_flow_solution.pump_power
+            node_head_vector = thermal_power_flow_solution_set.node_head_vector
+            branch_flow_vector = thermal_power_flow_solution_set.branch_flow_vector
+            pump_power = thermal_power_flow_solution_set.pump_power
 
         # Obtain per-unit values.
         if self.electric_grid_model is not None:
@@ -332,6 +338,12 @@ class OptimalOperationProblem(ProblemBase):
             method of solving a single-shot optimization using the global approximation method. If 'trust_region', it
             will solve iteratively via trust-region method using the local approximation method.
             Choices: 'default', 'trust_region', `None`. Default: `None`.
+        use_problem_cache (bool): If `True`, the optimization problem structure is loaded from the problem cache
+            directory, if a cached problem for the same structure hash exists (see :meth:`get_structure_hash()`).
+            In this case, only the parameters are defined for the loaded problem, i.e., the definition of variables,
+            constraints and objective as well as the standard form compilation is skipped. Otherwise, the optimization
+            problem is defined and stored to the problem cache directory. The problem cache directory is defined via
+            `paths: problem_cache` in the configuration. Default: `False`.
     """
 
     solve_method: str
@@ -357,6 +369,7 @@ class OptimalOperationProblem(ProblemBase):
         thermal_grid_model: mesmo.thermal_grid_models.ThermalGridModel = None,
         der_model_set: mesmo.der_models.DERModelSet = None,
         solve_method: str = None,
+        use_problem_cache: bool = False,
     ):
         # Obtain solve method.
         if solve_method in [None, "default"]:
@@ -412,12 +425,60 @@ class OptimalOperationProblem(ProblemBase):
             self.der_model_set = mesmo.der_models.DERModelSet(scenario_name)
             mesmo.utils.log_time("DER model instantiation")
 
+        # Obtain problem cache file path for the structure hash of the models, if problem cache is enabled.
+        if use_problem_cache:
+            problem_cache_path = mesmo.config.config["paths"]["problem_cache"]
+            problem_cache_path.mkdir(parents=True, exist_ok=True)
+            problem_cache_file = problem_cache_path / f"optimal_operation_problem_{self.get_structure_hash()}.pkl"
+        else:
+            problem_cache_file = None
+
+        # Load optimization problem from problem cache, if available, and only define parameters.
+        if (problem_cache_file is not None) and problem_cache_file.is_file():
+            logger.debug(f"Loading optimization problem from problem cache: {problem_cache_file}")
+            self.optimization_problem = mesmo.solutions.OptimizationProblem.load(problem_cache_file)
+            self.define_optimization_parameters()
+            return
+
         # Instantiate optimization problem.
         self.optimization_problem = mesmo.solutions.OptimizationProblem()
 
-        # Define electric grid problem.
+        # Define optimization variables / parameters.
+        # - Parameters are defined for all models before constraints / objective, such that the parameter definition
+        #   can be repeated independently for problems loaded from the problem cache.
         if self.electric_grid_model is not None:
             self.linear_electric_grid_model_set.define_optimization_variables(self.optimization_problem)
+        if self.thermal_grid_model is not None:
+            self.linear_thermal_grid_model_set.define_optimization_variables(self.optimization_problem)
+        self.der_model_set.define_optimization_variables(self.optimization_problem)
+        self.define_optimization_parameters()
+
+        # Define electric grid problem.
+        if self.electric_grid_model is not None:
+            self.linear_electric_grid_model_set.define_optimization_constraints(self.optimization_problem)
+            self.linear_electric_grid_model_set.define_optimization_objective(self.optimization_problem)
+
+        # Define thermal grid problem.
+        if self.thermal_grid_model is not None:
+            self.linear_thermal_grid_model_set.define_optimization_constraints(self.optimization_problem)
+            self.linear_thermal_grid_model_set.define_optimization_objective(self.optimization_problem)
+
+        # Define DER problem.
+        self.der_model_set.define_optimization_constraints(self.optimization_problem)
+        self.der_model_set.define_optimization_objective(self.optimization_problem)
+
+        # Store optimization problem to problem cache.
+        # - The standard form is compiled before storing, such that it is retained in the problem cache.
+        if problem_cache_file is not None:
+            logger.debug(f"Storing optimization problem to problem cache: {problem_cache_file}")
+            self.optimization_problem.get_standard_form()
+            self.optimization_problem.save(problem_cache_file)
+
+    def define_optimization_parameters(self):
+        """Define optimization parameters of the electric / thermal grid models and DER model set."""
+
+        # Define electric grid parameters.
+        if self.electric_grid_model is not None:
             node_voltage_magnitude_vector_minimum = (
                 self.scenario_data.scenario["voltage_per_unit_minimum"]
                 * np.abs(self.electric_grid_model.node_voltage_vector_reference)
@@ -443,12 +504,9 @@ class OptimalOperationProblem(ProblemBase):
                 node_voltage_magnitude_vector_maximum=node_voltage_magnitude_vector_maximum,
                 branch_power_magnitude_vector_maximum=branch_power_magnitude_vector_maximum,
             )
-            self.linear_electric_grid_model_set.define_optimization_constraints(self.optimization_problem)
-            self.linear_electric_grid_model_set.define_optimization_objective(self.optimization_problem)
 
-        # Define thermal grid problem.
+        # Define thermal grid parameters.
         if self.thermal_grid_model is not None:
-            self.linear_thermal_grid_model_set.define_optimization_variables(self.optimization_problem)
             node_head_vector_minimum = (
                 self.scenario_data.scenario["node_head_per_unit_maximum"]
                 * self.thermal_power_flow_solution_reference.node_head_vector
@@ -467,14 +525,31 @@ class OptimalOperationProblem(ProblemBase):
                 node_head_vector_minimum=node_head_vector_minimum,
                 branch_flow_vector_maximum=branch_flow_vector_maximum,
             )
-            self.linear_thermal_grid_model_set.define_optimization_constraints(self.optimization_problem)
-            self.linear_thermal_grid_model_set.define_optimization_objective(self.optimization_problem)
 
-        # Define DER problem.
-        self.der_model_set.define_optimization_variables(self.optimization_problem)
+        # Define DER parameters.
         self.der_model_set.define_optimization_parameters(self.optimization_problem, self.price_data)
-        self.der_model_set.define_optimization_constraints(self.optimization_problem)
-        self.der_model_set.define_optimization_objective(self.optimization_problem)
+
+    def get_structure_hash(self) -> str:
+        """Obtain hash of the problem structure, which serves as key for the problem cache.
+
+        - The problem structure is defined by the index sets of the electric / thermal grid models and DER model set,
+          i.e., the timesteps, nodes, branches, DERs, states, controls, etc., which determine the variables,
+          constraints and objective terms of the optimization problem. Numerical model values are not considered,
+          as these are defined via parameters.
+        - Note that the problem cache should be cleared when changing the problem definition in the source code.
+        """
+
+        # Obtain index sets of all models.
+        # - Index sets are represented by their names and values, to obtain a hash which is reproducible across runs.
+        structure = [self.solve_method]
+        for model in [self.electric_grid_model, self.thermal_grid_model, self.der_model_set]:
+            structure.append(type(model).__name__)
+            if model is not None:
+                for attribute_name, value in vars(model).items():
+                    if isinstance(value, pd.Index):
+                        structure.append((attribute_name, list(value.names), value.to_list()))
+
+        return hashlib.sha256(repr(structure).encode()).hexdigest()
 
     def solve(self):
         # Select solve method depending on `solve_method` attribute.
@@ -625,11 +700,11 @@ class OptimalOperationProblem(ProblemBase):
                 branch_power_magnitude_vector_2_reference = power_flow_results.branch_power_magnitude_vector_2_per_unit
 
                 # Get linear electric grid model for all timesteps
-                logger.debug("Obtaining linear electric grid model set...")
-                self.linear_electric_grid_model_set = mesmo.electric_grid_models.LinearElectricGridModelSet(
-                    self.electric_grid_model,
-                    power_flow_solution_set,
-                    mesmo.electric_grid_models.LinearElectricGridModelLocal,
+                # - Linear electric grid models are only recomputed for timesteps where the power flow solution
+                #   changed since the previous accepted iteration.
+                logger.debug("Updating linear electric grid model set...")
+                self.linear_electric_grid_model_set.update_linear_electric_grid_models(
+                    power_flow_solution_set, mesmo.electric_grid_models.LinearElectricGridModelLocal
                 )
 
                 # Update the parameters so that sensitivity matrices are updated
@@ -6,16 +6,784 @@ import gurobipy as gp
 import itertools
 import numpy as np
 import pandas as pd
+import pathlib
+import pickle
 import scipy.sparse as sp
 import subprocess
 import typing
 
+# Import HiGHS Python interface, if available. Otherwise, HiGHS is interfaced via the HiGHS binary.
+try:
+    import highspy
+except ImportError:
+    highspy = None
+
 import mesmo.config
 import mesmo.utils
 
 logger = mesmo.config.get_logger(__name__)
 
 
+class OptimizationVariableBlock(mesmo.utils.ObjectBase):
+    """Optimization variable block object, which represents a single variable definition in the variable registry
+    of :class:`OptimizationProblem`.
+
+    - Each variable block occupies the contiguous integer range ``start:stop`` of the variable vector.
+    - Regular variable definitions are stored by their key set factors, i.e., the variable rows of the block are the
+      cartesian product of the key sets in the order of the ``keys`` dictionary.
+    - Irregular variable definitions, i.e., definitions which partially overlap with previous definitions or contain
+      duplicate key values, are stored with explicit key values for each variable row.
+    """
+
+    name: str
+    variable_type: str
+    keys: typing.Dict[str, pd.Index]
+    is_product: bool
+    start: int
+    stop: int
+
+    def __init__(
+        self,
+        name: str,
+        variable_type: str,
+        keys: typing.Dict[str, pd.Index],
+        start: int,
+        is_product: bool = True,
+    ):
+        # Store attributes.
+        self.name = name
+        self.variable_type = variable_type
+        self.keys = keys
+        self.is_product = is_product
+        self.start = start
+        self.stop = start + self.get_length()
+
+    def get_length(self) -> int:
+        """Obtain number of variable rows in this block."""
+
+        if self.is_product:
+            return int(np.prod([len(values) for values in self.keys.values()], dtype=int))
+        else:
+            return len(next(iter(self.keys.values()))) if len(self.keys) > 0 else 1
+
+    def get_key_columns(self) -> typing.Dict[str, np.ndarray]:
+        """Obtain key values of each variable row in this block as dictionary of flat arrays."""
+
+        # For irregular blocks, key values are stored explicitly.
+        if not self.is_product:
+            return {key: values.values for key, values in self.keys.items()}
+
+        # For regular blocks, key values are obtained by expanding the cartesian product of the key set factors.
+        # - The first key varies slowest and the last key varies fastest, equivalent to ``itertools.product``.
+        key_columns = dict()
+        lengths = [len(values) for values in self.keys.values()]
+        for position, (key, values) in enumerate(self.keys.items()):
+            repeat_len = int(np.prod(lengths[position + 1 :], dtype=int))
+            tile_len = int(np.prod(lengths[:position], dtype=int))
+            key_columns[key] = values.values[np.tile(np.repeat(np.arange(len(values)), repeat_len), tile_len)]
+
+        return key_columns
+
+    def get_key_rows(self, keys: typing.Iterable[str]) -> typing.List[tuple]:
+        """Obtain key values of each variable row in this block as list of tuples, ordered by given key names."""
+
+        # Obtain key value rows in the order of the block keys.
+        if self.is_product:
+            rows = itertools.product(*self.keys.values())
+        else:
+            rows = zip(*self.keys.values()) if len(self.keys) > 0 else [tuple()]
+
+        # Reorder key values to given key names.
+        positions = [list(self.keys.keys()).index(key) for key in keys]
+
+        return [tuple(row[position] for position in positions) for row in rows]
+
+    def get_index(self, **keys) -> np.ndarray:
+        """Obtain integer index array of the variable rows in this block for given key / value list combinations.
+
+        - Key values must be given as lists, see :meth:`OptimizationProblem.get_variable_index()`.
+        - For regular blocks, the index is obtained by looking up the key values in the key set factors and combining
+          the factor positions via the strides of the cartesian product. The index array is sorted ascending.
+        """
+
+        # Keys which are not defined for this block can only match undefined values, i.e., NaN entries.
+        for key, values in keys.items():
+            if key == "variable_type":
+                if not pd.Index([self.variable_type]).isin(values)[0]:
+                    return np.array([], dtype=int)
+            elif key not in self.keys:
+                if not pd.Index([np.nan]).isin(values)[0]:
+                    return np.array([], dtype=int)
+
+        # Return empty index for empty blocks.
+        if self.stop == self.start:
+            return np.array([], dtype=int)
+
+        # For irregular blocks, obtain index from mask of the explicit key values.
+        if not self.is_product:
+            mask = np.ones(self.stop - self.start, dtype=bool)
+            for key, values in self.keys.items():
+                if key in keys:
+                    mask &= values.isin(keys[key])
+            return self.start + np.flatnonzero(mask)
+
+        # For regular blocks, obtain index from the positions within the key set factors.
+        index = np.array([self.start])
+        lengths = [len(values) for values in self.keys.values()]
+        for position, (key, values) in enumerate(self.keys.items()):
+            stride = int(np.prod(lengths[position + 1 :], dtype=int))
+            factor_index = np.flatnonzero(values.isin(keys[key])) if key in keys else np.arange(len(values))
+            index = (index[:, np.newaxis] + factor_index * stride).ravel()
+
+        return index
+
+    def get_dataframe(self) -> pd.DataFrame:
+        """Obtain variables index set for this block, in the format of :attr:`OptimizationProblem.variables`."""
+
+        length = self.stop - self.start
+
+        return pd.DataFrame(
+            {
+                "name": np.full(length, self.name, dtype=object),
+                "variable_type": np.full(length, self.variable_type, dtype=object),
+                **self.get_key_columns(),
+            },
+            columns=["name", "variable_type", *self.keys.keys()],
+        )
+
+
+class OptimizationMatrixBuffer(mesmo.utils.ObjectBase):
+    """Sparse matrix buffer object, which collects matrix entries in coordinate (COO) format into preallocated,
+    growable numpy arrays for row indexes, column indexes and values.
+
+    - The buffer capacity is doubled whenever exceeded, such that appending entries has amortized constant cost.
+    - Duplicate entries are summed upon conversion to a sparse matrix in :meth:`get_matrix()`.
+    """
+
+    rows: np.ndarray
+    columns: np.ndarray
+    values: np.ndarray
+    length: int
+
+    def __init__(self, capacity: int = 1024):
+        # Instantiate arrays.
+        self.rows = np.zeros(capacity, dtype=int)
+        self.columns = np.zeros(capacity, dtype=int)
+        self.values = np.zeros(capacity, dtype=float)
+        self.length = 0
+
+    def append(self, rows: np.ndarray, columns: np.ndarray, values: np.ndarray):
+        """Append matrix entries with given row indexes, column indexes and values."""
+
+        # Increase capacity, if needed.
+        length = self.length + len(values)
+        if length > len(self.values):
+            capacity = max(length, 2 * len(self.values))
+            self.rows = np.resize(self.rows, capacity)
+            self.columns = np.resize(self.columns, capacity)
+            self.values = np.resize(self.values, capacity)
+
+        # Insert entries.
+        self.rows[self.length : length] = rows
+        self.columns[self.length : length] = columns
+        self.values[self.length : length] = values
+        self.length = length
+
+    def get_entries(self) -> (np.ndarray, np.ndarray, np.ndarray):
+        """Obtain row indexes, column indexes and values of all entries, without copying."""
+
+        return self.rows[: self.length], self.columns[: self.length], self.values[: self.length]
+
+    def get_matrix(self, shape: typing.Tuple[int, int]) -> sp.csr_matrix:
+        """Obtain CSR sparse matrix of given shape from all entries."""
+
+        return sp.coo_matrix((self.values[: self.length], self.get_entries()[:2]), shape=shape).tocsr()
+
+
+class OptimizationBlockDiagonalMatrix(mesmo.utils.ObjectBase):
+    r"""Block-diagonal matrix object, which represents the matrix :math:`\boldsymbol{I}_n \otimes \boldsymbol{M}`,
+    i.e., the block matrix :math:`\boldsymbol{M}` repeated :math:`n` times along the diagonal, by storing only the
+    block matrix and the block count.
+
+    - Can be passed as parameter value to :meth:`OptimizationProblem.define_parameter()` or as variable factor in
+      constraint / quadratic objective definitions, e.g., for time-invariant model matrices which apply identically
+      to all timesteps. The matrix entries are expanded only upon compilation of the standard form.
+    - Broadcasting of matrix values in constraint / objective definitions is internally represented by this object.
+    """
+
+    block: sp.coo_matrix
+    block_count: int
+
+    def __init__(
+        self, block: typing.Union[np.ndarray, sp.spmatrix, "OptimizationBlockDiagonalMatrix"], block_count: int
+    ):
+        # Nested block-diagonal matrices are merged into a single block-diagonal matrix.
+        if isinstance(block, OptimizationBlockDiagonalMatrix):
+            block_count *= block.block_count
+            block = block.block
+
+        # Store attributes.
+        self.block = sp.coo_matrix(block)
+        self.block_count = block_count
+
+    @property
+    def shape(self) -> typing.Tuple[int, int]:
+        return self.block.shape[0] * self.block_count, self.block.shape[1] * self.block_count
+
+    def get_entries(self) -> (np.ndarray, np.ndarray, np.ndarray):
+        """Obtain row indexes, column indexes and values of the nonzero entries of the expanded matrix, in the same
+        order as ``scipy.sparse.find()`` for the expanded matrix.
+
+        - Entries of the block are obtained once and repeated with row / column offsets for each block.
+        """
+
+        # Obtain block entries and block offsets.
+        rows, columns, values = sp.find(self.block)
+        row_offsets = np.arange(self.block_count)[:, np.newaxis] * self.block.shape[0]
+        column_offsets = np.arange(self.block_count)[:, np.newaxis] * self.block.shape[1]
+
+        return (
+            (row_offsets + rows).ravel(),
+            (column_offsets + columns).ravel(),
+            np.tile(values, self.block_count),
+        )
+
+    def tocsr(self) -> sp.csr_matrix:
+        """Obtain expanded matrix as CSR sparse matrix."""
+
+        return sp.kron(sp.eye(self.block_count), self.block, format="csr")
+
+    def toarray(self) -> np.ndarray:
+        """Obtain expanded matrix as dense array."""
+
+        return self.tocsr().toarray()
+
+
+def get_matrix_entries(
+    values: typing.Union[np.ndarray, sp.spmatrix, OptimizationBlockDiagonalMatrix],
+) -> (np.ndarray, np.ndarray, np.ndarray):
+    """Utility function for obtaining row indexes, column indexes and values of the nonzero entries of given matrix,
+    equivalent to ``scipy.sparse.find()``, but without expanding block-diagonal matrix objects beforehand.
+    """
+
+    if isinstance(values, OptimizationBlockDiagonalMatrix):
+        return values.get_entries()
+    else:
+        return sp.find(values)
+
+
+class OptimizationParameters(collections.UserDict, mesmo.utils.ObjectBase):
+    """Parameters dictionary object, which records the names of all parameters that have been defined or redefined
+    since the standard-form problem has last been updated (see :meth:`OptimizationProblem.get_standard_form()`).
+
+    - Parameter names are recorded upon any item assignment, i.e., both via
+      :meth:`OptimizationProblem.define_parameter()` and via direct assignment, e.g.,
+      ``optimization_problem.parameters[name] = value``.
+    - Note that modifying a parameter array in place is not recorded.
+    """
+
+    data: dict
+    redefined_names: set
+
+    def __init__(self, *args, **kwargs):
+        self.redefined_names = set()
+        super().__init__(*args, **kwargs)
+
+    def __setitem__(self, name: str, value):
+        super().__setitem__(name, value)
+        self.redefined_names.add(name)
+
+
+class OptimizationStandardForm(mesmo.utils.ObjectBase):
+    r"""Standard-form problem object, which holds the compiled :math:`\boldsymbol{A}` matrix, :math:`\boldsymbol{b}`
+    vector, :math:`\boldsymbol{c}` vector, :math:`\boldsymbol{Q}` matrix and :math:`d` constant of an optimization
+    problem (see :class:`OptimizationProblem`).
+
+    - Upon compilation, the parameter terms are recorded for each parameter name along with their nonzero slots,
+      i.e., the positions of their entries in the data array of the sparse matrices.
+    - Redefined parameters can be applied via :meth:`update_parameters()`, which re-evaluates only the terms of the
+      redefined parameters and patches the affected values in place, without recompiling the problem structure.
+    - Equality constraint rows are indicated by :attr:`is_equality`, i.e., the rows of the :math:`\boldsymbol{A}`
+      matrix and :math:`\boldsymbol{b}` vector represent :math:`\boldsymbol{A} \boldsymbol{x} = \boldsymbol{b}`
+      for equality rows and :math:`\boldsymbol{A} \boldsymbol{x} \leq \boldsymbol{b}` for all other rows.
+    - Constraint rows with a single nonzero coefficient are identified as bound rows upon compilation. The solver
+      interfaces define these as variable bounds via :meth:`get_bounds()` rather than as rows of the constraint
+      matrix, i.e., only the remaining constraint rows are passed via :meth:`get_a_matrix_reduced()` and
+      :meth:`get_b_vector_reduced()`. Duals of the bound rows are recovered via :meth:`get_mu_vector()`.
+    """
+
+    a_matrix: sp.csr_matrix
+    a_matrix_values: np.ndarray
+    a_matrix_slots: np.ndarray
+    a_matrix_parameter_terms: typing.Dict[str, list]
+    b_vector: np.ndarray
+    b_vector_constant: np.ndarray
+    b_vector_parameter_terms: typing.Dict[str, list]
+    b_vector_parameter_values: list
+    c_vector: np.ndarray
+    c_vector_constant: np.ndarray
+    c_vector_parameter_terms: typing.Dict[str, list]
+    c_vector_parameter_values: list
+    q_matrix: sp.csr_matrix
+    q_matrix_values: np.ndarray
+    q_matrix_slots: np.ndarray
+    q_matrix_parameter_terms: typing.Dict[str, list]
+    d_constant: float
+    d_constant_constant: float
+    d_constant_parameter_terms: typing.Dict[str, list]
+    d_constant_parameter_values: list
+    is_equality: np.ndarray
+    bound_rows: np.ndarray
+    bound_columns: np.ndarray
+    bound_slots: np.ndarray
+    constraint_rows: np.ndarray
+    constraint_slots: np.ndarray
+
+    def __init__(self, optimization_problem: "OptimizationProblem"):
+        # Obtain parameters.
+        parameters = optimization_problem.parameters
+
+        # Obtain A matrix entries.
+        # - Constant entries are obtained from the buffer, parameter entries are evaluated and appended in order.
+        # - Parameter terms are stored as (entry start, entry stop, rows, columns, term), where the local rows / columns
+        #   are retained to detect changes in the sparsity pattern upon parameter updates.
+        rows, columns, values = optimization_problem.a_matrix_buffer.get_entries()
+        rows_list = [rows]
+        columns_list = [columns]
+        values_list = [values]
+        entries_len = len(values)
+        self.a_matrix_parameter_terms = collections.defaultdict(list)
+        for term in optimization_problem.a_parameter_terms:
+            rows, columns, values = self.get_a_matrix_term_entries(parameters[term[4]], *term)
+            rows_list.append(rows)
+            columns_list.append(columns)
+            values_list.append(values)
+            self.a_matrix_parameter_terms[term[4]].append((entries_len, entries_len + len(values), rows, columns, term))
+            entries_len += len(values)
+        self.a_matrix, self.a_matrix_values, self.a_matrix_slots = self.get_matrix(
+            rows_list,
+            columns_list,
+            values_list,
+            shape=(optimization_problem.constraints_len, optimization_problem.variables_len),
+        )
+
+        # Obtain b vector.
+        # - Parameter values are stored per term, such that the b vector can be re-summed upon parameter updates.
+        self.b_vector_constant = np.zeros((optimization_problem.constraints_len, 1))
+        self.b_vector_parameter_terms = collections.defaultdict(list)
+        self.b_vector_parameter_values = list()
+        for constraint_start, constraint_stop in optimization_problem.b_dict:
+            for values in optimization_problem.b_dict[constraint_start, constraint_stop]:
+                # If value is tuple, treat as parameter.
+                if type(values) is tuple:
+                    term = (constraint_start, constraint_stop, *values)
+                    self.b_vector_parameter_terms[term[3]].append((len(self.b_vector_parameter_values), term))
+                    self.b_vector_parameter_values.append(self.get_b_vector_term_values(parameters[term[3]], *term))
+                else:
+                    self.b_vector_constant[constraint_start:constraint_stop, 0] += values.ravel()
+        self.b_vector = self.get_b_vector()
+
+        # Obtain c vector.
+        self.c_vector_constant = np.zeros((1, optimization_problem.variables_len))
+        self.c_vector_parameter_terms = collections.defaultdict(list)
+        self.c_vector_parameter_values = list()
+        for variable_index in optimization_problem.c_dict:
+            for values in optimization_problem.c_dict[variable_index]:
+                # If value is tuple, treat as parameter.
+                if type(values) is tuple:
+                    term = (np.array(variable_index), *values)
+                    self.c_vector_parameter_terms[term[1]].append((len(self.c_vector_parameter_values), term))
+                    self.c_vector_parameter_values.append(self.get_c_vector_term_values(parameters[term[1]], *term))
+                else:
+                    self.c_vector_constant[0, variable_index] += values.ravel()
+        self.c_vector = self.get_c_vector()
+
+        # Obtain Q matrix entries.
+        # - Terms are added on both off-diagonal sides of Q for symmetry.
+        rows_list = list()
+        columns_list = list()
+        values_list = list()
+        entries_len = 0
+        self.q_matrix_parameter_terms = collections.defaultdict(list)
+        for variable_1_index, variable_2_index in optimization_problem.q_dict:
+            for values in optimization_problem.q_dict[variable_1_index, variable_2_index]:
+                # If value is tuple, treat as parameter.
+                if type(values) is tuple:
+                    term = (np.array(variable_1_index), np.array(variable_2_index), *values)
+                    rows, columns, values = self.get_q_matrix_term_entries(parameters[term[2]], *term)
+                    self.q_matrix_parameter_terms[term[2]].append(
+                        (entries_len, entries_len + len(values), rows, columns, term)
+                    )
+                else:
+                    rows, columns, values = get_matrix_entries(values)
+                    rows, columns = np.array(variable_1_index)[rows], np.array(variable_2_index)[columns]
+                    rows, columns, values = (
+                        np.concatenate([rows, columns]),
+                        np.concatenate([columns, rows]),
+                        np.concatenate([values, values]),
+                    )
+                rows_list.append(rows)
+                columns_list.append(columns)
+                values_list.append(values)
+                entries_len += len(values)
+        self.q_matrix, self.q_matrix_values, self.q_matrix_slots = self.get_matrix(
+            rows_list,
+            columns_list,
+            values_list,
+            shape=(optimization_problem.variables_len, optimization_problem.variables_len),
+        )
+
+        # Obtain d constant.
+        self.d_constant_constant = 0.0
+        self.d_constant_parameter_terms = collections.defaultdict(list)
+        self.d_constant_parameter_values = list()
+        for values in optimization_problem.d_dict[0]:
+            # If value is tuple, treat as parameter.
+            if type(values) is tuple:
+                self.d_constant_parameter_terms[values[0]].append((len(self.d_constant_parameter_values), values))
+                self.d_constant_parameter_values.append(self.get_d_constant_term_value(parameters[values[0]], *values))
+            else:
+                self.d_constant_constant += float(values)
+        self.d_constant = self.d_constant_constant + sum(self.d_constant_parameter_values)
+
+        # Obtain equality constraint rows.
+        self.is_equality = np.zeros(optimization_problem.constraints_len, dtype=bool)
+        for constraint_start, constraint_stop in optimization_problem.equality_constraint_ranges:
+            self.is_equality[constraint_start:constraint_stop] = True
+
+        # Obtain bound rows, i.e., constraint rows with a single nonzero coefficient.
+        # - The remaining constraint rows and their slots in the A matrix data array are stored for obtaining the
+        #   reduced A matrix.
+        slot_rows = np.repeat(np.arange(self.a_matrix.shape[0]), np.diff(self.a_matrix.indptr))
+        rows_nonzero_len = np.bincount(slot_rows[self.a_matrix.data != 0.0], minlength=self.a_matrix.shape[0])
+        is_bound_row = (rows_nonzero_len == 1) & (np.diff(self.a_matrix.indptr) == 1)
+        self.bound_rows = np.flatnonzero(is_bound_row)
+        self.bound_slots = self.a_matrix.indptr[self.bound_rows]
+        self.bound_columns = self.a_matrix.indices[self.bound_slots]
+        self.constraint_rows = np.flatnonzero(~is_bound_row)
+        self.constraint_slots = np.flatnonzero(~is_bound_row[slot_rows])
+
+    def update_parameters(self, parameters: dict, parameter_names: typing.Iterable[str]) -> bool:
+        """Update numerical values of the standard-form problem for the given redefined parameter names.
+
+        - Only the terms of the given parameters are re-evaluated. Matrix values are patched in the data arrays of the
+          existing sparse matrices, such that their sparsity structure is retained.
+        - Returns `False` without completing the update, if the sparsity pattern of any parameter term has changed.
+          In this case, the standard-form problem must be recompiled.
+        """
+
+        # Obtain parameter names which are used in the problem.
+        parameter_names = set(parameter_names)
+
+        # Update A matrix values.
+        a_matrix_parameter_names = parameter_names.intersection(self.a_matrix_parameter_terms.keys())
+        for parameter_name in a_matrix_parameter_names:
+            for entries_start, entries_stop, rows, columns, term in self.a_matrix_parameter_terms[parameter_name]:
+                rows_new, columns_new, values = self.get_a_matrix_term_entries(parameters[parameter_name], *term)
+                if not (np.array_equal(rows_new, rows) and np.array_equal(columns_new, columns)):
+                    return False
+                self.a_matrix_values[entries_start:entries_stop] = values
+        if len(a_matrix_parameter_names) > 0:
+            self.a_matrix.data[:] = np.bincount(
+                self.a_matrix_slots, weights=self.a_matrix_values, minlength=len(self.a_matrix.data)
+            )
+            # Bound rows must retain their nonzero coefficient.
+            if (self.a_matrix.data[self.bound_slots] == 0.0).any():
+                return False
+
+        # Update Q matrix values.
+        q_matrix_parameter_names = parameter_names.intersection(self.q_matrix_parameter_terms.keys())
+        for parameter_name in q_matrix_parameter_names:
+            for entries_start, entries_stop, rows, columns, term in self.q_matrix_parameter_terms[parameter_name]:
+                rows_new, columns_new, values = self.get_q_matrix_term_entries(parameters[parameter_name], *term)
+                if not (np.array_equal(rows_new, rows) and np.array_equal(columns_new, columns)):
+                    return False
+                self.q_matrix_values[entries_start:entries_stop] = values
+        if len(q_matrix_parameter_names) > 0:
+            self.q_matrix.data[:] = np.bincount(
+                self.q_matrix_slots, weights=self.q_matrix_values, minlength=len(self.q_matrix.data)
+            )
+
+        # Update b vector.
+        b_vector_parameter_names = parameter_names.intersection(self.b_vector_parameter_terms.keys())
+        for parameter_name in b_vector_parameter_names:
+            for position, term in self.b_vector_parameter_terms[parameter_name]:
+                self.b_vector_parameter_values[position] = self.get_b_vector_term_values(
+                    parameters[parameter_name], *term
+                )
+        if len(b_vector_parameter_names) > 0:
+            self.b_vector[:] = self.get_b_vector()
+
+        # Update c vector.
+        c_vector_parameter_names = parameter_names.intersection(self.c_vector_parameter_terms.keys())
+        for parameter_name in c_vector_parameter_names:
+            for position, term in self.c_vector_parameter_terms[parameter_name]:
+                self.c_vector_parameter_values[position] = self.get_c_vector_term_values(
+                    parameters[parameter_name], *term
+                )
+        if len(c_vector_parameter_names) > 0:
+            self.c_vector[:] = self.get_c_vector()
+
+        # Update d constant.
+        for parameter_name in parameter_names.intersection(self.d_constant_parameter_terms.keys()):
+            for position, term in self.d_constant_parameter_terms[parameter_name]:
+                self.d_constant_parameter_values[position] = self.get_d_constant_term_value(
+                    parameters[parameter_name], *term
+                )
+        self.d_constant = self.d_constant_constant + sum(self.d_constant_parameter_values)
+
+        return True
+
+    def get_a_matrix_reduced(self) -> sp.csr_matrix:
+        r"""Obtain :math:`\boldsymbol{A}` matrix without bound rows."""
+
+        return sp.csr_matrix(
+            (
+                self.a_matrix.data[self.constraint_slots],
+                self.a_matrix.indices[self.constraint_slots],
+                np.concatenate([[0], np.cumsum(np.diff(self.a_matrix.indptr)[self.constraint_rows])]),
+            ),
+            shape=(len(self.constraint_rows), self.a_matrix.shape[1]),
+        )
+
+    def get_b_vector_reduced(self) -> np.ndarray:
+        r"""Obtain :math:`\boldsymbol{b}` vector without bound rows."""
+
+        return self.b_vector[self.constraint_rows, :]
+
+    def get_bounds(self) -> (np.ndarray, np.ndarray):
+        """Obtain lower / upper variable bounds based on the bound rows.
+
+        - Bound rows with positive coefficient yield upper bounds and bound rows with negative coefficient yield
+          lower bounds. Equality bound rows yield both lower and upper bounds. If multiple bound rows apply to
+          a variable, the tightest bound is retained.
+        """
+
+        # Obtain bound values.
+        coefficients = self.a_matrix.data[self.bound_slots]
+        bounds = self.b_vector[self.bound_rows, 0] / coefficients
+        is_lower_bound = (coefficients < 0.0) | self.is_equality[self.bound_rows]
+        is_upper_bound = (coefficients > 0.0) | self.is_equality[self.bound_rows]
+
+        # Obtain tightest bounds.
+        lower_bounds = np.full(self.a_matrix.shape[1], -np.inf)
+        upper_bounds = np.full(self.a_matrix.shape[1], np.inf)
+        np.maximum.at(lower_bounds, self.bound_columns[is_lower_bound], bounds[is_lower_bound])
+        np.minimum.at(upper_bounds, self.bound_columns[is_upper_bound], bounds[is_upper_bound])
+
+        return lower_bounds, upper_bounds
+
+    def get_inequality_form(self) -> (sp.csr_matrix, np.ndarray):
+        r"""Obtain :math:`\boldsymbol{A}` matrix and :math:`\boldsymbol{b}` vector in pure inequality form,
+        i.e., :math:`\boldsymbol{A} \boldsymbol{x} \leq \boldsymbol{b}`, where each equality row is represented by
+        its original row and an appended row with inverted signs.
+        """
+
+        a_matrix = sp.vstack([self.a_matrix, -self.a_matrix[self.is_equality, :]], format="csr")
+        b_vector = np.concatenate([self.b_vector, -self.b_vector[self.is_equality, :]], axis=0)
+
+        return a_matrix, b_vector
+
+    def get_mu_vector(self, mu_vector_reduced: np.ndarray, reduced_costs: np.ndarray) -> np.ndarray:
+        r"""Obtain :math:`\boldsymbol{\mu}` vector for all constraint rows, based on the duals of the reduced
+        constraint rows and the reduced costs of the variables.
+
+        - The dual of the active bound row of each variable is obtained as the reduced cost divided by the row
+          coefficient, where the reduced cost is attributed to the lower / upper bound depending on its sign.
+          If multiple bound rows define the same active bound, the dual is attributed to the first of these rows.
+        """
+
+        # Instantiate mu vector with duals of the reduced constraint rows.
+        mu_vector = np.zeros((self.a_matrix.shape[0], 1))
+        mu_vector[self.constraint_rows, 0] = np.ravel(mu_vector_reduced)
+
+        # Obtain bound values.
+        coefficients = self.a_matrix.data[self.bound_slots]
+        bounds = self.b_vector[self.bound_rows, 0] / coefficients
+        lower_bounds, upper_bounds = self.get_bounds()
+        reduced_costs = np.ravel(reduced_costs)
+
+        # Obtain duals of active bound rows.
+        # - Equality bound rows are candidates for both lower and upper bounds, hence duals are accumulated.
+        for is_active, duals in [
+            (
+                ((coefficients < 0.0) | self.is_equality[self.bound_rows])
+                & (bounds == lower_bounds[self.bound_columns]),
+                np.maximum(reduced_costs, 0.0),
+            ),
+            (
+                ((coefficients > 0.0) | self.is_equality[self.bound_rows])
+                & (bounds == upper_bounds[self.bound_columns]),
+                np.minimum(reduced_costs, 0.0),
+            ),
+        ]:
+            positions = np.flatnonzero(is_active)
+            _, first_positions = np.unique(self.bound_columns[positions], return_index=True)
+            positions = positions[first_positions]
+            mu_vector[self.bound_rows[positions], 0] += duals[self.bound_columns[positions]] / coefficients[positions]
+
+        return mu_vector
+
+    @staticmethod
+    def get_matrix(
+        rows_list: typing.List[np.ndarray],
+        columns_list: typing.List[np.ndarray],
+        values_list: typing.List[np.ndarray],
+        shape: typing.Tuple[int, int],
+    ) -> (sp.csr_matrix, np.ndarray, np.ndarray):
+        """Obtain CSR sparse matrix from given entries, along with the entry values and the slot of each entry in the
+        data array of the matrix. Duplicate entries are summed.
+        """
+
+        # Obtain entries.
+        rows = np.concatenate([np.zeros(0, dtype=int), *rows_list]).astype(np.int64)
+        columns = np.concatenate([np.zeros(0, dtype=int), *columns_list]).astype(np.int64)
+        values = np.concatenate([np.zeros(0, dtype=float), *values_list]).astype(float)
+
+        # Obtain slots based on unique linear index of the entries, which are sorted in row-major order.
+        keys, slots = np.unique(rows * shape[1] + columns, return_inverse=True)
+        slots = slots.ravel()
+
+        # Instantiate matrix.
+        matrix = sp.csr_matrix(
+            (
+                np.bincount(slots, weights=values, minlength=len(keys)),
+                keys % shape[1],
+                np.concatenate([[0], np.cumsum(np.bincount(keys // shape[1], minlength=shape[0]))]),
+            ),
+            shape=shape,
+        )
+
+        return matrix, values, slots
+
+    def get_b_vector(self) -> np.ndarray:
+        """Obtain b vector as sum of constant values and current parameter term values."""
+
+        b_vector = self.b_vector_constant.copy()
+        for terms in self.b_vector_parameter_terms.values():
+            for position, (constraint_start, constraint_stop, *_) in terms:
+                b_vector[constraint_start:constraint_stop, 0] += self.b_vector_parameter_values[position]
+
+        return b_vector
+
+    def get_c_vector(self) -> np.ndarray:
+        """Obtain c vector as sum of constant values and current parameter term values."""
+
+        c_vector = self.c_vector_constant.copy()
+        for terms in self.c_vector_parameter_terms.values():
+            for position, (variable_index, *_) in terms:
+                c_vector[0, variable_index] += self.c_vector_parameter_values[position]
+
+        return c_vector
+
+    @staticmethod
+    def get_a_matrix_term_entries(
+        values: typing.Union[float, np.ndarray, sp.spmatrix],
+        constraint_start: int,
+        constraint_stop: int,
+        variable_index: np.ndarray,
+        factor: float,
+        parameter_name: str,
+        broadcast_len: int,
+    ) -> (np.ndarray, np.ndarray, np.ndarray):
+        """Obtain A matrix entries for given parameter term."""
+
+        if len(np.shape(values)) == 1:
+            values = np.array([values])
+        if len(np.shape(values)) == 0:
+            values = values * sp.eye(len(variable_index))
+        elif broadcast_len > 1:
+            values = OptimizationBlockDiagonalMatrix(values, broadcast_len)
+        rows, columns, values = get_matrix_entries(values)
+
+        return constraint_start + rows, variable_index[columns], factor * values
+
+    @staticmethod
+    def get_b_vector_term_values(
+        values: typing.Union[float, np.ndarray],
+        constraint_start: int,
+        constraint_stop: int,
+        factor: float,
+        parameter_name: str,
+        broadcast_len: int,
+    ) -> np.ndarray:
+        """Obtain b vector values for given parameter term."""
+
+        if len(np.shape(values)) == 0:
+            values = values * np.ones(constraint_stop - constraint_start)
+        elif broadcast_len > 1:
+            values = np.concatenate([values] * broadcast_len, axis=0)
+
+        return (values * factor).ravel()
+
+    @staticmethod
+    def get_c_vector_term_values(
+        values: typing.Union[float, np.ndarray],
+        variable_index: np.ndarray,
+        parameter_name: str,
+        broadcast_len: int,
+    ) -> np.ndarray:
+        """Obtain c vector values for given parameter term."""
+
+        if len(np.shape(values)) == 0:
+            values = values * np.ones(len(variable_index))
+        elif broadcast_len > 1:
+            if len(np.shape(values)) > 1:
+                values = np.concatenate([values] * broadcast_len, axis=1)
+            else:
+                values = np.concatenate([[values]] * broadcast_len, axis=1)
+
+        return np.ravel(values)
+
+    @staticmethod
+    def get_q_matrix_term_entries(
+        values: typing.Union[float, np.ndarray, sp.spmatrix],
+        variable_1_index: np.ndarray,
+        variable_2_index: np.ndarray,
+        parameter_name: str,
+        broadcast_len: int,
+    ) -> (np.ndarray, np.ndarray, np.ndarray):
+        """Obtain Q matrix entries for given parameter term, including the entries of the opposite-diagonal side."""
+
+        if len(np.shape(values)) == 1:
+            values = sp.diags(values)
+        if len(np.shape(values)) == 0:
+            values = values * sp.eye(len(variable_1_index))
+        elif broadcast_len > 1:
+            values = OptimizationBlockDiagonalMatrix(values, broadcast_len)
+        rows, columns, values = get_matrix_entries(values)
+        rows, columns = variable_1_index[rows], variable_2_index[columns]
+
+        return np.concatenate([rows, columns]), np.concatenate([columns, rows]), np.concatenate([values, values])
+
+    @staticmethod
+    def get_d_constant_term_value(values: float, parameter_name: str, broadcast_len: int) -> float:
+        """Obtain d constant value for given parameter term."""
+
+        if broadcast_len > 1:
+            values = values * broadcast_len
+
+        return float(values)
+
+
+def get_key_values(value) -> pd.Index:
+    """Utility function for obtaining the key set values for variable definitions as flat object index.
+
+    - Lists, tuples, numpy arrays, pandas index objects and range objects are interpreted as key sets.
+      Any other value is interpreted as key set with a single value.
+    - Tuple values, e.g., from multi-index key sets, are retained as individual key values. Otherwise, the dtype
+      is inferred from the key values, equivalent to constructing a dataframe from the key value rows.
+    """
+
+    # Obtain key values as list.
+    if type(value) in [pd.MultiIndex, pd.Index, pd.DatetimeIndex, np.ndarray, list, tuple, range]:
+        value = list(value)
+    else:
+        value = [value]
+
+    return pd.Index(value, tupleize_cols=False)
+
+
 class OptimizationProblem(mesmo.utils.ObjectBase):
     r"""Optimization problem object class, which allows the definition and solution of convex optimization problems.
     The optimization problem object serves as a container for the parameters, variables, constraints and objective
@@ -46,6 +814,9 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
             & \boldsymbol{A} \boldsymbol{x} \leq \boldsymbol{b} \quad : \ \boldsymbol{\mu}
         \end{align}
 
+    Equality constraints are retained as native equality rows of :math:`\boldsymbol{A}` and :math:`\boldsymbol{b}`,
+    i.e., these rows are interpreted as :math:`\boldsymbol{A} \boldsymbol{x} = \boldsymbol{b}` by the solver interfaces.
+
     The vectors :math:`\boldsymbol{x}` and :math:`\boldsymbol{\mu}` are the variable vector and
     associated constraint dual variable vector. The matrix :math:`\boldsymbol{A}` defines the linear
     constraint coefficients, whereas the matrix :math:`\boldsymbol{Q}` defines quadradtic objective coefficients.
@@ -113,16 +884,30 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
         This example is also available as standalone script at: ``examples/run_general_optimization_problem.py``
     """
 
-    variables: pd.DataFrame
+    variable_blocks: typing.List[OptimizationVariableBlock]
+    variable_blocks_by_name: typing.Dict[str, typing.List[OptimizationVariableBlock]]
+    variables_len: int
+    variables_dataframe: typing.Optional[pd.DataFrame]
+    variables_results_structures: typing.Optional[dict]
     constraints: pd.DataFrame
     constraints_len: int
-    parameters: dict
+    constraints_results_structures: typing.Optional[dict]
+    equality_constraint_ranges: typing.List[typing.Tuple[int, int]]
+    parameters: OptimizationParameters
     flags: dict
-    a_dict: dict
+    a_matrix_buffer: OptimizationMatrixBuffer
+    a_parameter_terms: typing.List[typing.Tuple[int, int, np.ndarray, float, str, int]]
     b_dict: dict
     c_dict: dict
     q_dict: dict
     d_dict: dict
+    standard_form: typing.Optional[OptimizationStandardForm]
+    gurobi_problem: typing.Optional[typing.Tuple[gp.Model, gp.MVar, gp.MConstr, gp.MQuadExpr]]
+    gurobi_problem_standard_form: typing.Optional[OptimizationStandardForm]
+    gurobi_problem_values: typing.Optional[typing.Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, float]]
+    highs_problem: typing.Optional["highspy.Highs"]
+    highs_problem_standard_form: typing.Optional[OptimizationStandardForm]
+    highs_problem_values: typing.Optional[typing.Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, float]]
     x_vector: np.ndarray
     mu_vector: np.ndarray
     results: dict
@@ -130,29 +915,70 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
     objective: float
 
     def __init__(self):
+        # Instantiate variable registry.
+        # - Variables are stored as blocks of contiguous integer ranges along with their key set factors.
+        # - The variables index set dataframe is only materialized on demand, see :attr:`variables`.
+        self.variable_blocks = list()
+        self.variable_blocks_by_name = collections.defaultdict(list)
+        self.variables_len = 0
+        self.variables_dataframe = None
+
         # Instantiate index sets.
-        # - Variables are instantiated with 'name' and 'timestep' keys, but more may be added in ``define_variable()``.
         # - Constraints are instantiated with 'name', 'timestep' and 'constraint_type' keys,
         #   but more may be added in ``define_constraint()``.
-        self.variables = pd.DataFrame(columns=["name", "timestep", "variable_type"])
         self.constraints = pd.DataFrame(columns=["name", "timestep", "constraint_type"])
         self.constraints_len = 0
 
+        # Instantiate results structures, i.e., per-name vector positions and result dataframe index / columns.
+        # - These are only obtained in ``get_results()`` / ``get_duals()`` and reset upon definition of variables
+        #   or constraints, see ``get_results_structures()``.
+        self.variables_results_structures = None
+        self.constraints_results_structures = None
+
+        # Instantiate equality constraint index ranges.
+        # - Equality constraints are stored as single rows in A matrix / b vector, with their index ranges as
+        #   (start, stop) tuples, whereas all other rows are inequality constraints.
+        self.equality_constraint_ranges = list()
+
         # Instantiate parameters / flags dictionary.
-        self.parameters = dict()
+        # - Parameters dictionary records redefined parameter names, see :class:`OptimizationParameters`.
+        self.parameters = OptimizationParameters()
         self.flags = dict()
 
-        # Instantiate A matrix / b vector / c vector / Q matrix / d constant dictionaries.
+        # Instantiate A matrix buffer / parameter terms.
+        # - Constant A matrix entries are appended directly to the COO buffer upon constraint definition.
+        # - Parameter A matrix entries are stored as terms of constraint index range (start, stop), variable index,
+        #   factor, parameter name and broadcasting dimension length, which are evaluated in ``get_a_matrix()``.
+        self.a_matrix_buffer = OptimizationMatrixBuffer()
+        self.a_parameter_terms = list()
+
+        # Instantiate b vector / c vector / Q matrix / d constant dictionaries.
         # - Final matrix / vector are only created in ``get_a_matrix()``, ``get_b_vector()``, ``get_c_vector()``,
         #   ``get_q_matrix()`` and ``get_d_constant()``.
+        # - The b vector dictionary is keyed by constraint index ranges as (start, stop) tuples.
         # - Uses `defaultdict(list)` to enable more convenient collecting of elements into lists. This avoids
         #   accidental overwriting of dictionary entries.
-        self.a_dict = collections.defaultdict(list)
         self.b_dict = collections.defaultdict(list)
         self.c_dict = collections.defaultdict(list)
         self.q_dict = collections.defaultdict(list)
         self.d_dict = collections.defaultdict(list)
 
+        # Instantiate standard form.
+        # - The standard form is only compiled in ``get_standard_form()`` and reset upon any structural change, i.e.,
+        #   definition of variables, constraints or objective terms. Parameter redefinitions are tracked in the
+        #   parameters dictionary to update the numerical values of the compiled standard form without recompiling.
+        self.standard_form = None
+
+        # Instantiate persistent Gurobi problem, which is reused across solves in ``update_gurobi_problem()``.
+        self.gurobi_problem = None
+        self.gurobi_problem_standard_form = None
+        self.gurobi_problem_values = None
+
+        # Instantiate persistent HiGHS problem, which is reused across solves in ``update_highs_problem()``.
+        self.highs_problem = None
+        self.highs_problem_standard_form = None
+        self.highs_problem_values = None
+
     def define_variable(
         self,
         name: str,
@@ -179,35 +1005,90 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
                 f"Valid variable types are {variable_types}."
             )
 
-        # Obtain new variables based on ``keys``.
+        # Obtain key set factors based on ``keys``.
         # - Variable dimensions are constructed based by taking the product of the given key sets.
-        new_variables = pd.DataFrame(
-            itertools.product(
-                [name],
-                [variable_type],
-                *[
-                    list(value)
-                    if type(value) in [pd.MultiIndex, pd.Index, pd.DatetimeIndex, np.ndarray, list, tuple, range]
-                    else [value]
-                    for value in keys.values()
-                ],
-            ),
-            columns=["name", "variable_type", *keys.keys()],
-        )
-        # Add new variables to index.
-        # - Duplicate definitions are automatically removed.
-        self.variables = pd.concat([self.variables, new_variables], ignore_index=True).drop_duplicates(
-            ignore_index=True
+        keys = {key: get_key_values(value) for key, value in keys.items()}
+        is_product = all(values.is_unique for values in keys.values())
+
+        # Check for duplicate definitions.
+        # - Variable rows can only be duplicates of previously defined variable rows with the same name, variable type
+        #   and key names, because rows of variables with different key names differ in their undefined keys.
+        duplicate_blocks = [
+            block
+            for block in self.variable_blocks_by_name[name]
+            if (block.variable_type == variable_type) and (block.keys.keys() == keys.keys())
+        ]
+        if (len(duplicate_blocks) > 0) or not is_product:
+            # Skip definition, if identical to any previous definition.
+            if is_product and any(
+                block.is_product
+                and (list(block.keys.keys()) == list(keys.keys()))
+                and all(block.keys[key].equals(keys[key]) for key in keys)
+                for block in duplicate_blocks
+            ):
+                return
+
+            # Obtain new variable rows, excluding duplicate definitions.
+            # - Duplicate definitions are automatically removed, retaining the order of the first occurrence.
+            existing_rows = set(row for block in duplicate_blocks for row in block.get_key_rows(keys.keys()))
+            new_rows = list()
+            for row in itertools.product(*keys.values()):
+                if row not in existing_rows:
+                    existing_rows.add(row)
+                    new_rows.append(row)
+            if len(new_rows) == 0:
+                return
+            keys = {
+                key: pd.Index([row[position] for row in new_rows], tupleize_cols=False)
+                for position, key in enumerate(keys)
+            }
+            is_product = False
+
+        # Add new variables to registry.
+        variable_block = OptimizationVariableBlock(
+            name, variable_type, keys, start=self.variables_len, is_product=is_product
         )
+        self.variable_blocks.append(variable_block)
+        self.variable_blocks_by_name[name].append(variable_block)
+        self.variables_len = variable_block.stop
+        self.variables_dataframe = None
+        self.variables_results_structures = None
+        self.standard_form = None
+
+    @property
+    def variables(self) -> pd.DataFrame:
+        """Variables index set, i.e., dataframe with 'name', 'timestep', 'variable_type' and key columns for each
+        entry of the variable vector.
+
+        - The dataframe is materialized lazily from the variable registry and cached until the next variable
+          definition.
+        """
+
+        if self.variables_dataframe is None:
+            self.variables_dataframe = pd.concat(
+                [
+                    pd.DataFrame(columns=["name", "timestep", "variable_type"]),
+                    *[block.get_dataframe() for block in self.variable_blocks],
+                ],
+                ignore_index=True,
+            )
+
+        return self.variables_dataframe
 
-    def define_parameter(self, name: str, value: typing.Union[float, np.ndarray, sp.spmatrix]):
+    def define_parameter(
+        self, name: str, value: typing.Union[float, np.ndarray, sp.spmatrix, OptimizationBlockDiagonalMatrix]
+    ):
         """Define constant parameters with given name and numerical value.
 
-        - Numerical values can be numerical value can be real-valued 1) float, 2) numpy array and
-          3) scipy sparse matrix.
+        - Numerical values can be numerical value can be real-valued 1) float, 2) numpy array,
+          3) scipy sparse matrix and 4) block-diagonal matrix object (see :class:`OptimizationBlockDiagonalMatrix`).
         - Defining parameters is optional. – Numerical values can also be directly passed in the constraints /
           objective definitions. However, using parameters allows updating the numerical values of the problem
           without re-defining the complete problem.
+        - Redefined parameters are applied to the compiled standard form upon the next solve, such that only the
+          affected matrix / vector entries are updated (see :meth:`get_standard_form()`). Parameters can equivalently
+          be redefined via direct assignment, e.g., ``optimization_problem.parameters[name] = value``, but modifying
+          a parameter array in place is not tracked.
         """
 
         # Validate dimensions, if parameter already defined.
@@ -216,6 +1097,7 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
                 ValueError(f"Mismatch of redefined parameter: {name}")
 
         # Set parameter value.
+        # - The parameter name is recorded as redefined by the parameters dictionary.
         self.parameters[name] = value
 
     def define_constraint(
@@ -335,6 +1217,9 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
         if len(variables) == 0:
             raise ValueError(f"Cannot define constraint without variables.")
 
+        # Reset standard form, as the problem structure is modified.
+        self.standard_form = None
+
         # Run checks for constraint index keys.
         if keys is not None:
             # Raise error if ``keys`` is not a dictionary.
@@ -354,30 +1239,12 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
             elif type(broadcast) not in [list, tuple]:
                 raise ValueError(f"Invalid type of broadcast argument: {type(broadcast)}")
 
-        # For equality constraint, define separate upper / lower inequality.
-        if operator in ["=="]:
-            # Define upper inequality.
-            self.define_constraint_low_level(
-                variables,
-                ">=",
-                constants,
-                keys=dict(keys, constraint_type="==>=") if keys is not None else None,
-                broadcast=broadcast,
-            )
-
-            # Define lower inequality.
-            self.define_constraint_low_level(
-                variables,
-                "<=",
-                constants,
-                keys=dict(keys, constraint_type="==<=") if keys is not None else None,
-                broadcast=broadcast,
-            )
-
-        # For inequality constraint, add into A matrix / b vector dictionaries.
-        elif operator in ["<=", ">="]:
-            # If greater-than-equal, invert signs.
-            if operator == ">=":
+        # Add constraint into A matrix / b vector dictionaries.
+        if operator in ["==", "<=", ">="]:
+            # If greater-than-equal or equality, invert signs.
+            # - Equality constraints are defined with inverted signs, such that their duals follow the convention
+            #   of greater-than-equal constraints.
+            if operator in [">=", "=="]:
                 operator_factor = -1.0
             else:
                 operator_factor = 1.0
@@ -394,7 +1261,7 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
                             continue  # Skip variable & go to next iteration.
 
                 # Obtain variable integer index & raise error if variable or key does not exist.
-                variable_index = tuple(self.get_variable_index(**variable_keys, raise_empty_index_error=True))
+                variable_index = self.get_variable_index(**variable_keys, raise_empty_index_error=True)
 
                 # Obtain broadcast dimension length for variable.
                 if broadcast is not None:
@@ -420,30 +1287,39 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
                 if len(np.shape(variable_value)) == 0:
                     variable_value = variable_value * sp.eye(len(variable_index))
                 # If broadcasting, value is repeated in block-diagonal matrix.
+                # - The block-diagonal matrix object retains only a single block, such that the repeated entries
+                #   are only obtained upon compilation of the standard form.
                 elif broadcast_len > 1:
-                    if type(variable_value) is np.matrix:
-                        variable_value = np.array(variable_value)
-                    variable_value = sp.block_diag([variable_value] * broadcast_len)
+                    variable_value = OptimizationBlockDiagonalMatrix(variable_value, broadcast_len)
 
                 # If not yet defined, obtain constraint index based on dimension of first variable.
                 if constraint_index is None:
-                    constraint_index = tuple(
-                        range(self.constraints_len, self.constraints_len + np.shape(variable_value)[0])
-                    )
+                    constraint_index = range(self.constraints_len, self.constraints_len + np.shape(variable_value)[0])
 
                 # Raise error if variable dimensions are inconsistent.
                 if np.shape(variable_value) != (len(constraint_index), len(variable_index)):
                     raise ValueError(f"Dimension mismatch at variable: \n{variable_keys}")
 
                 # Append A matrix entry.
-                # - If parameter, pass tuple of factor, parameter name and broadcasting dimension length.
+                # - If parameter, append term of constraint index range, variable index, factor, parameter name and
+                #   broadcasting dimension length.
                 if parameter_name is None:
-                    self.a_dict[constraint_index, variable_index].append(
-                        operator_factor * variable_factor * variable_value
+                    rows, columns, values = get_matrix_entries(variable_value)
+                    self.a_matrix_buffer.append(
+                        constraint_index.start + rows,
+                        variable_index[columns],
+                        operator_factor * variable_factor * values,
                     )
                 else:
-                    self.a_dict[constraint_index, variable_index].append(
-                        (operator_factor * variable_factor, parameter_name, broadcast_len)
+                    self.a_parameter_terms.append(
+                        (
+                            constraint_index.start,
+                            constraint_index.stop,
+                            variable_index,
+                            operator_factor * variable_factor,
+                            parameter_name,
+                            broadcast_len,
+                        )
                     )
 
             # Process constants.
@@ -483,7 +1359,7 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
 
                 # If not yet defined, obtain constraint index based on dimension of first constant.
                 if constraint_index is None:
-                    constraint_index = tuple(range(self.constraints_len, self.constraints_len + len(constant_value)))
+                    constraint_index = range(self.constraints_len, self.constraints_len + len(constant_value))
 
                 # Raise error if constant dimensions are inconsistent.
                 if len(constant_value) != len(constraint_index):
@@ -491,20 +1367,22 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
 
                 # Append b vector entry.
                 if parameter_name is None:
-                    self.b_dict[constraint_index].append(operator_factor * constant_factor * constant_value)
+                    self.b_dict[constraint_index.start, constraint_index.stop].append(
+                        operator_factor * constant_factor * constant_value
+                    )
                 else:
-                    self.b_dict[constraint_index].append(
+                    self.b_dict[constraint_index.start, constraint_index.stop].append(
                         (operator_factor * constant_factor, parameter_name, broadcast_len)
                     )
 
+            # Append equality constraint index range.
+            if operator == "==":
+                self.equality_constraint_ranges.append((constraint_index.start, constraint_index.stop))
+
             # Append constraints index entries.
             if keys is not None:
-                # Set constraint type:
-                if "constraint_type" in keys.keys():
-                    if keys["constraint_type"] not in ("==>=", "==<="):
-                        keys["constraint_type"] = operator
-                else:
-                    keys["constraint_type"] = operator
+                # Set constraint type.
+                keys = dict(keys, constraint_type=operator)
                 # Obtain new constraints based on ``keys``.
                 # - Constraint dimensions are constructed based by taking the product of the given key sets.
                 new_constraints = pd.DataFrame(
@@ -528,6 +1406,7 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
                 new_constraints.index = constraint_index
                 self.constraints = pd.concat([self.constraints, new_constraints])
                 self.constraints_len += len(constraint_index)
+                self.constraints_results_structures = None
             else:
                 # Only change constraints size, if no ``keys`` defined.
                 # - This is for speedup, as updating the constraints index set with above operation is slow.
@@ -615,6 +1494,9 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
             elif type(broadcast) not in [list, tuple]:
                 raise ValueError(f"Invalid type of broadcast argument: {type(broadcast)}")
 
+        # Reset standard form, as the problem structure is modified.
+        self.standard_form = None
+
         # Process variables.
         for variable_value, variable_keys in variables:
             # If any variable key values are empty, ignore variable & do not add any c vector entry.
@@ -714,10 +1596,8 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
             if len(np.shape(variable_value)) == 0:
                 variable_value = variable_value * sp.eye(len(variable_1_index))
             # If broadcasting, values are repeated along broadcast dimension.
-            else:
-                if type(variable_value) is np.matrix:
-                    variable_value = np.array(variable_value)
-                variable_value = sp.block_diag([variable_value] * broadcast_len)
+            elif broadcast_len > 1:
+                variable_value = OptimizationBlockDiagonalMatrix(variable_value, broadcast_len)
 
             # Raise error if variable dimensions are inconsistent.
             if np.shape(variable_value)[0] != len(variable_1_index):
@@ -773,10 +1653,65 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
             else:
                 self.d_dict[0].append((parameter_name, broadcast_len))
 
-    def get_variable_index(self, name: str, raise_empty_index_error: bool = False, **keys):
-        """Utility method for obtaining a variable integer index vector for given variable name / keys."""
+    def get_variable_index(self, name: str, raise_empty_index_error: bool = False, **keys) -> np.ndarray:
+        """Utility method for obtaining a variable integer index vector for given variable name / keys.
 
-        return mesmo.utils.get_index(self.variables, name=name, **keys, raise_empty_index_error=raise_empty_index_error)
+        - The index is obtained by direct lookup in the variable registry, such that the lookup scales with the
+          key set dimensions of the given variable rather than with the total number of variables. The result is
+          identical to :func:`mesmo.utils.get_index` for the :attr:`variables` index set.
+        """
+
+        # Obtain key values as lists, equivalent to `mesmo.utils.get_index()`.
+        keys = dict(name=name, **keys)
+        for key, values in keys.items():
+            if isinstance(values, list):
+                pass
+            elif isinstance(values, tuple):
+                # If values are passed as tuple, wrap in list, but only if key values are tuples.
+                # Otherwise, convert to list.
+                if isinstance(self.get_variable_key_value_example(key), tuple):
+                    keys[key] = [values]
+                else:
+                    keys[key] = list(values)
+            elif isinstance(values, range):
+                keys[key] = list(values)
+            elif isinstance(values, np.ndarray):
+                values = values.tolist()
+                keys[key] = [values] if not isinstance(values, list) else values
+            elif isinstance(values, pd.Index):
+                keys[key] = values.to_list()
+            else:
+                keys[key] = [values]
+
+        # Obtain variable blocks for given names.
+        names = keys.pop("name")
+        if len(names) == 1:
+            variable_blocks = self.variable_blocks_by_name.get(names[0], [])
+        else:
+            variable_blocks = [block for block in self.variable_blocks if pd.Index([block.name]).isin(names)[0]]
+
+        # Obtain integer index array.
+        index = np.concatenate([np.array([], dtype=int), *[block.get_index(**keys) for block in variable_blocks]])
+
+        # Assert that index is not empty.
+        if raise_empty_index_error:
+            if not (len(index) > 0):
+                raise ValueError(f"Empty index returned for: {dict(name=name, **keys)}")
+
+        return index
+
+    def get_variable_key_value_example(self, key: str):
+        """Utility method for obtaining the first defined value of given variable key, e.g., for type checks."""
+
+        if key == "name":
+            return self.variable_blocks[0].name if len(self.variable_blocks) > 0 else None
+        for block in self.variable_blocks:
+            if key in block.keys:
+                values = block.keys[key][pd.notnull(block.keys[key])]
+                if len(values) > 0:
+                    return values[0]
+
+        return None
 
     def get_variable_keys(self, name: str, **keys):
         """Utility method for obtaining a variable key dataframe for given variable name / keys.
@@ -787,192 +1722,87 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
 
         return self.variables.loc[self.get_variable_index(name, **keys)].dropna(axis="columns", how="all")
 
-    def get_a_matrix(self) -> sp.csr_matrix:
-        r"""Obtain :math:`\boldsymbol{A}` matrix for the standard-form problem (see :class:`OptimizationProblem`)."""
-
-        # Log time.
-        mesmo.utils.log_time("get optimization problem A matrix", logger_object=logger)
+    def save(self, path: pathlib.Path):
+        """Store optimization problem to pickle binary file (PKL) at given path, e.g., for reuse via :meth:`load()`.
 
-        # Instantiate collections.
-        values_list = list()
-        rows_list = list()
-        columns_list = list()
+        - The problem definition is stored along with the compiled standard form and parameter values, such that
+          the loaded problem only requires redefinition of parameters with updated values.
+        - Persistent solver problems and solution values are not stored.
+        """
 
-        # Collect matrix entries.
-        for constraint_index, variable_index in self.a_dict:
-            for values in self.a_dict[constraint_index, variable_index]:
-                # If value is tuple, treat as parameter.
-                if type(values) is tuple:
-                    factor, parameter_name, broadcast_len = values
-                    values = self.parameters[parameter_name]
-                    if len(np.shape(values)) == 1:
-                        values = np.array([values])
-                    if len(np.shape(values)) == 0:
-                        values = values * sp.eye(len(variable_index))
-                    elif broadcast_len > 1:
-                        if type(values) is np.matrix:
-                            values = np.array(values)
-                        values = sp.block_diag([values] * broadcast_len)
-                    values = values * factor
-                # Obtain row index, column index and values for entry in A matrix.
-                rows, columns, values = sp.find(values)
-                rows = np.array(constraint_index)[rows]
-                columns = np.array(variable_index)[columns]
-                # Insert entry in collections.
-                values_list.append(values)
-                rows_list.append(rows)
-                columns_list.append(columns)
+        # Obtain attributes, excluding persistent solver problems and solution values.
+        attributes = {
+            attribute_name: value
+            for attribute_name, value in vars(self).items()
+            if not attribute_name.startswith(("gurobi_problem", "highs_problem"))
+            and attribute_name not in ["x_vector", "mu_vector", "results", "duals", "objective"]
+        }
 
-        # Instantiate A matrix.
-        a_matrix = sp.coo_matrix(
-            (np.concatenate(values_list), (np.concatenate(rows_list), np.concatenate(columns_list))),
-            shape=(self.constraints_len, len(self.variables)),
-        ).tocsr()
+        # Store attributes to pickle binary file.
+        with open(path, "wb") as output_file:
+            pickle.dump(attributes, output_file, pickle.HIGHEST_PROTOCOL)
 
-        # Log time.
-        mesmo.utils.log_time("get optimization problem A matrix", logger_object=logger)
+    @classmethod
+    def load(cls, path: pathlib.Path) -> "OptimizationProblem":
+        """Load optimization problem from pickle binary file (PKL) at given path, which has been stored via
+        :meth:`save()`.
+        """
 
-        return a_matrix
+        # Load attributes from pickle binary file.
+        with open(path, "rb") as input_file:
+            attributes = pickle.load(input_file)
 
-    def get_b_vector(self) -> np.ndarray:
-        r"""Obtain :math:`\boldsymbol{b}` vector for the standard-form problem (see :class:`OptimizationProblem`)."""
+        # Instantiate optimization problem and set attribute values.
+        optimization_problem = cls()
+        for attribute_name, value in attributes.items():
+            optimization_problem.__setattr__(attribute_name, value)
 
-        # Log time.
-        mesmo.utils.log_time("get optimization problem b vector", logger_object=logger)
+        return optimization_problem
 
-        # Instantiate array.
-        b_vector = np.zeros((self.constraints_len, 1))
+    def get_standard_form(self) -> OptimizationStandardForm:
+        """Obtain compiled standard-form problem (see :class:`OptimizationStandardForm`).
 
-        # Fill vector entries.
-        for constraint_index in self.b_dict:
-            for values in self.b_dict[constraint_index]:
-                # If value is tuple, treat as parameter.
-                if type(values) is tuple:
-                    factor, parameter_name, broadcast_len = values
-                    values = self.parameters[parameter_name]
-                    if len(np.shape(values)) == 0:
-                        values = values * np.ones(len(constraint_index))
-                    elif broadcast_len > 1:
-                        values = np.concatenate([values] * broadcast_len, axis=0)
-                    values = values * factor
-                # Insert entry in b vector.
-                b_vector[constraint_index, 0] += values.ravel()
+        - The standard form is compiled upon first call and retained until the problem structure is modified.
+        - Parameters which have been redefined since the previous call are applied to the existing standard form
+          via :meth:`OptimizationStandardForm.update_parameters()`, i.e., without recompiling the problem.
+        """
 
-        # Log time.
-        mesmo.utils.log_time("get optimization problem b vector", logger_object=logger)
+        # Compile standard form, if not yet compiled or if parameters cannot be updated in place.
+        if (self.standard_form is None) or not self.standard_form.update_parameters(
+            self.parameters, self.parameters.redefined_names
+        ):
+            # Log time.
+            mesmo.utils.log_time("compile optimization problem standard form", logger_object=logger)
+            self.standard_form = OptimizationStandardForm(self)
+            mesmo.utils.log_time("compile optimization problem standard form", logger_object=logger)
+        self.parameters.redefined_names = set()
 
-        return b_vector
+        return self.standard_form
 
-    def get_c_vector(self) -> np.ndarray:
-        r"""Obtain :math:`\boldsymbol{c}` vector for the standard-form problem (see :class:`OptimizationProblem`)."""
+    def get_a_matrix(self) -> sp.csr_matrix:
+        r"""Obtain :math:`\boldsymbol{A}` matrix for the standard-form problem (see :class:`OptimizationProblem`)."""
 
-        # Log time.
-        mesmo.utils.log_time("get optimization problem c vector", logger_object=logger)
+        return self.get_standard_form().a_matrix.copy()
 
-        # Instantiate array.
-        c_vector = np.zeros((1, len(self.variables)))
+    def get_b_vector(self) -> np.ndarray:
+        r"""Obtain :math:`\boldsymbol{b}` vector for the standard-form problem (see :class:`OptimizationProblem`)."""
 
-        # Fill vector entries.
-        for variable_index in self.c_dict:
-            for values in self.c_dict[variable_index]:
-                # If value is tuple, treat as parameter.
-                if type(values) is tuple:
-                    parameter_name, broadcast_len = values
-                    values = self.parameters[parameter_name]
-                    if len(np.shape(values)) == 0:
-                        values = values * np.ones(len(variable_index))
-                    elif broadcast_len > 1:
-                        if len(np.shape(values)) > 1:
-                            values = np.concatenate([values] * broadcast_len, axis=1)
-                        else:
-                            values = np.concatenate([[values]] * broadcast_len, axis=1)
-                # Insert entry in c vector.
-                c_vector[0, variable_index] += values.ravel()
+        return self.get_standard_form().b_vector.copy()
 
-        # Log time.
-        mesmo.utils.log_time("get optimization problem c vector", logger_object=logger)
+    def get_c_vector(self) -> np.ndarray:
+        r"""Obtain :math:`\boldsymbol{c}` vector for the standard-form problem (see :class:`OptimizationProblem`)."""
 
-        return c_vector
+        return self.get_standard_form().c_vector.copy()
 
     def get_q_matrix(self) -> sp.spmatrix:
         r"""Obtain :math:`\boldsymbol{Q}` matrix for the standard-form problem (see :class:`OptimizationProblem`)."""
 
-        # Log time.
-        mesmo.utils.log_time("get optimization problem Q matrix", logger_object=logger)
-
-        # Instantiate collections.
-        values_list = list()
-        rows_list = list()
-        columns_list = list()
-
-        # Collect matrix entries.
-        for variable_1_index, variable_2_index in self.q_dict:
-            for values in self.q_dict[variable_1_index, variable_2_index]:
-                # If value is tuple, treat as parameter.
-                if type(values) is tuple:
-                    parameter_name, broadcast_len = values
-                    values = self.parameters[parameter_name]
-                    if len(np.shape(values)) == 1:
-                        values = sp.diags(values)
-                    if len(np.shape(values)) == 0:
-                        values = values * sp.eye(len(variable_1_index))
-                    elif broadcast_len > 1:
-                        if type(values) is np.matrix:
-                            values = np.array(values)
-                        values = sp.block_diag([values] * broadcast_len)
-                # Obtain row index, column index and values for entry in Q matrix.
-                rows, columns, values = sp.find(values)
-                rows = np.array(variable_1_index)[rows]
-                columns = np.array(variable_2_index)[columns]
-                # Insert entries in collections.
-                values_list.append(values)
-                rows_list.append(rows)
-                columns_list.append(columns)
-                # Insert entries for opposite-diagonal side in collections.
-                # - Terms need to be added on both off-diagonal sides of Q for symmetry.
-                values_list.append(values)
-                rows_list.append(columns)
-                columns_list.append(rows)
-
-        # Instantiate Q matrix.
-        q_matrix = (
-            sp.coo_matrix(
-                (np.concatenate(values_list), (np.concatenate(rows_list), np.concatenate(columns_list))),
-                shape=(len(self.variables), len(self.variables)),
-            ).tocsr()
-            if len(self.q_dict) > 0
-            else sp.csr_matrix((len(self.variables), len(self.variables)))
-        )
-
-        # Log time.
-        mesmo.utils.log_time("get optimization problem Q matrix", logger_object=logger)
-
-        return q_matrix
+        return self.get_standard_form().q_matrix.copy()
 
     def get_d_constant(self) -> float:
         r"""Obtain :math:`d` value for the standard-form problem (see :class:`OptimizationProblem`)."""
 
-        # Log time.
-        mesmo.utils.log_time("get optimization problem d constant", logger_object=logger)
-
-        # Instantiate array.
-        d_constant = 0.0
-
-        # Fill vector entries.
-        for values in self.d_dict[0]:
-            # If value is tuple, treat as parameter.
-            if type(values) is tuple:
-                parameter_name, broadcast_len = values
-                values = self.parameters[parameter_name]
-                if broadcast_len > 1:
-                    values = values * broadcast_len
-            # Insert entry to d constant.
-            d_constant += float(values)
-
-        # Log time.
-        mesmo.utils.log_time("get optimization problem d constant", logger_object=logger)
-
-        return d_constant
+        return self.get_standard_form().d_constant
 
     def solve(self):
         r"""Solve the optimization problem.
@@ -990,11 +1820,13 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
 
         The default workflow of the solve method is as follows:
 
-        1. Obtain problem definition through selected solver interface via :meth:`get_cvxpy_problem()` or
-           :meth:`get_gurobi_problem()`. Note that this step is skipped for HiGHS, as there is currently no native
-           Python interface for HiGHS and hence no persistent problem object.
+        1. Obtain problem definition through selected solver interface via :meth:`get_cvxpy_problem()`,
+           :meth:`update_highs_problem()` or :meth:`update_gurobi_problem()`. For HiGHS and Gurobi, the problem object
+           of the previous solve is reused, if only parameters have been redefined since. Note that this step is
+           skipped for HiGHS, if the HiGHS Python interface `highspy` is not installed.
         2. Solve optimization problem and obtain standard-form results via :meth:`solve_highs()`, :meth:`solve_cvxpy()`
-           or :meth:`solve_gurobi()`. The standard-form results include the 1) :math:`\boldsymbol{x}` variable vector
+           or :meth:`solve_gurobi()`. If `highspy` is not installed, HiGHS is invoked via :meth:`solve_highs_binary()`
+           instead. The standard-form results include the 1) :math:`\boldsymbol{x}` variable vector
            value, 2) :math:`\boldsymbol{\mu}` dual vector value and 3) objective value, which are stored into the
            object attributes :attr:`x_vector`, :attr:`mu_vector` and :attr:`objective`.
         3. Obtain results with respect to the original problem formulation via :meth:`get_results()` and
@@ -1020,7 +1852,7 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
         logger.debug(
             f"Solver name: {mesmo.config.config['optimization']['solver_name']};"
             f" Solver interface: {mesmo.config.config['optimization']['solver_interface']};"
-            f" Problem statistics: {len(self.variables)} variables, {self.constraints_len} constraints"
+            f" Problem statistics: {self.variables_len} variables, {self.constraints_len} constraints"
         )
 
         # Use CVXPY solver interface, if selected.
@@ -1029,9 +1861,12 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
         # Use direct solver interfaces, if selected.
         elif mesmo.config.config["optimization"]["solver_interface"] == "direct":
             if mesmo.config.config["optimization"]["solver_name"] == "gurobi":
-                self.solve_gurobi(*self.get_gurobi_problem())
+                self.solve_gurobi(*self.update_gurobi_problem())
             elif mesmo.config.config["optimization"]["solver_name"] == "highs":
-                self.solve_highs()
+                if highspy is not None:
+                    self.solve_highs(self.update_highs_problem())
+                else:
+                    self.solve_highs_binary()
             # If no direct solver interface found, fall back to CVXPY interface.
             else:
                 logger.debug(
@@ -1070,11 +1905,16 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
         for key, value in mesmo.config.solver_parameters.items():
             gurobipy_problem.setParam(key, value)
 
+        # Obtain standard form.
+        standard_form = self.get_standard_form()
+
         # Define variables.
         # - Need to express vectors as 1-D arrays to enable matrix multiplication in constraints (gurobipy limitation).
-        # - Lower bound defaults to 0 and needs to be explicitly overwritten.
+        # - Bounds are obtained from the bound rows of the standard form. Lower bound defaults to 0 and therefore
+        #   is explicitly defined for all variables.
+        lower_bounds, upper_bounds = standard_form.get_bounds()
         x_vector = gurobipy_problem.addMVar(
-            shape=(len(self.variables),), lb=-np.inf, ub=np.inf, vtype=gp.GRB.CONTINUOUS, name="x_vector"
+            shape=(self.variables_len,), lb=lower_bounds, ub=upper_bounds, vtype=gp.GRB.CONTINUOUS, name="x_vector"
         )
         if (self.variables.loc[:, "variable_type"] == "integer").any():
             x_vector[self.variables.loc[:, "variable_type"] == "integer"].setAttr("vtype", gp.GRB.INTEGER)
@@ -1082,21 +1922,100 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
             x_vector[self.variables.loc[:, "variable_type"] == "binary"].setAttr("vtype", gp.GRB.BINARY)
 
         # Define constraints.
+        # - Bound rows are not included, as these are defined as variable bounds.
         # - 1-D arrays are interpreted as column vectors (n, 1) (based on gurobipy convention).
-        constraints = self.get_a_matrix() @ x_vector <= self.get_b_vector().ravel()
-        constraints = gurobipy_problem.addConstr(constraints, name="constraints")
+        # - Equality rows are defined with sense "=", all other rows with sense "<".
+        constraints = gurobipy_problem.addMConstr(
+            standard_form.get_a_matrix_reduced(),
+            x_vector,
+            np.where(standard_form.is_equality[standard_form.constraint_rows], gp.GRB.EQUAL, gp.GRB.LESS_EQUAL),
+            standard_form.get_b_vector_reduced().ravel(),
+            name="constraints",
+        )
 
         # Define objective.
         # - 1-D arrays are interpreted as column vectors (n, 1) (based on gurobipy convention).
         objective = (
-            self.get_c_vector().ravel() @ x_vector
-            + x_vector @ (0.5 * self.get_q_matrix()) @ x_vector
-            + self.get_d_constant()
+            standard_form.c_vector.ravel() @ x_vector
+            + x_vector @ (0.5 * standard_form.q_matrix) @ x_vector
+            + standard_form.d_constant
         )
         gurobipy_problem.setObjective(objective, gp.GRB.MINIMIZE)
 
         return (gurobipy_problem, x_vector, constraints, objective)
 
+    def update_gurobi_problem(self) -> (gp.Model, gp.MVar, gp.MConstr, gp.MQuadExpr):
+        """Obtain standard-form problem via Gurobi direct interface, reusing the Gurobi model of the previous call.
+
+        - If only parameters have been redefined since the previous call, the existing Gurobi model is modified in
+          place, i.e., changed constraint coefficients are updated via ``chgCoeff``, the right-hand side is updated
+          via the ``RHS`` attribute and the objective is only redefined if changed. This retains the solver state
+          for warm starts.
+        - If the problem structure has been modified, a new Gurobi model is defined via :meth:`get_gurobi_problem()`.
+        """
+
+        # Obtain standard form.
+        standard_form = self.get_standard_form()
+
+        # Define new Gurobi problem, if not yet defined or if the standard form has been recompiled.
+        if (self.gurobi_problem is None) or (self.gurobi_problem_standard_form is not standard_form):
+            self.gurobi_problem = self.get_gurobi_problem()
+            self.gurobi_problem_standard_form = standard_form
+        else:
+            gurobipy_problem, x_vector, constraints, objective = self.gurobi_problem
+            a_matrix_data, b_vector, c_vector, q_matrix_data, d_constant = self.gurobi_problem_values
+
+            # Update changed constraint coefficients.
+            # - Slots are obtained with respect to the reduced A matrix, i.e., without bound rows.
+            a_matrix_reduced = standard_form.get_a_matrix_reduced()
+            slots = np.flatnonzero(a_matrix_reduced.data != a_matrix_data[standard_form.constraint_slots])
+            if len(slots) > 0:
+                rows = np.repeat(np.arange(a_matrix_reduced.shape[0]), np.diff(a_matrix_reduced.indptr))
+                constraints_list = constraints.tolist()
+                x_vector_list = x_vector.tolist()
+                for row, column, value in zip(
+                    rows[slots], a_matrix_reduced.indices[slots], a_matrix_reduced.data[slots]
+                ):
+                    gurobipy_problem.chgCoeff(constraints_list[row], x_vector_list[column], value)
+
+            # Update right-hand side and variable bounds.
+            if not np.array_equal(standard_form.b_vector, b_vector):
+                constraints.setAttr("RHS", standard_form.get_b_vector_reduced().ravel())
+            if not (
+                np.array_equal(standard_form.b_vector, b_vector)
+                and np.array_equal(
+                    standard_form.a_matrix.data[standard_form.bound_slots], a_matrix_data[standard_form.bound_slots]
+                )
+            ):
+                lower_bounds, upper_bounds = standard_form.get_bounds()
+                x_vector.setAttr("LB", lower_bounds)
+                x_vector.setAttr("UB", upper_bounds)
+
+            # Update objective, if changed.
+            if not (
+                np.array_equal(standard_form.c_vector, c_vector)
+                and np.array_equal(standard_form.q_matrix.data, q_matrix_data)
+                and (standard_form.d_constant == d_constant)
+            ):
+                objective = (
+                    standard_form.c_vector.ravel() @ x_vector
+                    + x_vector @ (0.5 * standard_form.q_matrix) @ x_vector
+                    + standard_form.d_constant
+                )
+                gurobipy_problem.setObjective(objective, gp.GRB.MINIMIZE)
+                self.gurobi_problem = (gurobipy_problem, x_vector, constraints, objective)
+
+        # Store values of the Gurobi problem for comparison in the next call.
+        self.gurobi_problem_values = (
+            standard_form.a_matrix.data.copy(),
+            standard_form.b_vector.copy(),
+            standard_form.c_vector.copy(),
+            standard_form.q_matrix.data.copy(),
+            standard_form.d_constant,
+        )
+
+        return self.gurobi_problem
+
     def solve_gurobi(
         self, gurobipy_problem: gp.Model, x_vector: gp.MVar, constraints: gp.MConstr, objective: gp.MQuadExpr
     ) -> gp.Model:
@@ -1121,13 +2040,20 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
             logger.warning(f"Gurobi exited with non-optimal solution status: {status}")
 
         # Store results.
+        # - If bound rows have been defined as variable bounds, i.e., if constraints do not cover all constraint rows,
+        #   duals of the bound rows are obtained from the reduced costs.
         self.x_vector = np.transpose([x_vector.getAttr("x")])
         if (
             (gurobipy_problem.getAttr("NumQCNZs") == 0)
             and not ((self.variables.loc[:, "variable_type"] == "integer").any())
             and not ((self.variables.loc[:, "variable_type"] == "binary").any())
         ):
-            self.mu_vector = np.transpose([constraints.getAttr("Pi")])
+            if constraints.shape[0] == self.constraints_len:
+                self.mu_vector = np.transpose([constraints.getAttr("Pi")])
+            else:
+                self.mu_vector = self.get_standard_form().get_mu_vector(
+                    constraints.getAttr("Pi"), x_vector.getAttr("RC")
+                )
         else:
             # Duals are not retrieved if quadratic or SOC constraints have been added to the model.
             logger.warning(
@@ -1136,13 +2062,206 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
                 f" or quadratic / SOC constraints have been added to the problem."
                 f"\nPlease retrieve the duals manually."
             )
-            self.mu_vector = np.nan * np.zeros(constraints.shape)
+            self.mu_vector = np.nan * np.zeros((self.constraints_len, 1))
         self.objective = float(objective.getValue())
 
         return gurobipy_problem
 
-    def solve_highs(self):
-        """Solve optimization problem via HiGHS solver interface."""
+    def get_highs_problem(self) -> "highspy.Highs":
+        """Obtain standard-form problem via HiGHS Python interface."""
+
+        # Obtain standard form.
+        standard_form = self.get_standard_form()
+
+        # Instantiate HiGHS problem.
+        highs_problem = highspy.Highs()
+        # Set solver parameters.
+        highs_problem.setOptionValue("output_flag", bool(mesmo.config.config["optimization"]["show_solver_output"]))
+        for key, value in mesmo.config.solver_parameters.items():
+            highs_problem.setOptionValue(key, value)
+
+        # Define variables, constraints and linear objective.
+        # - Constraints are defined as row-wise matrix with row upper bounds, i.e., based on the CSR format of A.
+        # - Equality rows are defined with row lower bounds equal to row upper bounds.
+        # - Bound rows are not included in the constraints, as these are defined as variable bounds.
+        a_matrix_reduced = standard_form.get_a_matrix_reduced()
+        highs_lp = highspy.HighsLp()
+        highs_lp.num_col_ = self.variables_len
+        highs_lp.num_row_ = a_matrix_reduced.shape[0]
+        highs_lp.col_cost_ = standard_form.c_vector.ravel()
+        highs_lp.col_lower_, highs_lp.col_upper_ = self.get_highs_bounds(standard_form)
+        highs_lp.row_lower_, highs_lp.row_upper_ = self.get_highs_row_bounds(standard_form)
+        highs_lp.offset_ = standard_form.d_constant
+        highs_lp.a_matrix_.format_ = highspy.MatrixFormat.kRowwise
+        highs_lp.a_matrix_.start_ = a_matrix_reduced.indptr
+        highs_lp.a_matrix_.index_ = a_matrix_reduced.indices
+        highs_lp.a_matrix_.value_ = a_matrix_reduced.data
+        # Define integer / binary variables.
+        # - Binary variables are defined as integer variables with bounds [0, 1], see ``get_highs_bounds()``.
+        variable_types = self.variables.loc[:, "variable_type"]
+        if variable_types.isin(["integer", "binary"]).any():
+            highs_lp.integrality_ = [
+                highspy.HighsVarType.kInteger if is_integer else highspy.HighsVarType.kContinuous
+                for is_integer in variable_types.isin(["integer", "binary"])
+            ]
+        highs_model = highspy.HighsModel()
+        highs_model.lp_ = highs_lp
+
+        # Define quadratic objective.
+        # - HiGHS expects the lower triangular part of the Hessian in column-wise format.
+        if standard_form.q_matrix.nnz > 0:
+            highs_model.hessian_ = self.get_highs_hessian(standard_form.q_matrix)
+
+        # Pass model to HiGHS.
+        highs_problem.passModel(highs_model)
+
+        return highs_problem
+
+    def get_highs_bounds(self, standard_form: OptimizationStandardForm) -> (np.ndarray, np.ndarray):
+        """Obtain lower / upper variable bounds for HiGHS, where binary variables are limited to [0, 1]."""
+
+        lower_bounds, upper_bounds = standard_form.get_bounds()
+        if (self.variables.loc[:, "variable_type"] == "binary").any():
+            is_binary = (self.variables.loc[:, "variable_type"] == "binary").values
+            lower_bounds[is_binary] = np.maximum(lower_bounds[is_binary], 0.0)
+            upper_bounds[is_binary] = np.minimum(upper_bounds[is_binary], 1.0)
+
+        return lower_bounds, upper_bounds
+
+    @staticmethod
+    def get_highs_row_bounds(standard_form: OptimizationStandardForm) -> (np.ndarray, np.ndarray):
+        """Obtain lower / upper row bounds for HiGHS, where equality rows are bounded from below and above."""
+
+        row_upper_bounds = standard_form.get_b_vector_reduced().ravel()
+        row_lower_bounds = np.where(
+            standard_form.is_equality[standard_form.constraint_rows], row_upper_bounds, -highspy.kHighsInf
+        )
+
+        return row_lower_bounds, row_upper_bounds
+
+    @staticmethod
+    def get_highs_hessian(q_matrix: sp.csr_matrix) -> "highspy.HighsHessian":
+        r"""Obtain HiGHS Hessian object for given :math:`\boldsymbol{Q}` matrix."""
+
+        q_matrix = sp.tril(q_matrix).tocsc()
+        highs_hessian = highspy.HighsHessian()
+        highs_hessian.dim_ = q_matrix.shape[0]
+        highs_hessian.format_ = highspy.HessianFormat.kTriangular
+        highs_hessian.start_ = q_matrix.indptr
+        highs_hessian.index_ = q_matrix.indices
+        highs_hessian.value_ = q_matrix.data
+
+        return highs_hessian
+
+    def update_highs_problem(self) -> "highspy.Highs":
+        """Obtain standard-form problem via HiGHS Python interface, reusing the HiGHS problem of the previous call.
+
+        - If only parameters have been redefined since the previous call, the existing HiGHS problem is modified in
+          place, i.e., changed constraint coefficients, row bounds, costs, objective offset and Hessian are updated.
+          This retains the solver state, e.g. the simplex basis, for warm starts.
+        - If the problem structure has been modified, a new HiGHS problem is defined via :meth:`get_highs_problem()`.
+        """
+
+        # Obtain standard form.
+        standard_form = self.get_standard_form()
+
+        # Define new HiGHS problem, if not yet defined or if the standard form has been recompiled.
+        if (self.highs_problem is None) or (self.highs_problem_standard_form is not standard_form):
+            self.highs_problem = self.get_highs_problem()
+            self.highs_problem_standard_form = standard_form
+        else:
+            highs_problem = self.highs_problem
+            a_matrix_data, b_vector, c_vector, q_matrix_data, d_constant = self.highs_problem_values
+
+            # Update changed constraint coefficients.
+            # - Slots are obtained with respect to the reduced A matrix, i.e., without bound rows.
+            a_matrix_reduced = standard_form.get_a_matrix_reduced()
+            slots = np.flatnonzero(a_matrix_reduced.data != a_matrix_data[standard_form.constraint_slots])
+            if len(slots) > 0:
+                rows = np.repeat(np.arange(a_matrix_reduced.shape[0]), np.diff(a_matrix_reduced.indptr))
+                for row, column, value in zip(
+                    rows[slots], a_matrix_reduced.indices[slots], a_matrix_reduced.data[slots]
+                ):
+                    highs_problem.changeCoeff(int(row), int(column), float(value))
+
+            # Update row bounds.
+            row_lower_bounds, row_upper_bounds = self.get_highs_row_bounds(standard_form)
+            rows = np.flatnonzero(row_upper_bounds != b_vector[standard_form.constraint_rows, 0])
+            if len(rows) > 0:
+                highs_problem.changeRowsBounds(
+                    len(rows), rows.astype(np.int32), row_lower_bounds[rows], row_upper_bounds[rows]
+                )
+
+            # Update variable bounds.
+            if not (
+                np.array_equal(standard_form.b_vector, b_vector)
+                and np.array_equal(
+                    standard_form.a_matrix.data[standard_form.bound_slots], a_matrix_data[standard_form.bound_slots]
+                )
+            ):
+                lower_bounds, upper_bounds = self.get_highs_bounds(standard_form)
+                highs_problem.changeColsBounds(
+                    self.variables_len, np.arange(self.variables_len, dtype=np.int32), lower_bounds, upper_bounds
+                )
+
+            # Update objective.
+            columns = np.flatnonzero(standard_form.c_vector.ravel() != c_vector.ravel())
+            if len(columns) > 0:
+                highs_problem.changeColsCost(
+                    len(columns), columns.astype(np.int32), standard_form.c_vector.ravel()[columns]
+                )
+            if not np.array_equal(standard_form.q_matrix.data, q_matrix_data):
+                highs_problem.passHessian(self.get_highs_hessian(standard_form.q_matrix))
+            if standard_form.d_constant != d_constant:
+                highs_problem.changeObjectiveOffset(standard_form.d_constant)
+
+        # Store values of the HiGHS problem for comparison in the next call.
+        self.highs_problem_values = (
+            standard_form.a_matrix.data.copy(),
+            standard_form.b_vector.copy(),
+            standard_form.c_vector.copy(),
+            standard_form.q_matrix.data.copy(),
+            standard_form.d_constant,
+        )
+
+        return self.highs_problem
+
+    def solve_highs(self, highs_problem: "highspy.Highs") -> "highspy.Highs":
+        """Solve optimization problem via HiGHS Python interface."""
+
+        # Solve optimization problem.
+        highs_problem.run()
+
+        # Raise error if no optimal solution.
+        status = highs_problem.getModelStatus()
+        if status != highspy.HighsModelStatus.kOptimal:
+            raise RuntimeError(
+                f"HiGHS exited with non-optimal solution status: {highs_problem.modelStatusToString(status)}"
+            )
+
+        # Store results.
+        solution = highs_problem.getSolution()
+        self.x_vector = np.transpose([np.array(solution.col_value)])
+        if solution.dual_valid:
+            self.mu_vector = self.get_standard_form().get_mu_vector(
+                np.array(solution.row_dual), np.array(solution.col_dual)
+            )
+        else:
+            # Duals are not retrieved for non-continuous problems.
+            logger.warning(
+                f"Duals of the optimization problem's constraints are not retrieved,"
+                f" because variables have been defined as non-continuous."
+            )
+            self.mu_vector = np.nan * np.zeros((self.constraints_len, 1))
+        self.objective = float(highs_problem.getInfo().objective_function_value)
+
+        return highs_problem
+
+    def solve_highs_binary(self):
+        """Solve optimization problem via HiGHS binary, by writing the problem to a model file via Gurobi.
+
+        - This serves as fallback interface to HiGHS, if the HiGHS Python interface `highspy` is not installed.
+        """
 
         # Get temporary file path for passing model file to HiGHS.
         temp_path = mesmo.utils.get_results_path("temp")
@@ -1203,42 +2322,42 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
             raise RuntimeError(f"HiGHS exited with non-optimal solution status: {status}\n{''.join(output)}")
 
         # Read solution.
+        # - Bound rows are defined as variable bounds in the model file, hence the solution only covers the reduced
+        #   constraint rows and the duals of the bound rows are obtained from the column duals, i.e., reduced costs.
+        standard_form = self.get_standard_form()
+        constraints_len = len(standard_form.constraint_rows)
         with open(temp_path / "solution.txt", "r") as file:
             solution_lines = file.readlines()
-        x_vector_start = solution_lines.index(f"# Columns {len(self.variables)}\n") + 1
-        x_vector_end = solution_lines.index(f"# Rows {self.constraints_len}\n")
+        x_vector_start = solution_lines.index(f"# Columns {self.variables_len}\n") + 1
+        x_vector_end = solution_lines.index(f"# Rows {constraints_len}\n")
         duals_start = solution_lines.index(f"# Dual solution values\n")
-        mu_vector_start = solution_lines.index(f"# Rows {self.constraints_len}\n", duals_start) + 1
+        reduced_costs_start = solution_lines.index(f"# Columns {self.variables_len}\n", duals_start) + 1
+        reduced_costs_end = solution_lines.index(f"# Rows {constraints_len}\n", duals_start)
+        mu_vector_start = reduced_costs_end + 1
         mu_vector_end = solution_lines.index("\n", duals_start)
 
+        def get_solution_vector(lines: typing.List[str]) -> np.ndarray:
+            # Solution lines are of the form "name[index] value", e.g. "x_vector[0] 1.0".
+            solution_vector = pd.Series(
+                [float(line.split(" ")[1]) for line in lines],
+                index=[int(line.split(" ")[0].split("[")[1].replace("]", "")) for line in lines],
+                dtype=float,
+            )
+            return solution_vector.sort_index().values
+
         # Retrieve objective.
         objective = next(line for line in solution_lines if line.startswith("Objective "))
         objective = float(objective.replace("Objective ", "").replace("\n", ""))
         self.objective = objective
 
         # Retrieve x_vector.
-        x_vector = pd.Series(solution_lines[x_vector_start:x_vector_end])
-        x_vector = (
-            x_vector.str.replace("x_vector[", "", regex=False).str.replace("]", "", regex=False).str.replace("\n", "")
-        )
-        x_vector = x_vector.str.split(" ", expand=True).set_index(0).loc[:, 1]
-        x_vector.index = x_vector.index.astype(int)
-        x_vector = x_vector.astype(float)
-        x_vector = x_vector.sort_index()
-        self.x_vector = np.transpose([x_vector.values])
+        self.x_vector = np.transpose([get_solution_vector(solution_lines[x_vector_start:x_vector_end])])
 
         # Retrieve mu_vector.
-        mu_vector = pd.Series(solution_lines[mu_vector_start:mu_vector_end])
-        mu_vector = (
-            mu_vector.str.replace("constraints[", "", regex=False)
-            .str.replace("]", "", regex=False)
-            .str.replace("\n", "")
+        self.mu_vector = standard_form.get_mu_vector(
+            get_solution_vector(solution_lines[mu_vector_start:mu_vector_end]),
+            get_solution_vector(solution_lines[reduced_costs_start:reduced_costs_end]),
         )
-        mu_vector = mu_vector.str.split(" ", expand=True).set_index(0).loc[:, 1]
-        mu_vector.index = mu_vector.index.astype(int)
-        mu_vector = mu_vector.astype(float)
-        mu_vector = mu_vector.sort_index()
-        self.mu_vector = np.transpose([mu_vector.values])
 
     def get_cvxpy_problem(
         self,
@@ -1247,7 +2366,7 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
 
         # Define variables.
         x_vector = cp.Variable(
-            shape=(len(self.variables), 1),
+            shape=(self.variables_len, 1),
             name="x_vector",
             integer=(
                 (index, 0)
@@ -1265,12 +2384,23 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
             else False,
         )
 
+        # Obtain standard form.
+        standard_form = self.get_standard_form()
+
         # Define constraints.
-        constraints = [self.get_a_matrix() @ x_vector <= self.get_b_vector()]
+        # - Equality rows are defined as separate constraint, which is only added if any equality rows exist.
+        is_equality = standard_form.is_equality
+        constraints = [standard_form.a_matrix[~is_equality, :] @ x_vector <= standard_form.b_vector[~is_equality, :]]
+        if is_equality.any():
+            constraints.append(
+                standard_form.a_matrix[is_equality, :] @ x_vector == standard_form.b_vector[is_equality, :]
+            )
 
         # Define objective.
         objective = (
-            self.get_c_vector() @ x_vector + cp.quad_form(x_vector, 0.5 * self.get_q_matrix()) + self.get_d_constant()
+            standard_form.c_vector @ x_vector
+            + cp.quad_form(x_vector, 0.5 * standard_form.q_matrix)
+            + standard_form.d_constant
         )
 
         return (x_vector, constraints, objective)
@@ -1303,7 +2433,11 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
 
         # Store results.
         self.x_vector = x_vector.value
-        self.mu_vector = constraints[0].dual_value
+        self.mu_vector = np.zeros((self.constraints_len, 1))
+        is_equality = self.get_standard_form().is_equality
+        self.mu_vector[~is_equality, :] = constraints[0].dual_value
+        if is_equality.any():
+            self.mu_vector[is_equality, :] = constraints[1].dual_value
         self.objective = float(cvxpy_problem.objective.value)
 
         return cvxpy_problem
@@ -1312,6 +2446,9 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
         """Obtain results for decisions variables.
 
         - Results are returned as dictionary with keys corresponding to the variable names that have been defined.
+        - Results for variables with timesteps are returned as dataframe with timesteps as index and other variable
+          dimensions as columns. Results for variables without timesteps are returned as dataframe with the variable
+          name as column. Scalar variables are returned as float.
         """
 
         # Log time.
@@ -1323,38 +2460,18 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
         elif type(x_vector) is cp.Variable:
             x_vector = x_vector.value
 
-        # Instantiate results object.
-        results = dict.fromkeys(self.variables.loc[:, "name"].unique())
+        # Obtain results structures.
+        if self.variables_results_structures is None:
+            self.variables_results_structures = self.get_results_structures(self.variables, "variable_type")
 
         # Obtain results for each variable.
-        for name in results:
-            # Get variable dimensions.
-            variable_dimensions = (
-                self.variables.iloc[self.get_variable_index(name), :]
-                .drop(["name", "variable_type"], axis=1)
-                .drop_duplicates()
-                .dropna(axis=1)
-            )
-
-            if len(variable_dimensions.columns) > 0:
-                # Get results from x vector as pandas series.
-                results[name] = pd.Series(
-                    x_vector[self.get_variable_index(name), 0], index=pd.MultiIndex.from_frame(variable_dimensions)
-                )
-
-                # Reshape to dataframe with timesteps as index and other variable dimensions as columns.
-                if "timestep" in variable_dimensions.columns:
-                    results[name] = results[name].unstack(
-                        level=[key for key in variable_dimensions.columns if key != "timestep"]
-                    )
-
-                # If results are obtained as series, convert to dataframe with variable name as column.
-                if type(results[name]) is pd.Series:
-                    results[name] = pd.DataFrame(results[name], columns=[name])
-
-            else:
+        results = dict()
+        for name, (positions, index, columns) in self.variables_results_structures.items():
+            if index is None:
                 # Scalar values are obtained as float.
-                results[name] = float(x_vector[self.get_variable_index(name), 0])
+                results[name] = float(x_vector[positions[0], 0])
+            else:
+                results[name] = self.get_results_dataframe(name, x_vector[positions, 0], positions, index, columns)
 
         # Log time.
         mesmo.utils.log_time("get optimization problem results", logger_object=logger)
@@ -1365,82 +2482,134 @@ class OptimizationProblem(mesmo.utils.ObjectBase):
         """Obtain results for constraint dual variables.
 
         - Duals are returned as dictionary with keys corresponding to the constraint names that have been defined.
+        - Duals are returned as dataframe with timesteps as index and other constraint dimensions as columns.
         """
 
         # Log time.
         mesmo.utils.log_time("get optimization problem duals", logger_object=logger)
 
-        # Instantiate results object.
-        results = dict.fromkeys(self.constraints.loc[:, "name"].unique())
+        # Obtain results structures.
+        if self.constraints_results_structures is None:
+            self.constraints_results_structures = self.get_results_structures(self.constraints, "constraint_type")
+
+        # Obtain dual vector.
+        # - Duals are obtained based on the sign convention of greater-than-equal constraints. Less-than-equal
+        #   constraints are defined with inverted signs, hence the same sign applies for both constraint types.
+        # - Equality constraints are retained as native equality rows, but their duals are mapped to the convention of
+        #   equality constraints being split into greater-than-equal and less-than-equal constraints, i.e., the sum
+        #   of the duals of both constraints, which is the absolute value of the equality dual.
+        dual_vector = 0.0 - self.mu_vector[:, 0]
+        for constraint_start, constraint_stop in self.equality_constraint_ranges:
+            dual_vector[constraint_start:constraint_stop] = np.abs(dual_vector[constraint_start:constraint_stop])
 
         # Obtain results for each constraint.
-        for name in results:
-            # Get constraint dimensions & constraint type.
+        results = dict()
+        for name, (positions, index, columns) in self.constraints_results_structures.items():
             # TODO: Check if this works for scalar constraints without timesteps.
-            constraint_dimensions = pd.MultiIndex.from_frame(
-                self.constraints.iloc[mesmo.utils.get_index(self.constraints, name=name), :]
-                .drop(["name", "constraint_type"], axis=1)
-                .drop_duplicates()
-                .dropna(axis=1)
-            )
-            constraint_type = pd.Series(
-                self.constraints.loc[self.constraints.loc[:, "name"] == name, "constraint_type"].unique()
-            )
-
-            # Get results from x vector as pandas series.
-            if constraint_type.str.contains("==").any():
-                results[name] = pd.Series(
-                    0.0
-                    - self.mu_vector[
-                        self.constraints.index[
-                            mesmo.utils.get_index(self.constraints, name=name, constraint_type="==>=")
-                        ],
-                        0,
-                    ]
-                    - self.mu_vector[
-                        self.constraints.index[
-                            mesmo.utils.get_index(self.constraints, name=name, constraint_type="==<=")
-                        ],
-                        0,
-                    ],
-                    index=constraint_dimensions,
-                )
-            elif constraint_type.str.contains(">=").any():
-                results[name] = pd.Series(
-                    0.0
-                    - self.mu_vector[
-                        self.constraints.index[
-                            mesmo.utils.get_index(self.constraints, name=name, constraint_type=">=")
-                        ],
-                        0,
-                    ],
-                    index=constraint_dimensions,
-                )
-            elif constraint_type.str.contains("<=").any():
-                results[name] = pd.Series(
-                    0.0
-                    - self.mu_vector[
-                        self.constraints.index[
-                            mesmo.utils.get_index(self.constraints, name=name, constraint_type="<=")
-                        ],
-                        0,
-                    ],
-                    index=constraint_dimensions,
+            if columns is None:
+                results[name] = pd.Series(dual_vector[positions], index=index).unstack(
+                    level=[key for key in index.names if key != "timestep"]
                 )
-
-            # Reshape to dataframe with timesteps as index and other constraint dimensions as columns.
-            results[name] = results[name].unstack(
-                level=[key for key in constraint_dimensions.names if key != "timestep"]
-            )
-            # If no other dimensions, e.g. for scalar constraints, convert to dataframe with constraint name as column.
-            if type(results[name]) is pd.Series:
-                results[name] = pd.DataFrame(results[name], columns=[name])
+                # If no other dimensions, convert to dataframe with constraint name as column.
+                if type(results[name]) is pd.Series:
+                    results[name] = pd.DataFrame(results[name], columns=[name])
+            else:
+                results[name] = self.get_results_dataframe(name, dual_vector[positions], positions, index, columns)
 
         # Log time.
         mesmo.utils.log_time("get optimization problem duals", logger_object=logger)
 
         return results
 
+    @staticmethod
+    def get_results_structures(index_set: pd.DataFrame, type_key: str) -> dict:
+        """Obtain results structures for given variables / constraints index set, i.e., dictionary with
+        (positions, index, columns) tuple for each name, which is used to reshape results in ``get_results()`` and
+        ``get_duals()``.
+
+        - Dimensions are obtained from the index set entries of each name, where dimensions with undefined values
+          are dropped. Results with timestep dimension and further dimensions are reshaped to a (timestep x other
+          dimensions) array, where ``positions`` is the 2-D array of vector positions and ``-1`` indicates missing
+          entries. The index / columns are obtained equivalent to ``pandas.Series.unstack()``.
+        - For all other results, ``positions`` is the 1-D array of vector positions, ``index`` is the
+          multi-index of the dimensions or ``None`` if there are no dimensions, and ``columns`` is ``None``.
+        """
+
+        # Obtain index set positions for each name.
+        names = index_set.loc[:, "name"].unique()
+        rows_by_name = index_set.groupby("name", sort=False).indices
+        vector_positions = np.asarray(index_set.index, dtype=int)
+
+        # Obtain results structure for each name.
+        results_structures = dict()
+        for name in names:
+            rows = rows_by_name[name]
+            positions = vector_positions[rows]
+
+            # Get dimensions.
+            dimensions = index_set.iloc[rows, :].drop(["name", type_key], axis=1).dropna(axis=1)
+            if len(dimensions.columns) == 0:
+                results_structures[name] = (positions, None, None)
+                continue
+            index = pd.MultiIndex.from_frame(dimensions)
+            if ("timestep" not in index.names) or (index.nlevels == 1):
+                results_structures[name] = (positions, index, None)
+                continue
+
+            # Obtain 2-D array of positions based on level codes.
+            # - Columns are the observed combinations of other dimensions, which are sorted by level codes for
+            #   a single other dimension and ordered by first occurrence for multiple other dimensions, equivalent to
+            #   ``pandas.Series.unstack()``.
+            # - Level codes are converted to default integer type, as these are stored with minimal integer type.
+            timestep_level = index.names.index("timestep")
+            levels = [level for level in range(index.nlevels) if level != timestep_level]
+            columns_codes = np.ravel_multi_index(
+                [index.codes[level].astype(int) for level in levels], [len(index.levels[level]) for level in levels]
+            )
+            columns_codes, columns_first, columns_inverse = np.unique(
+                columns_codes, return_index=True, return_inverse=True
+            )
+            if len(levels) > 1:
+                columns_order = np.argsort(columns_first)
+                columns_codes = columns_codes[columns_order]
+                columns_inverse = np.argsort(columns_order)[columns_inverse]
+            entries = index.codes[timestep_level].astype(int) * len(columns_codes) + columns_inverse
+            if len(np.unique(entries)) < len(entries):
+                raise ValueError(f"Index contains duplicate entries for '{name}', cannot reshape results.")
+            positions_array = np.full((len(index.levels[timestep_level]), len(columns_codes)), -1)
+            positions_array.ravel()[entries] = positions
+
+            # Obtain result index / columns.
+            result_index = index.levels[timestep_level].take(np.arange(positions_array.shape[0])).rename("timestep")
+            if len(levels) == 1:
+                result_columns = index.levels[levels[0]].rename(index.names[levels[0]])
+            else:
+                result_columns = pd.MultiIndex(
+                    levels=[index.levels[level] for level in levels],
+                    codes=np.unravel_index(columns_codes, [len(index.levels[level]) for level in levels]),
+                    names=[index.names[level] for level in levels],
+                    verify_integrity=False,
+                )
+            results_structures[name] = (positions_array, result_index, result_columns)
+
+        return results_structures
+
+    @staticmethod
+    def get_results_dataframe(
+        name: str, values: np.ndarray, positions: np.ndarray, index: pd.Index, columns: typing.Optional[pd.Index]
+    ) -> pd.DataFrame:
+        """Obtain results dataframe for given values, vector positions and results structure index / columns."""
+
+        # If no columns, results are obtained as dataframe with the name as column.
+        if columns is None:
+            return pd.DataFrame(pd.Series(values, index=index), columns=[name])
+
+        # Set missing entries to NaN.
+        if (positions < 0).any():
+            values[positions < 0] = np.nan
+
+        return pd.DataFrame(values, index=index, columns=columns)
+
     def evaluate_objective(self, x_vector: np.ndarray) -> float:
         r"""Utility function for evaluating the objective value for a given :math:`x` vector value."""
 
@@ -4,6 +4,7 @@ import itertools
 from multimethod import multimethod
 import numpy as np
 import pandas as pd
+import re
 import scipy.constants
 import scipy.sparse as sp
 import scipy.sparse.linalg
@@ -34,6 +35,7 @@ class ThermalGridModel(mesmo.utils.ObjectBase):
     branch_incidence_2_matrix: sp.spmatrix
     branch_incidence_matrix: sp.spmatrix
     branch_incidence_matrix_no_source: sp.spmatrix
+    branch_incidence_matrix_no_source_factorization: typing.Optional[scipy.sparse.linalg.SuperLU]
     branch_incidence_matrix_source: sp.spmatrix
     branch_incidence_matrix_no_source_no_loop: sp.spmatrix
     branch_incidence_matrix_no_source_loop: sp.spmatrix
@@ -56,10 +58,16 @@ class ThermalGridModel(mesmo.utils.ObjectBase):
     source_der_model: mesmo.der_models.DERModel
     plant_efficiency: float
 
+    @multimethod
     def __init__(self, scenario_name: str):
         # Obtain thermal grid data.
         thermal_grid_data = mesmo.data_interface.ThermalGridData(scenario_name)
 
+        # Instantiate thermal grid model object.
+        self.__init__(thermal_grid_data)
+
+    @multimethod
+    def __init__(self, thermal_grid_data: mesmo.data_interface.ThermalGridData):
         # Obtain index set for time steps.
         # - This is needed for optimization problem definitions within linear thermal grid models.
         self.timesteps = thermal_grid_data.scenario_data.timesteps
@@ -90,66 +98,87 @@ class ThermalGridModel(mesmo.utils.ObjectBase):
         self.branch_loops = pd.MultiIndex.from_tuples([], names=["loop_id", "branch_name"])  # Values are filled below.
         self.ders = pd.MultiIndex.from_frame(thermal_grid_data.thermal_grid_ders[["der_type", "der_name"]])
 
-        # Instantiate branch-to-node incidence matrices.
-        self.branch_incidence_1_matrix = sp.dok_matrix((len(self.branches), len(self.nodes)), dtype=int)
-        self.branch_incidence_2_matrix = sp.dok_matrix((len(self.branches), len(self.nodes)), dtype=int)
-
-        # Add lines to branch incidence matrices and identify any loops.
-        # - Uses temporary node tree variable to track construction of the network and identify any loops / cycles.
-        branches_loops = self.branches.to_frame()
-        node_trees = []
-        for line_index, line in thermal_grid_data.thermal_grid_lines.iterrows():
-            # Obtain indexes for positioning the line in the incidence matrices.
-            node_index_1 = mesmo.utils.get_index(self.nodes, node_name=line["node_1_name"])
-            node_index_2 = mesmo.utils.get_index(self.nodes, node_name=line["node_2_name"])
-            branch_index = mesmo.utils.get_index(self.branches, branch_name=line["line_name"])
-
-            # Insert connection indicators into incidence matrices.
-            self.branch_incidence_1_matrix[np.ix_(branch_index, node_index_1)] += 1
-            self.branch_incidence_2_matrix[np.ix_(branch_index, node_index_2)] += 1
-
-            # Check if node 1 or node 2 are in any node trees.
-            node_tree_index_1 = None
-            node_tree_index_2 = None
-            for node_tree_index, node_tree in enumerate(node_trees):
-                if line["node_1_name"] in node_tree:
-                    node_tree_index_1 = node_tree_index
-                if line["node_2_name"] in node_tree:
-                    node_tree_index_2 = node_tree_index
-            if (node_tree_index_1 is None) and (node_tree_index_2 is None):
-                # Create new tree, if neither node is on any tree.
-                node_trees.append([line["node_1_name"], line["node_2_name"]])
-            elif (node_tree_index_1 is not None) and (node_tree_index_2 is None):
-                # Add node to tree, if other node is on any tree.
-                node_trees[node_tree_index_1].append(line["node_2_name"])
-            elif (node_tree_index_1 is None) and (node_tree_index_2 is not None):
-                # Add node to tree, if other node is on any tree.
-                node_trees[node_tree_index_2].append(line["node_1_name"])
+        # Obtain position maps for nodes / branches, i.e., mapping of node name / branch name to position.
+        # - This avoids obtaining the positions via `mesmo.utils.get_index()` for each line / DER.
+        node_positions = {node_name: node_position for node_position, (_, node_name) in enumerate(self.nodes)}
+        branch_positions = {
+            branch_name: branch_position for branch_position, (branch_name, _) in enumerate(self.branches)
+        }
+
+        # Obtain positions of the lines and their nodes in the incidence matrices.
+        line_branch_index = np.array(
+            [branch_positions[line_name] for line_name in thermal_grid_data.thermal_grid_lines.loc[:, "line_name"]],
+            dtype=int,
+        )
+        line_node_index_1 = np.array(
+            [node_positions[node_name] for node_name in thermal_grid_data.thermal_grid_lines.loc[:, "node_1_name"]],
+            dtype=int,
+        )
+        line_node_index_2 = np.array(
+            [node_positions[node_name] for node_name in thermal_grid_data.thermal_grid_lines.loc[:, "node_2_name"]],
+            dtype=int,
+        )
+
+        # Obtain branch-to-node incidence matrices.
+        # - Entries are assembled from COO triplets, where duplicate entries are summed.
+        self.branch_incidence_1_matrix = sp.coo_matrix(
+            (np.ones(len(line_branch_index), dtype=int), (line_branch_index, line_node_index_1)),
+            shape=(len(self.branches), len(self.nodes)),
+        ).tocsr()
+        self.branch_incidence_2_matrix = sp.coo_matrix(
+            (np.ones(len(line_branch_index), dtype=int), (line_branch_index, line_node_index_2)),
+            shape=(len(self.branches), len(self.nodes)),
+        ).tocsr()
+
+        # Identify any loops in the network.
+        # - Uses union-find structure of node trees to track construction of the network and identify any loops /
+        #   cycles, where each node tree is represented by its root node and nodes are only added to a node tree
+        #   once they are connected by a line.
+        # - Lines are marked as loop, if both nodes are already on the same node tree. Otherwise, the node trees of
+        #   both nodes are merged.
+        node_tree_parents = np.arange(len(self.nodes))
+        is_node_connected = np.zeros(len(self.nodes), dtype=bool)
+        is_branch_loop = np.zeros(len(self.branches), dtype=bool)
+
+        def get_node_tree_root(node_position: int) -> int:
+            # Obtain root node position, with path halving to keep node trees flat.
+            while node_tree_parents[node_position] != node_position:
+                node_tree_parents[node_position] = node_tree_parents[node_tree_parents[node_position]]
+                node_position = node_tree_parents[node_position]
+            return node_position
+
+        for branch_index, node_index_1, node_index_2 in zip(
+            line_branch_index.tolist(), line_node_index_1.tolist(), line_node_index_2.tolist()
+        ):
+            node_tree_root_1 = get_node_tree_root(node_index_1)
+            node_tree_root_2 = get_node_tree_root(node_index_2)
+            if (
+                is_node_connected[node_index_1]
+                and is_node_connected[node_index_2]
+                and (node_tree_root_1 == node_tree_root_2)
+            ):
+                # Mark branch as loop, if both nodes are in the same tree.
+                is_branch_loop[branch_index] = True
             else:
-                if node_tree_index_1 == node_tree_index_2:
-                    # Mark branch as loop, if both nodes are in the same tree.
-                    branches_loops.loc[self.branches[branch_index], "loop_type"] = "loop"
-                else:
-                    # Merge trees, if the branch connects nodes on different trees.
-                    node_trees[node_tree_index_1].extend(node_trees[node_tree_index_2])
-                    node_trees[node_tree_index_2] = []
+                # Merge trees, if the branch connects nodes on different trees.
+                node_tree_parents[node_tree_root_2] = node_tree_root_1
+            is_node_connected[[node_index_1, node_index_2]] = True
 
         # Update branch / loop indexes.
-        self.branches = pd.MultiIndex.from_frame(branches_loops)
-        self.branch_loops = pd.MultiIndex.from_frame(
-            pd.concat(
-                [
-                    pd.Series(range(sum(branches_loops.loc[:, "loop_type"] == "loop")), name="loop_id", dtype=int),
-                    branches_loops.loc[branches_loops.loc[:, "loop_type"] == "loop", "branch_name"].reset_index(
-                        drop=True
-                    ),
-                ],
-                axis="columns",
-            )
+        self.branches = pd.MultiIndex.from_arrays(
+            [self.line_names, np.where(is_branch_loop, "loop", "no_loop")], names=["branch_name", "loop_type"]
+        )
+        self.branch_loops = pd.MultiIndex.from_arrays(
+            [np.arange(np.count_nonzero(is_branch_loop)), self.line_names[is_branch_loop]],
+            names=["loop_id", "branch_name"],
         )
 
         # Raise errors on invalid network configurations.
-        node_trees = [node_tree for node_tree in node_trees if len(node_tree) > 0]
+        node_tree_roots = np.array([get_node_tree_root(node_position) for node_position in range(len(self.nodes))])
+        node_trees = [
+            self.node_names[(node_tree_roots == node_tree_root) & is_node_connected].tolist()
+            for node_tree_root in pd.unique(node_tree_roots[is_node_connected])
+        ]
         if len(node_trees) > 1:
             raise ValueError(
                 "The thermal grid contains disjoint sections of nodes:"
@@ -160,19 +189,13 @@ class ThermalGridModel(mesmo.utils.ObjectBase):
                     ]
                 )
             )
-        elif len(node_trees[0]) != len(self.node_names):
+        elif not is_node_connected.all():
             raise ValueError(
-                f"The thermal grid contains disconnected nodes:\n"
-                f"{[node_name for node_name in self.node_names if node_name not in node_trees[0]]}"
+                f"The thermal grid contains disconnected nodes:\n{self.node_names[~is_node_connected].tolist()}"
             )
 
         # Obtained combined branch incidence matrix.
-        self.branch_incidence_matrix = self.branch_incidence_1_matrix - self.branch_incidence_2_matrix
-
-        # Convert DOK matrices to CSR matrices.
-        self.branch_incidence_1_matrix = self.branch_incidence_1_matrix.tocsr()
-        self.branch_incidence_2_matrix = self.branch_incidence_2_matrix.tocsr()
-        self.branch_incidence_matrix = self.branch_incidence_matrix.tocsr()
+        self.branch_incidence_matrix = (self.branch_incidence_1_matrix - self.branch_incidence_2_matrix).tocsr()
 
         # Obtain shorthand definitions.
         self.branch_incidence_matrix_no_source_no_loop = self.branch_incidence_matrix[
@@ -189,29 +212,26 @@ class ThermalGridModel(mesmo.utils.ObjectBase):
         ]
 
         # Obtain branch-to-loop incidence matrix.
+        # - Using sparse LU factorization with dense right-hand side instead of `sp.linalg.inv()`, because the inverse
+        #   of the no-loop branch incidence matrix is dense for deep radial networks.
+        branch_loop_incidence_matrix_no_loop = np.zeros((len(self.branches) - len(self.branch_loops), 0))
+        if len(self.branch_loops) > 0:
+            branch_loop_incidence_matrix_no_loop = -1.0 * scipy.sparse.linalg.splu(
+                self.branch_incidence_matrix_no_source_no_loop.transpose().tocsc().astype(float)
+            ).solve(self.branch_incidence_matrix_no_source_loop.transpose().toarray().astype(float))
         self.branch_loop_incidence_matrix = sp.vstack(
-            [
-                -1.0 * sp.linalg.inv(self.branch_incidence_matrix_no_source_no_loop.transpose())
-                # Using `sp.linalg.inv()` instead of `sp.linalg.spsolve()` to preserve dimensions in all cases.
-                @ self.branch_incidence_matrix_no_source_loop.transpose(),
-                sp.eye(len(self.branch_loops)),
-            ]
+            [sp.csr_matrix(branch_loop_incidence_matrix_no_loop), sp.eye(len(self.branch_loops))]
         ).tocsr()
 
-        # Instantiate DER-to-node incidence matrix.
-        self.der_node_incidence_matrix = sp.dok_matrix((len(self.nodes), len(self.ders)), dtype=int)
-
-        # Add DERs into DER incidence matrix.
-        for der_name, der in thermal_grid_data.thermal_grid_ders.iterrows():
-            # Obtain indexes for positioning the DER in the incidence matrix.
-            node_index = mesmo.utils.get_index(self.nodes, node_name=der["node_name"])
-            der_index = mesmo.utils.get_index(self.ders, der_name=der["der_name"])
-
-            # Insert connection indicator into incidence matrices.
-            self.der_node_incidence_matrix[node_index, der_index] = 1
-
-        # Convert DOK matrices to CSR matrices.
-        self.der_node_incidence_matrix = self.der_node_incidence_matrix.tocsr()
+        # Obtain DER-to-node incidence matrix.
+        der_node_index = np.array(
+            [node_positions[node_name] for node_name in thermal_grid_data.thermal_grid_ders.loc[:, "node_name"]],
+            dtype=int,
+        )
+        self.der_node_incidence_matrix = sp.coo_matrix(
+            (np.ones(len(self.ders), dtype=int), (der_node_index, np.arange(len(self.ders)))),
+            shape=(len(self.nodes), len(self.ders)),
+        ).tocsr()
 
         # Obtain DER nominal thermal power vector.
         self.der_thermal_power_vector_reference = thermal_grid_data.thermal_grid_ders.loc[
@@ -280,62 +300,107 @@ class ThermalGridModel(mesmo.utils.ObjectBase):
             mesmo.utils.get_index(self.nodes, node_type="source")
         ]
 
-    def get_branch_loss_coefficient_vector(self, branch_flow_vector: np.ndarray):
+        # Instantiate factorization of no-source branch incidence matrix.
+        # - The factorization is computed when first needed, because the no-source branch incidence matrix is only
+        #   square, i.e. invertible, for radial thermal grids.
+        self.branch_incidence_matrix_no_source_factorization = None
+
+    def __getstate__(self):
+        # Exclude factorization from pickling / copying, because `SuperLU` objects cannot be pickled.
+        # - The factorization is recomputed when first needed.
+        state = self.__dict__.copy()
+        state["branch_incidence_matrix_no_source_factorization"] = None
+        return state
+
+    def get_branch_incidence_matrix_no_source_factorization(self) -> scipy.sparse.linalg.SuperLU:
+        """Get sparse LU factorization of the no-source branch incidence matrix.
+
+        - The factorization is computed upon first call and reused for subsequent calls, such that the explicit
+          thermal power flow solution only requires triangular solves.
+        - Linear equations are solved via ``factorization.solve(right_hand_side)`` and equations with the transposed
+          matrix via ``factorization.solve(right_hand_side, trans="T")``.
+        - The factorization is only defined for radial thermal grids, i.e. if `branch_loops` is empty.
+        """
+
+        if self.branch_incidence_matrix_no_source_factorization is None:
+            self.branch_incidence_matrix_no_source_factorization = scipy.sparse.linalg.splu(
+                self.branch_incidence_matrix_no_source.tocsc().astype(float)
+            )
+
+        return self.branch_incidence_matrix_no_source_factorization
+
+    def get_branch_loss_coefficient_vector(self, branch_flow_vector: np.ndarray) -> np.ndarray:
+        """Obtain branch head loss coefficient vector for given branch flow vector.
+
+        - The friction factor is obtained for laminar flow based on the Hagen-Poiseuille velocity profile and
+          for turbulent flow based on the Swamee-Jain formula, which approximates the Colebrook-White equation.
+        - The branch flow vector can also be given as matrix of dimension (branches, timesteps), in which case
+          the branch loss coefficients are obtained for all timesteps at once.
+        """
+
+        # Obtain line parameters.
+        # - For branch flow matrices, line parameters are broadcast along the columns.
+        diameter = self.line_parameters.loc[:, "diameter"].values
+        absolute_roughness = self.line_parameters.loc[:, "absolute_roughness"].values
+        length = self.line_parameters.loc[:, "length"].values
+        if np.ndim(branch_flow_vector) > 1:
+            diameter = diameter[:, np.newaxis]
+            absolute_roughness = absolute_roughness[:, np.newaxis]
+            length = length[:, np.newaxis]
+
         # Obtain branch velocity vector.
-        branch_velocity_vector = (
-            4.0 * branch_flow_vector / (np.pi * self.line_parameters.loc[:, "diameter"].values ** 2)
-        )
+        branch_velocity_vector = 4.0 * branch_flow_vector / (np.pi * diameter**2)
 
         # Obtain branch Reynolds coefficient vector.
-        branch_reynold_vector = (
-            np.abs(branch_velocity_vector)
-            * self.line_parameters.loc[:, "diameter"].values
-            / mesmo.config.water_kinematic_viscosity
+        branch_reynold_vector = np.abs(branch_velocity_vector) * diameter / mesmo.config.water_kinematic_viscosity
+        if np.isnan(branch_reynold_vector).any():
+            raise ValueError(f"Invalid Reynolds coefficient: {branch_reynold_vector[np.isnan(branch_reynold_vector)]}")
+
+        # Obtain branch flow regimes.
+        is_laminar = (0.0 < branch_reynold_vector) & (branch_reynold_vector < 4000.0)
+        is_turbulent = 4000.0 <= branch_reynold_vector
+
+        # Raise warning for turbulent branch flows outside of the validity range of the Swamee-Jain formula.
+        is_invalid = is_turbulent & ~(
+            (branch_reynold_vector <= 100000000)
+            & (0.000001 <= ((absolute_roughness / 1000) / diameter))
+            & (((absolute_roughness / 1000) / diameter) <= 0.01)
         )
+        if is_invalid.any():
+            logger.warning(
+                f"Exceeding validity range of Swamee-Jain formula for calculation of friction factor"
+                f" for {np.count_nonzero(is_invalid)} branch flow values."
+            )
 
         # Obtain branch friction factor vector.
-        @np.vectorize
-        def branch_friction_factor_vector(reynold, absolute_roughness, diameter):
-            # No flow.
-            if reynold == 0:
-                friction_factor = 0
-
-            # Laminar Flow, based on Hagen-Poiseuille velocity profile, analytical correlation.
-            elif 0 < reynold < 4000:
-                friction_factor = 64 / reynold
-
-            # Turbulent flow, Swamee-Jain formula, approximating correlation of Colebrook-White equation.
-            elif 4000 <= reynold:
-                if not (reynold <= 100000000 and 0.000001 <= ((absolute_roughness / 1000) / diameter) <= 0.01):
-                    logger.warning(
-                        "Exceeding validity range of Swamee-Jain formula for calculation of friction factor."
-                    )
-                friction_factor = (
-                    1.325 / (np.log((absolute_roughness / 1000) / (3.7 * diameter) + 5.74 / (reynold**0.9))) ** 2
+        # - No flow yields zero friction factor.
+        # - Laminar Flow, based on Hagen-Poiseuille velocity profile, analytical correlation.
+        # - Turbulent flow, Swamee-Jain formula, approximating correlation of Colebrook-White equation.
+        # - Friction factors are evaluated only for the branches of the respective flow regime, to avoid invalid
+        #   intermediate values.
+        branch_friction_factor_vector = np.where(is_laminar, 64 / np.where(is_laminar, branch_reynold_vector, 1.0), 0.0)
+        branch_friction_factor_vector = np.where(
+            is_turbulent,
+            1.325
+            / (
+                np.log(
+                    (absolute_roughness / 1000) / (3.7 * diameter)
+                    + 5.74 / (np.where(is_turbulent, branch_reynold_vector, 4000.0) ** 0.9)
                 )
+            )
+            ** 2,
+            branch_friction_factor_vector,
+        )
 
-            else:
-                raise ValueError(f"Invalid Reynolds coefficient: {reynold}")
-
-            # Convert from 1/m to 1/km.
-            friction_factor *= 1.0e3
-
-            return friction_factor
+        # Convert from 1/m to 1/km.
+        branch_friction_factor_vector *= 1.0e3
 
         # Obtain branch head loss coefficient vector.
         branch_loss_coefficient_vector = (
-            branch_friction_factor_vector(
-                branch_reynold_vector,
-                self.line_parameters.loc[:, "absolute_roughness"].values,
-                self.line_parameters.loc[:, "diameter"].values,
-            )
+            branch_friction_factor_vector
             * 8.0
-            * self.line_parameters.loc[:, "length"].values
-            / (
-                mesmo.config.gravitational_acceleration
-                * self.line_parameters.loc[:, "diameter"].values ** 5
-                * np.pi**2
-            )
+            * length
+            / (mesmo.config.gravitational_acceleration * diameter**5 * np.pi**2)
         )
 
         return branch_loss_coefficient_vector
@@ -377,6 +442,11 @@ class ThermalPowerFlowSolutionBase(mesmo.utils.ObjectBase):
     branch_flow_vector: np.ndarray
     pump_power: float
 
+    @multimethod
+    def __init__(self):
+        # Enable instantiation without solution, e.g. for storing solutions which were obtained in batch.
+        pass
+
     @multimethod
     def __init__(self, scenario_name: str):
         # Obtain thermal grid model.
@@ -395,6 +465,22 @@ class ThermalPowerFlowSolutionBase(mesmo.utils.ObjectBase):
     def __init__(self, thermal_grid_model: ThermalGridModel, der_thermal_power_vector: np.ndarray):
         raise NotImplementedError
 
+    @staticmethod
+    def get_pump_power_batch(
+        thermal_grid_model: ThermalGridModel, der_flow_vectors: np.ndarray, node_head_vectors: np.ndarray
+    ) -> np.ndarray:
+        """Get pump power loss for multiple DER volume flow vectors and corresponding nodal head vectors, given as
+        matrices of dimension (number of solutions, number of DERs / nodes)."""
+
+        return (
+            (2.0 * np.max(np.abs(node_head_vectors), axis=1) + thermal_grid_model.energy_transfer_station_head_loss)
+            * -1.0
+            * np.sum(der_flow_vectors, axis=1)  # Source volume flow.
+            * mesmo.config.water_density
+            * mesmo.config.gravitational_acceleration
+            / thermal_grid_model.distribution_pump_efficiency
+        )
+
 
 class ThermalPowerFlowSolutionExplicit(ThermalPowerFlowSolutionBase):
     # Enable calls to `__init__` method definitions in parent class.
@@ -415,20 +501,16 @@ class ThermalPowerFlowSolutionExplicit(ThermalPowerFlowSolutionBase):
 
         # Obtain branch volume flow vector.
         self.branch_flow_vector = (
-            scipy.sparse.linalg.spsolve(
-                thermal_grid_model.branch_incidence_matrix_no_source.transpose(),
-                thermal_grid_model.der_node_incidence_matrix_no_source @ np.transpose([der_flow_vector]),
+            thermal_grid_model.get_branch_incidence_matrix_no_source_factorization().solve(
+                thermal_grid_model.der_node_incidence_matrix_no_source @ np.transpose([der_flow_vector]), trans="T"
             )
         ).ravel()
 
         # Obtain node head vector.
-        node_head_vector_no_source = scipy.sparse.linalg.spsolve(
-            thermal_grid_model.branch_incidence_matrix_no_source.tocsc(),
-            (
-                thermal_grid_model.get_branch_loss_coefficient_vector(self.branch_flow_vector)
-                * self.branch_flow_vector
-                * np.abs(self.branch_flow_vector)
-            ),
+        node_head_vector_no_source = thermal_grid_model.get_branch_incidence_matrix_no_source_factorization().solve(
+            thermal_grid_model.get_branch_loss_coefficient_vector(self.branch_flow_vector)
+            * self.branch_flow_vector
+            * np.abs(self.branch_flow_vector)
         )
         self.node_head_vector = (
             thermal_grid_model.node_incidence_matrix_no_source @ node_head_vector_no_source
@@ -447,6 +529,57 @@ class ThermalPowerFlowSolutionExplicit(ThermalPowerFlowSolutionBase):
             / thermal_grid_model.distribution_pump_efficiency
         )
 
+    @staticmethod
+    def get_solution_batch(
+        thermal_grid_model: ThermalGridModel, der_thermal_power_vectors: np.ndarray
+    ) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get nodal head vectors, branch volume flow vectors and pump power losses for multiple DER thermal power
+        vectors, e.g. for all timesteps, by solving with the explicit method in batch.
+
+        - DER thermal power vectors are given as matrix of dimension (number of solutions, number of DERs). Nodal head
+          vectors and branch volume flow vectors are returned as matrices of dimension (number of solutions, number of
+          nodes / branches) and pump power losses as vector of dimension (number of solutions).
+        - All DER thermal power vectors are solved at once, i.e., as single solve with multiple right-hand sides based
+          on the cached factorization of the no-source branch incidence matrix.
+        """
+
+        # Obtain DER volume flow vectors.
+        der_flow_vectors = (
+            np.array(der_thermal_power_vectors, dtype=float)
+            / mesmo.config.water_density
+            / thermal_grid_model.enthalpy_difference_distribution_water
+        )
+
+        # Obtain branch volume flow matrix, where each column corresponds to a DER thermal power vector.
+        branch_flow_matrix = thermal_grid_model.get_branch_incidence_matrix_no_source_factorization().solve(
+            np.array(thermal_grid_model.der_node_incidence_matrix_no_source @ np.transpose(der_flow_vectors)),
+            trans="T",
+        )
+
+        # Obtain node head matrix.
+        node_head_matrix_no_source = thermal_grid_model.get_branch_incidence_matrix_no_source_factorization().solve(
+            thermal_grid_model.get_branch_loss_coefficient_vector(branch_flow_matrix)
+            * branch_flow_matrix
+            * np.abs(branch_flow_matrix)
+        )
+        node_head_matrix = (
+            thermal_grid_model.node_incidence_matrix_no_source @ node_head_matrix_no_source
+            + np.transpose(
+                [
+                    thermal_grid_model.node_incidence_matrix_source
+                    @ thermal_grid_model.node_head_vector_reference_source
+                    * thermal_grid_model.node_head_source_value
+                ]
+            )
+        )
+
+        # Obtain pump power losses.
+        pump_powers = ThermalPowerFlowSolutionBase.get_pump_power_batch(
+            thermal_grid_model, der_flow_vectors, np.transpose(node_head_matrix)
+        )
+
+        return (np.transpose(node_head_matrix), np.transpose(branch_flow_matrix), pump_powers)
+
 
 class ThermalPowerFlowSolutionNewtonRaphson(ThermalPowerFlowSolutionBase):
     # Enable calls to `__init__` method definitions in parent class.
@@ -581,6 +714,154 @@ class ThermalPowerFlowSolutionNewtonRaphson(ThermalPowerFlowSolutionBase):
             / thermal_grid_model.distribution_pump_efficiency
         )
 
+    @staticmethod
+    def get_solution_batch(
+        thermal_grid_model: ThermalGridModel,
+        der_thermal_power_vectors: np.ndarray,
+        head_iteration_limit=100,
+        head_tolerance=1e-2,
+    ) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get nodal head vectors, branch volume flow vectors and pump power losses for multiple DER thermal power
+        vectors, e.g. for all timesteps, by solving with the Newton-Raphson method in batch.
+
+        - DER thermal power vectors are given as matrix of dimension (number of solutions, number of DERs). Nodal head
+          vectors and branch volume flow vectors are returned as matrices of dimension (number of solutions, number of
+          nodes / branches) and pump power losses as vector of dimension (number of solutions).
+        - The Newton-Raphson updates are evaluated for all DER thermal power vectors at once, where the nodal head
+          equations are solved as single block-diagonal system and the DER thermal power vectors for which the head
+          solution has converged are masked out.
+        - Per DER thermal power vector, the solution is equivalent to the solution of `__init__()`.
+        """
+
+        # Obtain DER volume flow vectors.
+        der_flow_vectors = (
+            np.array(der_thermal_power_vectors, dtype=float)
+            / mesmo.config.water_density
+            / thermal_grid_model.enthalpy_difference_distribution_water
+        )
+        solution_count = len(der_flow_vectors)
+
+        # Obtain nodal volume flow matrix, where each column corresponds to a DER thermal power vector.
+        node_flow_matrix_no_source = np.array(
+            thermal_grid_model.der_node_incidence_matrix_no_source @ np.transpose(der_flow_vectors)
+        )
+
+        # Define shorthands for source head terms.
+        node_head_vector_source = (
+            thermal_grid_model.node_incidence_matrix_source
+            @ thermal_grid_model.node_head_vector_reference_source
+            * thermal_grid_model.node_head_source_value
+        )
+        branch_head_vector_source = (
+            -1.0
+            * thermal_grid_model.branch_incidence_matrix_source
+            @ thermal_grid_model.node_head_vector_reference_source
+            * thermal_grid_model.node_head_source_value
+        )
+
+        # Obtain initial nodal head and branch volume flow matrices for first iteration.
+        node_head_matrix_initial_no_source = np.repeat(
+            np.transpose([thermal_grid_model.node_head_vector_reference_no_source]), solution_count, axis=1
+        )
+        branch_flow_matrix_initial = np.repeat(
+            np.transpose([thermal_grid_model.branch_flow_vector_reference]), solution_count, axis=1
+        )
+        node_head_matrix_estimate = np.zeros((len(thermal_grid_model.nodes), solution_count))
+
+        # Instantiate Newton-Raphson iteration variables.
+        head_iteration = np.zeros(solution_count, dtype=int)
+        head_change = np.full(solution_count, np.inf)
+        is_iterating = np.ones(solution_count, dtype=bool)
+
+        # Run Newton-Raphson iterations for non-converged columns.
+        while is_iterating.any():
+            columns = np.flatnonzero(is_iterating)
+            branch_flow_matrix = branch_flow_matrix_initial[:, columns]
+
+            # Replace zero branch volume flows with very small value, based on minium absolute branch volume flow.
+            # - This is to avoid numerical issues due to singularity of the jacobian matrix.
+            branch_flow_matrix_valid_index = branch_flow_matrix != 0.0
+            branch_flow_abs_min = np.min(
+                np.where(branch_flow_matrix_valid_index, np.abs(branch_flow_matrix), np.inf), axis=0
+            )
+            branch_flow_abs_min = np.where(np.isinf(branch_flow_abs_min), 1e-9, branch_flow_abs_min * 1e-9)
+            branch_flow_matrix = np.where(branch_flow_matrix_valid_index, branch_flow_matrix, branch_flow_abs_min)
+
+            # Calculate branch loss coefficient and jacobian diagonal entries.
+            branch_loss_coefficient_matrix = thermal_grid_model.get_branch_loss_coefficient_vector(branch_flow_matrix)
+            jacobian_branch_head_loss = 2 * np.abs(branch_flow_matrix) * branch_loss_coefficient_matrix
+            jacobian_branch_head_loss_inverse = (
+                0.5 * np.abs(branch_flow_matrix) ** -1 * branch_loss_coefficient_matrix**-1
+            )
+
+            # Calculate nodal head matrix.
+            # - The nodal head equations of all columns are stacked into a single block-diagonal system.
+            branch_incidence_matrix_no_source_stacked = sp.kron(
+                sp.identity(len(columns)), thermal_grid_model.branch_incidence_matrix_no_source
+            )
+            node_head_matrix_estimate_no_source = np.reshape(
+                scipy.sparse.linalg.spsolve(
+                    (
+                        np.transpose(branch_incidence_matrix_no_source_stacked)
+                        @ sp.diags(np.ravel(jacobian_branch_head_loss_inverse, order="F"))
+                        @ branch_incidence_matrix_no_source_stacked
+                    ).tocsc(),
+                    np.ravel(
+                        -1.0
+                        * np.transpose(thermal_grid_model.branch_incidence_matrix_no_source)
+                        @ (
+                            jacobian_branch_head_loss_inverse
+                            * (
+                                (0.5 * jacobian_branch_head_loss * branch_flow_matrix)
+                                - np.transpose([branch_head_vector_source])
+                            )
+                        )
+                        + node_flow_matrix_no_source[:, columns],
+                        order="F",
+                    ),
+                ),
+                (-1, len(columns)),
+                order="F",
+            )
+            node_head_matrix_estimate[:, columns] = (
+                thermal_grid_model.node_incidence_matrix_no_source @ node_head_matrix_estimate_no_source
+                + np.transpose([node_head_vector_source])
+            )
+
+            # Calculate branch volume flow matrix.
+            branch_flow_matrix_estimate = branch_flow_matrix - jacobian_branch_head_loss_inverse * (
+                (0.5 * jacobian_branch_head_loss * branch_flow_matrix)
+                + (-1.0 * thermal_grid_model.branch_incidence_matrix @ node_head_matrix_estimate[:, columns])
+            )
+
+            # Update head change iteration variable.
+            head_change[columns] = np.max(
+                np.abs(node_head_matrix_estimate_no_source - node_head_matrix_initial_no_source[:, columns]), axis=0
+            )
+
+            # Update initial values for next iteration.
+            node_head_matrix_initial_no_source[:, columns] = node_head_matrix_estimate_no_source
+            branch_flow_matrix_initial[:, columns] = branch_flow_matrix_estimate
+
+            # Update iteration counter and convergence mask.
+            head_iteration[columns] += 1
+            is_iterating = (head_iteration < head_iteration_limit) & (head_change > head_tolerance)
+
+        # Reaching the iteration limit is considered undesired and triggers a warning.
+        if (head_iteration >= head_iteration_limit).any():
+            logger.warning(
+                "Newton-Raphson solution algorithm reached "
+                f"maximum limit of {head_iteration_limit} iterations "
+                f"for {np.count_nonzero(head_iteration >= head_iteration_limit)} of {solution_count} solutions."
+            )
+
+        # Obtain pump power losses.
+        pump_powers = ThermalPowerFlowSolutionBase.get_pump_power_batch(
+            thermal_grid_model, der_flow_vectors, np.transpose(node_head_matrix_estimate)
+        )
+
+        return (np.transpose(node_head_matrix_estimate), np.transpose(branch_flow_matrix_initial), pump_powers)
+
 
 class ThermalPowerFlowSolution(ThermalPowerFlowSolutionBase):
     """Thermal grid power flow solution object."""
@@ -600,11 +881,40 @@ class ThermalPowerFlowSolution(ThermalPowerFlowSolutionBase):
             # Use Newton-Raphson method.
             ThermalPowerFlowSolutionNewtonRaphson.__init__(self, thermal_grid_model, der_thermal_power_vector)
 
+    @staticmethod
+    def get_solution_batch(
+        thermal_grid_model: ThermalGridModel, der_thermal_power_vectors: np.ndarray
+    ) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get nodal head vectors, branch volume flow vectors and pump power losses for multiple DER thermal power
+        vectors in batch, depending on whether network is radial or meshed."""
+
+        if len(thermal_grid_model.branch_loops) == 0:
+            return ThermalPowerFlowSolutionExplicit.get_solution_batch(thermal_grid_model, der_thermal_power_vectors)
+        else:
+            return ThermalPowerFlowSolutionNewtonRaphson.get_solution_batch(
+                thermal_grid_model, der_thermal_power_vectors
+            )
+
 
 class ThermalPowerFlowSolutionSet(mesmo.utils.ObjectBase):
-    power_flow_solutions: typing.Dict[pd.Timestamp, ThermalPowerFlowSolution]
+    """Thermal power flow solution set object, consisting of the thermal power flow solutions for all timesteps of
+    the given DER thermal power vector timeseries.
+
+    - For the explicit and Newton-Raphson thermal power flow, i.e. if `power_flow_solution_method` is
+      `ThermalPowerFlowSolution`, `ThermalPowerFlowSolutionExplicit` or `ThermalPowerFlowSolutionNewtonRaphson`,
+      the thermal power flow is solved for all timesteps in batch via `get_solution_batch()` of the respective
+      power flow solution class, unless `use_batch_solution` is set to False. Otherwise, the thermal power flow
+      is solved separately for each timestep via `power_flow_solution_method`.
+    - Solutions are stored as timeseries in `node_head_vector`, `branch_flow_vector` and `pump_power`, as well as
+      per timestep in `power_flow_solutions`.
+    """
+
+    power_flow_solutions: typing.Dict[pd.Timestamp, ThermalPowerFlowSolutionBase]
     thermal_grid_model: ThermalGridModel
     der_thermal_power_vector: pd.DataFrame
+    node_head_vector: pd.DataFrame
+    branch_flow_vector: pd.DataFrame
+    pump_power: pd.DataFrame
     timesteps: pd.Index
 
     @multimethod
@@ -621,6 +931,7 @@ class ThermalPowerFlowSolutionSet(mesmo.utils.ObjectBase):
         thermal_grid_model: ThermalGridModel,
         der_thermal_power_vector: pd.DataFrame,
         power_flow_solution_method=ThermalPowerFlowSolution,
+        use_batch_solution: bool = True,
     ):
         # Store attributes.
         self.thermal_grid_model = thermal_grid_model
@@ -628,11 +939,49 @@ class ThermalPowerFlowSolutionSet(mesmo.utils.ObjectBase):
         self.timesteps = self.thermal_grid_model.timesteps
 
         # Obtain power flow solutions.
-        power_flow_solutions = mesmo.utils.starmap(
-            power_flow_solution_method, zip(itertools.repeat(self.thermal_grid_model), der_thermal_power_vector.values)
-        )
+        if use_batch_solution and (
+            power_flow_solution_method
+            in [ThermalPowerFlowSolution, ThermalPowerFlowSolutionExplicit, ThermalPowerFlowSolutionNewtonRaphson]
+        ):
+            # Solve for all timesteps in batch.
+            der_thermal_power_vectors = der_thermal_power_vector.values.astype(float)
+            node_head_vectors, branch_flow_vectors, pump_powers = power_flow_solution_method.get_solution_batch(
+                self.thermal_grid_model, der_thermal_power_vectors
+            )
+
+            # Obtain power flow solution objects for each timestep.
+            power_flow_solutions = list()
+            for index in range(len(der_thermal_power_vectors)):
+                power_flow_solution = ThermalPowerFlowSolutionBase()
+                power_flow_solution.der_thermal_power_vector = der_thermal_power_vectors[index, :]
+                power_flow_solution.node_head_vector = node_head_vectors[index, :]
+                power_flow_solution.branch_flow_vector = branch_flow_vectors[index, :]
+                power_flow_solution.pump_power = pump_powers[index]
+                power_flow_solutions.append(power_flow_solution)
+        else:
+            # Solve separately for each timestep.
+            power_flow_solutions = mesmo.utils.starmap(
+                power_flow_solution_method,
+                zip(itertools.repeat(self.thermal_grid_model), der_thermal_power_vector.values),
+            )
+            node_head_vectors = np.array(
+                [power_flow_solution.node_head_vector for power_flow_solution in power_flow_solutions]
+            )
+            branch_flow_vectors = np.array(
+                [power_flow_solution.branch_flow_vector for power_flow_solution in power_flow_solutions]
+            )
+            pump_powers = np.array([power_flow_solution.pump_power for power_flow_solution in power_flow_solutions])
         self.power_flow_solutions = dict(zip(self.timesteps, power_flow_solutions))
 
+        # Store solution timeseries.
+        self.node_head_vector = pd.DataFrame(
+            node_head_vectors, index=self.timesteps, columns=self.thermal_grid_model.nodes
+        )
+        self.branch_flow_vector = pd.DataFrame(
+            branch_flow_vectors, index=self.timesteps, columns=self.thermal_grid_model.branches
+        )
+        self.pump_power = pd.DataFrame(pump_powers, index=self.timesteps, columns=["total"])
+
     def get_results(self) -> ThermalGridOperationResults:
         raise NotImplementedError
 
@@ -641,7 +990,7 @@ class LinearThermalGridModelBase(mesmo.utils.ObjectBase):
     """Linear thermal grid model object."""
 
     thermal_grid_model: ThermalGridModel
-    thermal_power_flow_solution: ThermalPowerFlowSolution
+    thermal_power_flow_solution: ThermalPowerFlowSolutionBase
     sensitivity_branch_flow_by_node_power: sp.spmatrix
     sensitivity_branch_flow_by_der_power: sp.spmatrix
     sensitivity_node_head_by_node_power: sp.spmatrix
@@ -667,6 +1016,19 @@ class LinearThermalGridModelBase(mesmo.utils.ObjectBase):
 
 
 class LinearThermalGridModelGlobal(LinearThermalGridModelBase):
+    """Linear thermal grid model object based on global approximations.
+
+    Note:
+        Only the sensitivity matrices by DER power are stored upon instantiation. The sensitivity matrices by nodal
+        power, e.g. `sensitivity_node_head_by_node_power`, are calculated upon first access via
+        :meth:`get_sensitivity_matrices` and retained for subsequent accesses, because these are of dimension
+        (..., number of nodes) and are not needed in all use cases.
+    """
+
+    jacobian_branch_head_loss_inverse: sp.spmatrix
+    jacobian_node_head_no_source_factorization: typing.Optional[scipy.sparse.linalg.SuperLU]
+    sensitivity_matrices_by_node_power: typing.Optional[typing.Dict[str, sp.spmatrix]]
+
     # Enable calls to `__init__` method definitions in parent class.
     @multimethod
     def __init__(self, *args, **kwargs):
@@ -676,7 +1038,7 @@ class LinearThermalGridModelGlobal(LinearThermalGridModelBase):
     def __init__(
         self,
         thermal_grid_model: ThermalGridModel,
-        thermal_power_flow_solution: ThermalPowerFlowSolution,
+        thermal_power_flow_solution: ThermalPowerFlowSolutionBase,
     ):
         # Store thermal grid model.
         self.thermal_grid_model = thermal_grid_model
@@ -685,7 +1047,6 @@ class LinearThermalGridModelGlobal(LinearThermalGridModelBase):
         self.thermal_power_flow_solution = thermal_power_flow_solution
 
         # Obtain linearization reference point.
-        der_power_vector_reference = self.thermal_power_flow_solution.der_thermal_power_vector
         branch_flow_vector_reference = self.thermal_power_flow_solution.branch_flow_vector.copy()
 
         # Replace zero branch volume flows with very small value, based on minium absolute branch volume flow.
@@ -702,66 +1063,136 @@ class LinearThermalGridModelGlobal(LinearThermalGridModelBase):
         branch_loss_coefficient_vector = thermal_grid_model.get_branch_loss_coefficient_vector(
             branch_flow_vector_reference
         )
-        jacobian_branch_head_loss_inverse = (
-            0.5 * sp.diags(np.abs(branch_flow_vector_reference) ** -1) @ sp.diags(branch_loss_coefficient_vector**-1)
-        )
+        self.jacobian_branch_head_loss_inverse = sp.diags(
+            0.5 * np.abs(branch_flow_vector_reference) ** -1 * branch_loss_coefficient_vector**-1
+        )
+        self.jacobian_node_head_no_source_factorization = None
+        self.sensitivity_matrices_by_node_power = None
+
+        # Obtain sensitivity matrices by DER power.
+        # - Only the sensitivity matrices by DER power are stored, such that the memory scales with the number of
+        #   nodes times the number of DERs. Sensitivity matrices by nodal power are obtained on demand.
+        sensitivity_matrices = self.get_sensitivity_matrices(self.thermal_grid_model.der_node_incidence_matrix)
+        self.sensitivity_node_head_by_der_power = sensitivity_matrices["node_head"]
+        self.sensitivity_branch_flow_by_der_power = sensitivity_matrices["branch_flow"]
+        self.sensitivity_pump_power_by_der_power = sensitivity_matrices["pump_power"]
+
+    def __getstate__(self):
+        # Exclude factorization from pickling / copying, because `SuperLU` objects cannot be pickled.
+        # - Sensitivity matrices by nodal power are excluded as well, to limit the size.
+        # - The factorization and sensitivity matrices are recomputed when first needed.
+        state = self.__dict__.copy()
+        state["jacobian_node_head_no_source_factorization"] = None
+        state["sensitivity_matrices_by_node_power"] = None
+        return state
+
+    def __getattr__(self, attribute_name):
+        # Obtain sensitivity matrices by nodal power on demand.
+        # - Note that `__getattr__` is only invoked if the attribute is not found otherwise.
+        # - Sensitivity matrices by nodal power are of dimension (..., number of nodes), hence are only calculated
+        #   upon first access and then retained, e.g. for repeated access when obtaining DLMPs for each timestep.
+        match = re.fullmatch(r"sensitivity_(node_head|branch_flow|pump_power)_by_node_power", attribute_name)
+        if match is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{attribute_name}'")
+        if self.sensitivity_matrices_by_node_power is None:
+            self.sensitivity_matrices_by_node_power = self.get_sensitivity_matrices(
+                sp.identity(len(self.thermal_grid_model.nodes), format="csr")
+            )
+        sensitivity_matrices = self.sensitivity_matrices_by_node_power
+        if match.group(1) == "pump_power":
+            # Pump power sensitivities by nodal power are defined as vector.
+            return sensitivity_matrices["pump_power"].ravel()
 
-        # Obtain sensitivity matrices.
-        self.sensitivity_node_head_by_node_power = sp.dok_matrix(
-            (len(thermal_grid_model.nodes), len(thermal_grid_model.nodes)), dtype=float
-        )
-        self.sensitivity_node_head_by_node_power[
-            np.ix_(
-                mesmo.utils.get_index(thermal_grid_model.nodes, node_type="no_source"),
-                mesmo.utils.get_index(thermal_grid_model.nodes, node_type="no_source"),
+        return sensitivity_matrices[match.group(1)]
+
+    def get_jacobian_node_head_no_source_factorization(self) -> scipy.sparse.linalg.SuperLU:
+        """Get sparse LU factorization of the no-source nodal head jacobian matrix, i.e. the no-source branch
+        incidence matrix transpose times the inverse branch head loss jacobian matrix times the no-source branch
+        incidence matrix.
+
+        - The factorization is computed upon first call and reused for subsequent calls.
+        """
+
+        if self.jacobian_node_head_no_source_factorization is None:
+            self.jacobian_node_head_no_source_factorization = scipy.sparse.linalg.splu(
+                (
+                    np.transpose(self.thermal_grid_model.branch_incidence_matrix_no_source)
+                    @ self.jacobian_branch_head_loss_inverse
+                    @ self.thermal_grid_model.branch_incidence_matrix_no_source
+                ).tocsc()
             )
-        ] = (
+
+        return self.jacobian_node_head_no_source_factorization
+
+    def get_sensitivity_matrices(self, node_power_incidence_matrix: sp.spmatrix) -> typing.Dict[str, sp.spmatrix]:
+        """Get sensitivity matrices for nodal head / branch volume flow / pump power by thermal power of the given
+        power injections.
+
+        - Power injections are defined by the incidence matrix of dimension (number of nodes, number of power
+          injections), e.g., the DER node incidence matrix for obtaining sensitivity matrices by DER power or the
+          identity matrix for obtaining sensitivity matrices by nodal power.
+        - Sensitivity matrices are returned as dictionary with keys "node_head", "branch_flow" and "pump_power".
+        - The nodal head sensitivity matrix is obtained with a single solve of the factorized no-source nodal head
+          jacobian matrix for all power injections.
+        """
+
+        # Obtain shorthands.
+        thermal_grid_model = self.thermal_grid_model
+        node_index_no_source = mesmo.utils.get_index(thermal_grid_model.nodes, node_type="no_source")
+        node_power_incidence_matrix = sp.csr_matrix(node_power_incidence_matrix)
+
+        # Instantiate sensitivity matrices.
+        sensitivity_matrices = dict()
+
+        # Calculate nodal head sensitivity matrix.
+        sensitivity_node_head_by_power = np.zeros((len(thermal_grid_model.nodes), node_power_incidence_matrix.shape[1]))
+        sensitivity_node_head_by_power[node_index_no_source, :] = (
             (2.0**-1.5)
-            * scipy.sparse.linalg.inv(
-                np.transpose(thermal_grid_model.branch_incidence_matrix_no_source)
-                @ jacobian_branch_head_loss_inverse
-                @ thermal_grid_model.branch_incidence_matrix_no_source
+            * self.get_jacobian_node_head_no_source_factorization().solve(
+                node_power_incidence_matrix[node_index_no_source, :].toarray()
             )
-            * self.thermal_grid_model.enthalpy_difference_distribution_water
+            * thermal_grid_model.enthalpy_difference_distribution_water
         )
-        self.sensitivity_node_head_by_node_power = self.sensitivity_node_head_by_node_power.tocsr()
-        self.sensitivity_node_head_by_der_power = (
-            self.sensitivity_node_head_by_node_power @ self.thermal_grid_model.der_node_incidence_matrix
-        )
-        self.sensitivity_branch_flow_by_node_power = (
+        sensitivity_matrices["node_head"] = sp.csr_matrix(sensitivity_node_head_by_power)
+
+        # Calculate branch volume flow sensitivity matrix.
+        sensitivity_matrices["branch_flow"] = sp.csr_matrix(
             2.0
-            * jacobian_branch_head_loss_inverse
+            * self.jacobian_branch_head_loss_inverse
             @ thermal_grid_model.branch_incidence_matrix
-            @ self.sensitivity_node_head_by_node_power
+            @ sensitivity_node_head_by_power
         )
 
-        self.sensitivity_branch_flow_by_der_power = (
-            self.sensitivity_branch_flow_by_node_power @ self.thermal_grid_model.der_node_incidence_matrix
-        )
+        # Calculate pump power sensitivity matrix.
         # TODO: Revise pump power sensitivity equation.
-        self.sensitivity_pump_power_by_node_power = (
-            (
-                -1.0
-                * der_power_vector_reference
-                / mesmo.config.water_density
-                / thermal_grid_model.enthalpy_difference_distribution_water
-            )  # DER volume flow vector.
-            @ (-2.0 * np.transpose(self.thermal_grid_model.der_node_incidence_matrix))
-            @ self.sensitivity_node_head_by_node_power
-            * mesmo.config.water_density
-            * mesmo.config.gravitational_acceleration
-            / self.thermal_grid_model.distribution_pump_efficiency
-        ) + (
-            -1.0
-            * self.thermal_grid_model.energy_transfer_station_head_loss
-            * mesmo.config.gravitational_acceleration
-            / self.thermal_grid_model.enthalpy_difference_distribution_water
-            / self.thermal_grid_model.distribution_pump_efficiency
-        )
-        self.sensitivity_pump_power_by_der_power = np.array(
-            [self.sensitivity_pump_power_by_node_power @ self.thermal_grid_model.der_node_incidence_matrix]
+        sensitivity_matrices["pump_power"] = np.array(
+            [
+                (
+                    (
+                        -1.0
+                        * self.thermal_power_flow_solution.der_thermal_power_vector
+                        / mesmo.config.water_density
+                        / thermal_grid_model.enthalpy_difference_distribution_water
+                    )  # DER volume flow vector.
+                    @ (-2.0 * np.transpose(thermal_grid_model.der_node_incidence_matrix))
+                    @ sensitivity_node_head_by_power
+                    * mesmo.config.water_density
+                    * mesmo.config.gravitational_acceleration
+                    / thermal_grid_model.distribution_pump_efficiency
+                )
+                + (
+                    -1.0
+                    * thermal_grid_model.energy_transfer_station_head_loss
+                    * mesmo.config.gravitational_acceleration
+                    / thermal_grid_model.enthalpy_difference_distribution_water
+                    / thermal_grid_model.distribution_pump_efficiency
+                )
+                * np.asarray(node_power_incidence_matrix.sum(axis=0)).ravel()
+            ]
         )
 
+        return sensitivity_matrices
+
 
 class LinearThermalGridModelLocal(LinearThermalGridModelGlobal):
     # Enable calls to `__init__` method definitions in parent class.
@@ -773,14 +1204,21 @@ class LinearThermalGridModelLocal(LinearThermalGridModelGlobal):
     def __init__(
         self,
         thermal_grid_model: ThermalGridModel,
-        thermal_power_flow_solution: ThermalPowerFlowSolution,
+        thermal_power_flow_solution: ThermalPowerFlowSolutionBase,
     ):
         # Initialize linear model from global approximation method.
+        # - The nodal head sensitivities are modified for the local approximation method in
+        #   `get_sensitivity_matrices()`.
         super().__init__(thermal_grid_model, thermal_power_flow_solution)
 
+    def get_sensitivity_matrices(self, node_power_incidence_matrix: sp.spmatrix) -> typing.Dict[str, sp.spmatrix]:
+        # Obtain sensitivity matrices from global approximation method.
+        sensitivity_matrices = super().get_sensitivity_matrices(node_power_incidence_matrix)
+
         # Modify sensitivities for local approximation method.
-        self.sensitivity_node_head_by_node_power *= 2.0
-        self.sensitivity_node_head_by_der_power *= 2.0
+        sensitivity_matrices["node_head"] *= 2.0
+
+        return sensitivity_matrices
 
 
 class LinearThermalGridModelSet(mesmo.utils.ObjectBase):
@@ -818,7 +1256,7 @@ class LinearThermalGridModelSet(mesmo.utils.ObjectBase):
     def __init__(
         self,
         thermal_grid_model: ThermalGridModel,
-        thermal_power_flow_solution: ThermalPowerFlowSolution,
+        thermal_power_flow_solution: ThermalPowerFlowSolutionBase,
         linear_thermal_grid_model_method: typing.Type[LinearThermalGridModelBase] = LinearThermalGridModelGlobal,
     ):
         self.check_linear_thermal_grid_model_method(linear_thermal_grid_model_method)
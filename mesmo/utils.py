@@ -14,6 +14,7 @@ import plotly.graph_objects as go
 import plotly.io as pio
 import ray
 import re
+import scipy.sparse as sp
 import shutil
 import subprocess
 import sys
@@ -28,6 +29,21 @@ logger = mesmo.config.get_logger(__name__)
 # Instantiate dictionary for execution time logging.
 log_times = dict()
 
+# Instantiate execution time records.
+# - Records are only collected if set to a list, e.g. for benchmarking, see `log_time()`.
+log_time_records = None
+
+
+@functools.lru_cache(maxsize=None)
+def get_class_type_hints(class_type: type) -> dict:
+    """Get type hints for given class, i.e., the type declarations of its attributes.
+
+    - Cached wrapper for ``typing.get_type_hints()``, because the attribute check in ``ObjectBase.__setattr__()``
+      is performed for each attribute setting.
+    """
+
+    return typing.get_type_hints(class_type)
+
 
 class ObjectBase(object):
     """MESMO object base class, which extends the Python object base class.
@@ -53,7 +69,7 @@ class ObjectBase(object):
     def __setattr__(self, attribute_name, value):
         # Assert that attribute name is valid.
         # - Valid attributes are those which are defined as results class attributes with type declaration.
-        if not (attribute_name in typing.get_type_hints(type(self))):
+        if not (attribute_name in get_class_type_hints(type(self))):
             logger.warning(
                 f"Setting undefined attribute '{attribute_name}'. "
                 f"Please ensure that the attribute has been defined by a type declaration "
@@ -159,7 +175,10 @@ class ResultsBase(ObjectBase):
 
 
 def starmap(
-    function: typing.Callable, argument_sequence: typing.Iterable[tuple], keyword_arguments: dict = None
+    function: typing.Callable,
+    argument_sequence: typing.Iterable[tuple],
+    keyword_arguments: dict = None,
+    shared_arguments: tuple = None,
 ) -> list:
     """Utility function to execute a function for a sequence of arguments, effectively replacing a for-loop.
     Allows running repeated function calls in-parallel, based on Python's `multiprocessing` module.
@@ -167,6 +186,9 @@ def starmap(
     - If configuration parameter `run_parallel` is set to True, execution is passed to `starmap`
       of multiprocessing pool, hence running the function calls in parallel.
     - Otherwise, execution is passed to `itertools.starmap`, which is the non-parallel equivalent.
+    - Shared arguments are prepended to the arguments of each function call. For parallel execution, these are
+      placed once into the shared object store, rather than being serialized for each function call, which
+      is useful for large objects such as the electric grid model.
     """
 
     # Apply keyword arguments.
@@ -177,6 +199,8 @@ def starmap(
 
     # Ensure that argument sequence is list.
     argument_sequence = list(argument_sequence)
+    if shared_arguments is None:
+        shared_arguments = tuple()
 
     if mesmo.config.config["multiprocessing"]["run_parallel"]:
         # TODO: Remove old parallel pool traces.
@@ -194,11 +218,13 @@ def starmap(
             ray.init(num_cpus=max(int(mesmo.config.config["multiprocessing"]["cpu_share"] * os.cpu_count()), 1))
             mesmo.config.parallel_pool = True
             log_time("parallel pool setup")
-        results = ray_starmap(function_partial, argument_sequence)
+        # Shared arguments are passed as object references, which are resolved by ray on the workers.
+        shared_arguments = tuple(ray.put(argument) for argument in shared_arguments)
+        results = ray_starmap(function_partial, [(*shared_arguments, *arguments) for arguments in argument_sequence])
     else:
         # If not `run_parallel`, use for loop for sequential execution.
         results = [
-            function_partial(*arguments)
+            function_partial(*shared_arguments, *arguments)
             for arguments in tqdm.tqdm(
                 argument_sequence,
                 total=len(argument_sequence),
@@ -265,9 +291,10 @@ def ray_starmap(function_handle: typing.Callable, argument_sequence: list):
       but allows for additional modifications, e.g. progress reporting via :func:`ray_get`.
     """
 
-    return ray_get(
-        [ray.remote(lambda *args: function_handle(*args)).remote(*arguments) for arguments in argument_sequence]
-    )
+    # Define remote function only once, such that the function is not exported again for each function call.
+    function_remote = ray.remote(lambda *args: function_handle(*args))
+
+    return ray_get([function_remote.remote(*arguments) for arguments in argument_sequence])
 
 
 def log_time(label: str, log_level: str = "debug", logger_object: logging.Logger = logger):
@@ -281,6 +308,8 @@ def log_time(label: str, log_level: str = "debug", logger_object: logging.Logger
     - The logger object can be given as keyword argument. By default, uses ``utils.logger`` as logger.
     - Start message: "Starting ``label``."
     - End message: "Completed ``label`` in ``duration`` seconds."
+    - If ``log_time_records`` is set to a list, e.g. for benchmarking, (``label``, ``duration``) tuples are appended
+      to ``log_time_records`` upon each end message.
 
     Arguments:
         label (str): Label for the start / end message.
@@ -302,7 +331,10 @@ def log_time(label: str, log_level: str = "debug", logger_object: logging.Logger
         raise ValueError(f"Invalid log level: '{log_level}'")
 
     if label in log_times.keys():
-        logger_handle(f"Completed {label} in {(time_now - log_times.pop(label)):.6f} seconds.")
+        duration = time_now - log_times.pop(label)
+        logger_handle(f"Completed {label} in {duration:.6f} seconds.")
+        if log_time_records is not None:
+            log_time_records.append((label, duration))
     else:
         log_times[label] = time_now
         logger_handle(f"Starting {label}.")
@@ -391,6 +423,56 @@ def get_element_phases_array(element: pd.Series):
     return phases_array
 
 
+def get_element_phases_arrays(elements: pd.DataFrame) -> typing.List[np.ndarray]:
+    """Utility function for obtaining the list of connected phases for all elements of given element data, i.e.,
+    the result of `get_element_phases_array()` for each row of the element data."""
+
+    # Obtain list of connected phases for each element.
+    phases_arrays = [
+        np.flatnonzero(is_phase_connected) + 1
+        for is_phase_connected in (
+            elements.loc[:, ["is_phase_1_connected", "is_phase_2_connected", "is_phase_3_connected"]].values == 1
+        )
+    ]
+
+    return phases_arrays
+
+
+def get_sparse_matrix_from_blocks(
+    blocks: typing.List[typing.Tuple[np.ndarray, np.ndarray, np.ndarray]], shape: typing.Tuple[int, int], dtype=float
+) -> sp.csr_matrix:
+    """Utility function for obtaining sparse matrix from given list of matrix blocks, where each block is given as
+    tuple of row index, column index and block matrix, i.e., the block matrix is added to the entries at
+    ``np.ix_(row_index, column_index)``.
+
+    - Entries of overlapping blocks are summed in the order of the given blocks, such that the result is identical
+      to adding the blocks successively to a `sp.dok_matrix`.
+    - Block entries are collected as COO triplets, which avoids the element-wise indexing of `sp.dok_matrix`.
+    - Zero entries are not stored in the resulting matrix.
+    """
+
+    # Obtain COO triplets.
+    if len(blocks) > 0:
+        rows = np.concatenate([np.repeat(row_index, len(column_index)) for row_index, column_index, _ in blocks])
+        columns = np.concatenate([np.tile(column_index, len(row_index)) for row_index, column_index, _ in blocks])
+        values = np.concatenate([np.ravel(block) for _, _, block in blocks])
+    else:
+        rows = columns = values = np.array([], dtype=int)
+
+    # Sum duplicate entries in the order of the given blocks.
+    # - Using `np.add.at()`, because it sums sequentially, whereas the summation order of duplicate entries
+    #   is not defined when converting COO matrices.
+    entries, entries_inverse = np.unique(rows.astype(np.int64) * shape[1] + columns, return_inverse=True)
+    entries_values = np.zeros(len(entries), dtype=dtype)
+    np.add.at(entries_values, entries_inverse, values)
+
+    # Obtain sparse matrix.
+    matrix = sp.csr_matrix((entries_values, (entries // shape[1], entries % shape[1])), shape=shape, dtype=dtype)
+    matrix.eliminate_zeros()
+
+    return matrix
+
+
 def get_element_phases_string(element: pd.Series):
     """Utility function for obtaining the OpenDSS phases string for given element data."""
 
@@ -1,5 +1,7 @@
 """Test DER models."""
 
+import numpy as np
+import pandas as pd
 import unittest
 
 import mesmo
@@ -133,6 +135,45 @@ class TestDERModels(unittest.TestCase):
         mesmo.der_models.DERModelSet(mesmo.config.config["tests"]["scenario_name"])
         mesmo.utils.log_time("test_der_model_set", log_level="info", logger_object=logger)
 
+    def test_der_model_set_define_optimization_objective(self):
+        # Obtain test data.
+        der_model_set = mesmo.der_models.DERModelSet(mesmo.config.config["tests"]["scenario_name"])
+        price_data = mesmo.data_interface.PriceData(mesmo.config.config["tests"]["scenario_name"])
+        optimization_problem = mesmo.solutions.OptimizationProblem()
+        der_model_set.define_optimization_variables(optimization_problem)
+        der_model_set.define_optimization_parameters(optimization_problem, price_data)
+
+        # Get actual result.
+        mesmo.utils.log_time("test_der_model_set_define_optimization_objective", log_level="info", logger_object=logger)
+        der_model_set.define_optimization_objective(optimization_problem)
+        mesmo.utils.log_time("test_der_model_set_define_optimization_objective", log_level="info", logger_object=logger)
+        actual = optimization_problem.get_c_vector()[
+            0, optimization_problem.get_variable_index(name="der_active_power_vector")
+        ]
+
+        # Define expected result.
+        # - Active power cost based on price timeseries plus marginal cost of each electric DER.
+        timestep_interval_hours = (der_model_set.timesteps[1] - der_model_set.timesteps[0]) / pd.Timedelta("1h")
+        expected = (
+            price_data.price_timeseries.loc[
+                :, [("active_power", der_type, der_name) for der_type, der_name in der_model_set.electric_ders]
+            ].values
+            * -1.0
+            * timestep_interval_hours
+            * der_model_set.der_active_power_vector_reference
+            + np.array(
+                [
+                    der_model_set.der_models[der_name].marginal_cost
+                    * timestep_interval_hours
+                    * der_model_set.der_models[der_name].active_power_nominal
+                    for der_type, der_name in der_model_set.electric_ders
+                ]
+            )
+        ).ravel()
+
+        # Compare expected and actual.
+        np.testing.assert_allclose(actual, expected)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,11 @@
 """Test electric grid models."""
 
+import copy
 import inspect
+import numpy as np
+import pandas as pd
 from parameterized import parameterized
+import scipy.sparse.linalg
 import unittest
 
 import mesmo
@@ -40,6 +44,324 @@ class TestElectricGridModels(unittest.TestCase):
             object_handle(mesmo.config.config["tests"]["scenario_name"])
         mesmo.utils.log_time(f"test `{object_name}`", log_level="info", logger_object=logger)
 
+    def test_electric_grid_model_matrices(self):
+        # Get actual result.
+        mesmo.utils.log_time("test_electric_grid_model_matrices", log_level="info", logger_object=logger)
+        electric_grid_model = mesmo.electric_grid_models.ElectricGridModel(
+            mesmo.config.config["tests"]["scenario_name"]
+        )
+        mesmo.utils.log_time("test_electric_grid_model_matrices", log_level="info", logger_object=logger)
+
+        # Define expected result.
+        # - Nodal admittance matrix is composed of the branch admittance matrices of all branches.
+        expected = (
+            electric_grid_model.branch_incidence_1_matrix.transpose() @ electric_grid_model.branch_admittance_1_matrix
+            + electric_grid_model.branch_incidence_2_matrix.transpose() @ electric_grid_model.branch_admittance_2_matrix
+        )
+
+        # Compare expected and actual.
+        np.testing.assert_allclose(electric_grid_model.node_admittance_matrix.toarray(), expected.toarray())
+        self.assertTrue(electric_grid_model.node_admittance_matrix.has_canonical_format)
+        # Each DER is connected to at least one node.
+        np.testing.assert_array_equal(
+            (
+                abs(electric_grid_model.der_incidence_wye_matrix) + abs(electric_grid_model.der_incidence_delta_matrix)
+            ).sum(axis=0)
+            > 0,
+            True,
+        )
+
+    def test_get_node_admittance_matrix_no_source_factorization(self):
+        # Obtain electric grid model.
+        electric_grid_model = mesmo.electric_grid_models.ElectricGridModel(
+            mesmo.config.config["tests"]["scenario_name"]
+        )
+        right_hand_side = electric_grid_model.node_voltage_vector_reference_no_source
+
+        # Define expected result.
+        expected = scipy.sparse.linalg.spsolve(electric_grid_model.node_admittance_matrix_no_source, right_hand_side)
+
+        # Get actual result.
+        mesmo.utils.log_time(
+            "test_get_node_admittance_matrix_no_source_factorization", log_level="info", logger_object=logger
+        )
+        factorization = electric_grid_model.get_node_admittance_matrix_no_source_factorization()
+        actual = factorization.solve(right_hand_side)
+        mesmo.utils.log_time(
+            "test_get_node_admittance_matrix_no_source_factorization", log_level="info", logger_object=logger
+        )
+
+        # Compare expected and actual.
+        np.testing.assert_allclose(actual, expected)
+        # Factorization is reused for subsequent calls.
+        self.assertIs(electric_grid_model.get_node_admittance_matrix_no_source_factorization(), factorization)
+        # Factorization is excluded from copies and recomputed when needed.
+        electric_grid_model_copy = copy.deepcopy(electric_grid_model)
+        self.assertIsNone(electric_grid_model_copy.node_admittance_matrix_no_source_factorization)
+        np.testing.assert_allclose(
+            electric_grid_model_copy.get_node_admittance_matrix_no_source_factorization().solve(right_hand_side),
+            expected,
+        )
+
+    def test_power_flow_solution_z_bus(self):
+        # Obtain electric grid model.
+        electric_grid_model = mesmo.electric_grid_models.ElectricGridModel(
+            mesmo.config.config["tests"]["scenario_name"]
+        )
+
+        # Define expected result.
+        expected = mesmo.electric_grid_models.PowerFlowSolutionFixedPoint(electric_grid_model).node_voltage_vector
+
+        # Get actual result.
+        mesmo.utils.log_time("test_power_flow_solution_z_bus", log_level="info", logger_object=logger)
+        actual = mesmo.electric_grid_models.PowerFlowSolutionZBus(electric_grid_model).node_voltage_vector
+        mesmo.utils.log_time("test_power_flow_solution_z_bus", log_level="info", logger_object=logger)
+
+        # Compare expected and actual.
+        np.testing.assert_allclose(actual, expected, rtol=1e-5)
+
+    def test_power_flow_solution_newton_raphson(self):
+        # Obtain electric grid model.
+        electric_grid_model = mesmo.electric_grid_models.ElectricGridModel(
+            mesmo.config.config["tests"]["scenario_name"]
+        )
+
+        # Define expected result.
+        expected = mesmo.electric_grid_models.PowerFlowSolutionZBus(
+            electric_grid_model, voltage_tolerance=1e-9
+        ).node_voltage_vector
+
+        # Get actual result.
+        mesmo.utils.log_time("test_power_flow_solution_newton_raphson", log_level="info", logger_object=logger)
+        actual = mesmo.electric_grid_models.PowerFlowSolutionNewtonRaphson(
+            electric_grid_model, voltage_tolerance=1e-9
+        ).node_voltage_vector
+        mesmo.utils.log_time("test_power_flow_solution_newton_raphson", log_level="info", logger_object=logger)
+
+        # Compare expected and actual.
+        np.testing.assert_allclose(actual, expected, rtol=1e-8)
+
+    def test_power_flow_solution_set_batch(self):
+        # Obtain electric grid model and DER power vector timeseries.
+        electric_grid_model = mesmo.electric_grid_models.ElectricGridModel(
+            mesmo.config.config["tests"]["scenario_name"]
+        )
+        der_power_vector = pd.DataFrame(
+            np.outer(
+                np.linspace(0.0, 1.5, len(electric_grid_model.timesteps)),
+                electric_grid_model.der_power_vector_reference,
+            ),
+            index=electric_grid_model.timesteps,
+            columns=electric_grid_model.ders,
+        )
+
+        for power_flow_solution_method in [
+            mesmo.electric_grid_models.PowerFlowSolutionFixedPoint,
+            mesmo.electric_grid_models.PowerFlowSolutionZBus,
+            mesmo.electric_grid_models.PowerFlowSolutionNewtonRaphson,
+        ]:
+            with self.subTest(power_flow_solution_method=power_flow_solution_method.__name__):
+                # Define expected result.
+                expected = mesmo.electric_grid_models.PowerFlowSolutionSet(
+                    electric_grid_model,
+                    der_power_vector,
+                    power_flow_solution_method=power_flow_solution_method,
+                    use_batch_solution=False,
+                )
+
+                # Get actual result.
+                mesmo.utils.log_time("test_power_flow_solution_set_batch", log_level="info", logger_object=logger)
+                actual = mesmo.electric_grid_models.PowerFlowSolutionSet(
+                    electric_grid_model, der_power_vector, power_flow_solution_method=power_flow_solution_method
+                )
+                mesmo.utils.log_time("test_power_flow_solution_set_batch", log_level="info", logger_object=logger)
+
+                # Compare expected and actual.
+                for attribute_name in ["node_voltage_vector", "branch_power_vector_1", "branch_power_vector_2", "loss"]:
+                    np.testing.assert_allclose(
+                        getattr(actual, attribute_name).values, getattr(expected, attribute_name).values, rtol=1e-6
+                    )
+                for timestep in electric_grid_model.timesteps:
+                    np.testing.assert_allclose(
+                        actual.power_flow_solutions[timestep].node_voltage_vector,
+                        expected.power_flow_solutions[timestep].node_voltage_vector,
+                        rtol=1e-9,
+                    )
+
+    def test_power_flow_solution_set_warm_start(self):
+        # Obtain electric grid model and DER power vector timeseries.
+        electric_grid_model = mesmo.electric_grid_models.ElectricGridModel(
+            mesmo.config.config["tests"]["scenario_name"]
+        )
+        der_power_vector = pd.DataFrame(
+            np.outer(
+                np.linspace(0.5, 1.0, len(electric_grid_model.timesteps)),
+                electric_grid_model.der_power_vector_reference,
+            ),
+            index=electric_grid_model.timesteps,
+            columns=electric_grid_model.ders,
+        )
+
+        # Define expected result.
+        expected = mesmo.electric_grid_models.PowerFlowSolutionSet(
+            electric_grid_model, der_power_vector, use_batch_solution=False
+        )
+        expected_iteration_count = sum(
+            mesmo.electric_grid_models.PowerFlowSolutionFixedPoint.get_voltage_with_iteration_count(
+                electric_grid_model, der_power_vector.loc[timestep, :].values
+            )[1]
+            for timestep in electric_grid_model.timesteps
+        )
+
+        # Get actual result.
+        mesmo.utils.log_time("test_power_flow_solution_set_warm_start", log_level="info", logger_object=logger)
+        actual = mesmo.electric_grid_models.PowerFlowSolutionSet(
+            electric_grid_model, der_power_vector, use_warm_start=True
+        )
+        mesmo.utils.log_time("test_power_flow_solution_set_warm_start", log_level="info", logger_object=logger)
+
+        # Compare expected and actual.
+        # - Warm-started and cold-started solutions are only equal within the fixed point voltage tolerance.
+        np.testing.assert_allclose(actual.node_voltage_vector.values, expected.node_voltage_vector.values, atol=1e-3)
+        self.assertIsNone(expected.voltage_iteration_count)
+        self.assertTrue((actual.voltage_iteration_count.index == electric_grid_model.timesteps).all())
+        self.assertLessEqual(actual.voltage_iteration_count.sum(), expected_iteration_count)
+
+    def test_power_flow_solution_set_get_results(self):
+        # Obtain electric grid model and power flow solution set.
+        electric_grid_model = mesmo.electric_grid_models.ElectricGridModel(
+            mesmo.config.config["tests"]["scenario_name"]
+        )
+        der_power_vector = pd.DataFrame(
+            np.outer(
+                np.linspace(0.5, 1.0, len(electric_grid_model.timesteps)),
+                electric_grid_model.der_power_vector_reference,
+            ),
+            index=electric_grid_model.timesteps,
+            columns=electric_grid_model.ders,
+        )
+        power_flow_solution_set = mesmo.electric_grid_models.PowerFlowSolutionSet(electric_grid_model, der_power_vector)
+
+        # Define expected result.
+        expected = pd.DataFrame(
+            [
+                np.abs(power_flow_solution_set.power_flow_solutions[timestep].branch_power_vector_1)
+                / electric_grid_model.branch_power_vector_magnitude_reference
+                for timestep in electric_grid_model.timesteps
+            ],
+            index=electric_grid_model.timesteps,
+            columns=electric_grid_model.branches,
+        )
+
+        # Get actual result.
+        mesmo.utils.log_time("test_power_flow_solution_set_get_results", log_level="info", logger_object=logger)
+        results = power_flow_solution_set.get_results()
+        mesmo.utils.log_time("test_power_flow_solution_set_get_results", log_level="info", logger_object=logger)
+        actual = results.branch_power_magnitude_vector_1_per_unit
+
+        # Compare expected and actual.
+        pd.testing.assert_frame_equal(actual, expected)
+        pd.testing.assert_frame_equal(
+            results.der_active_power_vector, der_power_vector.apply(np.real), check_dtype=False
+        )
+
+    def test_linear_electric_grid_model_global_sensitivity_matrices(self):
+        # Obtain electric grid model and power flow solution.
+        electric_grid_model = mesmo.electric_grid_models.ElectricGridModel(
+            mesmo.config.config["tests"]["scenario_name"]
+        )
+        power_flow_solution = mesmo.electric_grid_models.PowerFlowSolutionFixedPoint(electric_grid_model)
+
+        # Get actual result.
+        mesmo.utils.log_time(
+            "test_linear_electric_grid_model_global_sensitivity_matrices", log_level="info", logger_object=logger
+        )
+        linear_electric_grid_model = mesmo.electric_grid_models.LinearElectricGridModelGlobal(
+            electric_grid_model, power_flow_solution
+        )
+        mesmo.utils.log_time(
+            "test_linear_electric_grid_model_global_sensitivity_matrices", log_level="info", logger_object=logger
+        )
+
+        # Compare sensitivity matrices by DER power with sensitivity matrices by nodal power, which are
+        # obtained on demand.
+        for sensitivity_type in ["voltage", "voltage_magnitude", "branch_power_1_magnitude", "loss_active"]:
+            for power_type in ["active", "reactive"]:
+                with self.subTest(sensitivity_type=sensitivity_type, power_type=power_type):
+                    expected = (
+                        getattr(linear_electric_grid_model, f"sensitivity_{sensitivity_type}_by_power_wye_{power_type}")
+                        @ electric_grid_model.der_incidence_wye_matrix
+                        + getattr(
+                            linear_electric_grid_model, f"sensitivity_{sensitivity_type}_by_power_delta_{power_type}"
+                        )
+                        @ electric_grid_model.der_incidence_delta_matrix
+                    )
+                    actual = getattr(
+                        linear_electric_grid_model, f"sensitivity_{sensitivity_type}_by_der_power_{power_type}"
+                    )
+                    np.testing.assert_allclose(actual.toarray(), expected.toarray(), rtol=1e-9, atol=1e-12)
+        # Nodal sensitivity matrices are not stored as attributes, but retained upon first access, such that repeated
+        # access does not recompute the sensitivity matrices.
+        self.assertNotIn("sensitivity_voltage_by_power_wye_active", vars(linear_electric_grid_model))
+        self.assertEqual(set(linear_electric_grid_model.sensitivity_matrices_by_node_power), {"wye", "delta"})
+        sensitivity_matrices_by_node_power = linear_electric_grid_model.sensitivity_matrices_by_node_power.copy()
+        for sensitivity_type in ["voltage", "voltage_magnitude", "branch_power_1_magnitude", "loss_active"]:
+            for connection in ["wye", "delta"]:
+                with self.subTest(sensitivity_type=sensitivity_type, connection=connection):
+                    self.assertIs(
+                        getattr(
+                            linear_electric_grid_model, f"sensitivity_{sensitivity_type}_by_power_{connection}_active"
+                        ),
+                        sensitivity_matrices_by_node_power[connection][sensitivity_type, "active"],
+                    )
+        self.assertEqual(
+            linear_electric_grid_model.sensitivity_matrices_by_node_power, sensitivity_matrices_by_node_power
+        )
+        # Retained sensitivity matrices are excluded from copies.
+        self.assertEqual(linear_electric_grid_model.copy().sensitivity_matrices_by_node_power, dict())
+
+    def test_linear_electric_grid_model_set_update(self):
+        # Obtain electric grid model and linear electric grid model set.
+        electric_grid_model = mesmo.electric_grid_models.ElectricGridModel(
+            mesmo.config.config["tests"]["scenario_name"]
+        )
+        der_power_vector = pd.DataFrame(
+            np.outer(np.ones(len(electric_grid_model.timesteps)), electric_grid_model.der_power_vector_reference),
+            index=electric_grid_model.timesteps,
+            columns=electric_grid_model.ders,
+        )
+        power_flow_solution_set = mesmo.electric_grid_models.PowerFlowSolutionSet(electric_grid_model, der_power_vector)
+        linear_electric_grid_model_set = mesmo.electric_grid_models.LinearElectricGridModelSet(
+            electric_grid_model, power_flow_solution_set
+        )
+        linear_electric_grid_models_initial = linear_electric_grid_model_set.linear_electric_grid_models.copy()
+
+        # Modify DER power vector for subset of timesteps.
+        timesteps_changed = electric_grid_model.timesteps[::3]
+        der_power_vector.loc[timesteps_changed, :] *= 0.5
+        power_flow_solution_set = mesmo.electric_grid_models.PowerFlowSolutionSet(electric_grid_model, der_power_vector)
+
+        # Define expected result.
+        expected = mesmo.electric_grid_models.LinearElectricGridModelSet(electric_grid_model, power_flow_solution_set)
+
+        # Get actual result.
+        mesmo.utils.log_time("test_linear_electric_grid_model_set_update", log_level="info", logger_object=logger)
+        timesteps_update = linear_electric_grid_model_set.update_linear_electric_grid_models(power_flow_solution_set)
+        mesmo.utils.log_time("test_linear_electric_grid_model_set_update", log_level="info", logger_object=logger)
+
+        # Compare expected and actual.
+        pd.testing.assert_index_equal(timesteps_update, timesteps_changed)
+        for timestep in electric_grid_model.timesteps:
+            actual_model = linear_electric_grid_model_set.linear_electric_grid_models[timestep]
+            expected_model = expected.linear_electric_grid_models[timestep]
+            if timestep in timesteps_changed:
+                np.testing.assert_allclose(
+                    actual_model.sensitivity_voltage_magnitude_by_der_power_active.toarray(),
+                    expected_model.sensitivity_voltage_magnitude_by_der_power_active.toarray(),
+                )
+            else:
+                self.assertIs(actual_model, linear_electric_grid_models_initial[timestep])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,437 @@
+"""Test solutions."""
+
+import itertools
+import numpy as np
+import pandas as pd
+import pathlib
+import scipy.sparse as sp
+import tempfile
+import unittest
+
+import mesmo
+
+logger = mesmo.config.get_logger(__name__)
+
+
+class TestSolutions(unittest.TestCase):
+    def test_define_variable(self):
+        # Define expected result.
+        timesteps = pd.date_range("2020-01-01", periods=3, freq="H")
+        ders = pd.MultiIndex.from_tuples([("fixed_load", "1"), ("fixed_load", "2")])
+        expected = pd.concat(
+            [
+                pd.DataFrame(columns=["name", "timestep", "variable_type"]),
+                pd.DataFrame(
+                    itertools.product(["der_vector"], ["continuous"], [None], timesteps, list(ders)),
+                    columns=["name", "variable_type", "scenario", "timestep", "der"],
+                ),
+                pd.DataFrame(
+                    itertools.product(["der_vector"], ["continuous"], [None], timesteps, [("fixed_load", "3")]),
+                    columns=["name", "variable_type", "scenario", "timestep", "der"],
+                ),
+                pd.DataFrame(
+                    itertools.product(["index_vector"], ["binary"], range(3)),
+                    columns=["name", "variable_type", "index"],
+                ),
+            ],
+            ignore_index=True,
+        )
+
+        # Get actual result.
+        mesmo.utils.log_time("test_define_variable", log_level="info", logger_object=logger)
+        optimization_problem = mesmo.solutions.OptimizationProblem()
+        optimization_problem.define_variable("der_vector", scenario=[None], timestep=timesteps, der=ders)
+        # Duplicate definitions are expected to be ignored, also for partially overlapping definitions.
+        optimization_problem.define_variable("der_vector", scenario=[None], timestep=timesteps, der=ders)
+        optimization_problem.define_variable(
+            "der_vector",
+            scenario=[None],
+            timestep=timesteps,
+            der=pd.MultiIndex.from_tuples([("fixed_load", "3"), ("fixed_load", "1")]),
+        )
+        optimization_problem.define_variable("index_vector", variable_type="binary", index=range(3))
+        actual = optimization_problem.variables
+        mesmo.utils.log_time("test_define_variable", log_level="info", logger_object=logger)
+
+        # Compare expected and actual.
+        pd.testing.assert_frame_equal(actual, expected)
+        self.assertEqual(optimization_problem.variables_len, len(expected))
+
+    def test_get_variable_index(self):
+        # Define optimization problem.
+        timesteps = pd.date_range("2020-01-01", periods=4, freq="H")
+        ders = pd.MultiIndex.from_tuples([("fixed_load", "1"), ("fixed_load", "2"), ("flexible_load", "3")])
+        optimization_problem = mesmo.solutions.OptimizationProblem()
+        optimization_problem.define_variable("der_vector", scenario=[None], timestep=timesteps, der=ders)
+        optimization_problem.define_variable("der_vector", scenario=[None], timestep=timesteps, der=[("ev", "4")])
+        optimization_problem.define_variable("scalar_vector", scenario=[None], timestep=timesteps)
+        optimization_problem.define_variable("index_vector", variable_type="binary", index=range(5))
+
+        # Compare registry lookup and mask-based lookup on the variables index set for various key combinations.
+        for keys in [
+            dict(name="der_vector"),
+            dict(name="der_vector", timestep=timesteps[1:3]),
+            dict(name="der_vector", timestep=timesteps[2], der=ders[1]),
+            dict(name="der_vector", timestep=timesteps, der=[ders[2], ders[0], ders[2]]),
+            dict(name="der_vector", der=("ev", "4")),
+            dict(name=["der_vector", "scalar_vector"], timestep=timesteps[0]),
+            dict(name="scalar_vector", scenario=[None], timestep=timesteps[::-1]),
+            dict(name="index_vector", index=np.array([4, 1])),
+            dict(name="index_vector", index=(1, 2), variable_type="binary"),
+            dict(name="index_vector", variable_type="continuous"),
+            dict(name="invalid_vector"),
+        ]:
+            mesmo.utils.log_time("test_get_variable_index", log_level="info", logger_object=logger)
+            actual = optimization_problem.get_variable_index(**keys)
+            mesmo.utils.log_time("test_get_variable_index", log_level="info", logger_object=logger)
+            expected = mesmo.utils.get_index(optimization_problem.variables, raise_empty_index_error=False, **keys)
+            np.testing.assert_array_equal(actual, expected)
+
+    def test_optimization_matrix_buffer(self):
+        # Define expected result.
+        expected = np.array([[1.0, 0.0, 2.0], [0.0, 0.0, 0.0], [4.0, 0.0, 3.0]])
+
+        # Get actual result.
+        # - Small initial capacity to test growing of the buffer. Duplicate entries are expected to be summed.
+        mesmo.utils.log_time("test_optimization_matrix_buffer", log_level="info", logger_object=logger)
+        buffer = mesmo.solutions.OptimizationMatrixBuffer(capacity=1)
+        buffer.append(np.array([0, 0]), np.array([0, 2]), np.array([1.0, 2.0]))
+        buffer.append(np.array([2, 2, 2]), np.array([2, 0, 0]), np.array([3.0, 1.0, 3.0]))
+        actual = buffer.get_matrix(shape=(3, 3)).toarray()
+        mesmo.utils.log_time("test_optimization_matrix_buffer", log_level="info", logger_object=logger)
+
+        # Compare expected and actual.
+        np.testing.assert_array_equal(actual, expected)
+        self.assertEqual(buffer.length, 5)
+
+    def test_optimization_block_diagonal_matrix(self):
+        # Define block matrix and problem dimensions.
+        block = np.array([[1.0, 0.0, 2.0], [0.0, 3.0, 0.0]])
+        timesteps = range(4)
+        scenarios = ["a", "b"]
+
+        # Define optimization problems with explicit block-diagonal parameter and block-diagonal matrix object.
+        optimization_problems = list()
+        for parameter_matrix in [
+            sp.block_diag([block] * len(timesteps)),
+            mesmo.solutions.OptimizationBlockDiagonalMatrix(block, len(timesteps)),
+        ]:
+            optimization_problem = mesmo.solutions.OptimizationProblem()
+            optimization_problem.define_parameter("parameter_matrix", parameter_matrix)
+            optimization_problem.define_variable("a_vector", scenario=scenarios, timestep=timesteps, a_index=range(3))
+            optimization_problem.define_variable("b_vector", scenario=scenarios, timestep=timesteps, b_index=range(2))
+            optimization_problem.define_constraint(
+                ("variable", 1.0, dict(name="b_vector", scenario=scenarios)),
+                "==",
+                ("variable", "parameter_matrix", dict(name="a_vector", scenario=scenarios)),
+                broadcast="scenario",
+            )
+            optimization_problems.append(optimization_problem)
+
+        # Define expected result.
+        expected = optimization_problems[0].get_standard_form()
+
+        # Get actual result.
+        mesmo.utils.log_time("test_optimization_block_diagonal_matrix", log_level="info", logger_object=logger)
+        actual = optimization_problems[1].get_standard_form()
+        mesmo.utils.log_time("test_optimization_block_diagonal_matrix", log_level="info", logger_object=logger)
+
+        # Compare expected and actual.
+        # - Entries are expected to be identical and in the same order as for the explicit block-diagonal matrix.
+        np.testing.assert_array_equal(actual.a_matrix.toarray(), expected.a_matrix.toarray())
+        np.testing.assert_array_equal(actual.a_matrix_values, expected.a_matrix_values)
+        np.testing.assert_array_equal(
+            mesmo.solutions.get_matrix_entries(mesmo.solutions.OptimizationBlockDiagonalMatrix(block, 3)),
+            sp.find(sp.block_diag([block] * 3)),
+        )
+
+    def test_get_results(self):
+        # Define optimization problem.
+        # - Key sets are not sorted, to test ordering of the reshaped results.
+        timesteps = pd.date_range("2020-01-01", periods=3, freq="H")[::-1]
+        nodes = ["n2", "n1"]
+        phases = ["3", "1"]
+        optimization_problem = mesmo.solutions.OptimizationProblem()
+        optimization_problem.define_variable(
+            "node_vector", scenario=[None], timestep=timesteps, node=nodes, phase=phases
+        )
+        optimization_problem.define_variable("scalar_vector")
+        optimization_problem.define_constraint(
+            ("variable", 1.0, dict(name="node_vector")),
+            ">=",
+            ("constant", 0.0),
+            keys=dict(name="node_vector_constraint", timestep=timesteps, node=nodes, phase=phases),
+        )
+        optimization_problem.x_vector = np.transpose([np.arange(optimization_problem.variables_len, dtype=float)])
+        optimization_problem.mu_vector = np.transpose([np.arange(optimization_problem.constraints_len, dtype=float)])
+
+        # Define expected result.
+        index = pd.MultiIndex.from_product([timesteps, nodes, phases], names=["timestep", "node", "phase"])
+        expected_results = pd.Series(np.arange(len(index), dtype=float), index=index).unstack(level=["node", "phase"])
+        expected_duals = pd.Series(0.0 - np.arange(len(index), dtype=float), index=index).unstack(
+            level=["node", "phase"]
+        )
+
+        # Get actual result.
+        mesmo.utils.log_time("test_get_results", log_level="info", logger_object=logger)
+        results = optimization_problem.get_results()
+        duals = optimization_problem.get_duals()
+        mesmo.utils.log_time("test_get_results", log_level="info", logger_object=logger)
+
+        # Compare expected and actual.
+        # - Timestep frequency is not retained in the index set, hence not compared.
+        pd.testing.assert_frame_equal(results["node_vector"], expected_results, check_freq=False)
+        pd.testing.assert_frame_equal(duals["node_vector_constraint"], expected_duals, check_freq=False)
+        self.assertEqual(results["scalar_vector"], float(len(index)))
+
+    def test_get_standard_form(self):
+        # Define optimization problem.
+        optimization_problem = mesmo.solutions.OptimizationProblem()
+        optimization_problem.define_parameter("parameter_matrix", np.array([[1.0, 2.0], [0.0, 3.0]]))
+        optimization_problem.define_parameter("parameter_vector", np.array([[4.0], [5.0]]))
+        optimization_problem.define_parameter("parameter_cost", np.array([6.0, 7.0]))
+        optimization_problem.define_variable("a_vector", a_index=range(2))
+        optimization_problem.define_variable("b_vector", b_index=range(2))
+        optimization_problem.define_constraint(
+            ("variable", 1.0, dict(name="b_vector")),
+            "<=",
+            ("variable", "parameter_matrix", dict(name="a_vector")),
+            ("constant", "parameter_vector"),
+        )
+        optimization_problem.define_objective(
+            ("variable", "parameter_cost", dict(name="a_vector")), ("variable", 1.0, dict(name="b_vector"))
+        )
+        standard_form = optimization_problem.get_standard_form()
+
+        # Redefine parameters with unchanged sparsity pattern, which is expected to update the standard form in place.
+        mesmo.utils.log_time("test_get_standard_form", log_level="info", logger_object=logger)
+        optimization_problem.define_parameter("parameter_matrix", np.array([[8.0, 9.0], [0.0, 10.0]]))
+        optimization_problem.define_parameter("parameter_vector", np.array([[11.0], [12.0]]))
+        optimization_problem.define_parameter("parameter_cost", np.array([13.0, 14.0]))
+        actual = optimization_problem.get_standard_form()
+        mesmo.utils.log_time("test_get_standard_form", log_level="info", logger_object=logger)
+        expected = mesmo.solutions.OptimizationStandardForm(optimization_problem)
+        self.assertIs(actual, standard_form)
+        np.testing.assert_array_equal(actual.a_matrix.toarray(), expected.a_matrix.toarray())
+        np.testing.assert_array_equal(actual.b_vector, expected.b_vector)
+        np.testing.assert_array_equal(actual.c_vector, expected.c_vector)
+
+        # Redefine parameter with changed sparsity pattern, which is expected to recompile the standard form.
+        optimization_problem.define_parameter("parameter_matrix", np.array([[8.0, 9.0], [15.0, 10.0]]))
+        actual = optimization_problem.get_standard_form()
+        expected = mesmo.solutions.OptimizationStandardForm(optimization_problem)
+        self.assertIsNot(actual, standard_form)
+        np.testing.assert_array_equal(actual.a_matrix.toarray(), expected.a_matrix.toarray())
+
+    @unittest.skipIf(mesmo.solutions.highspy is None, "HiGHS Python interface is not installed.")
+    def test_solve_highs(self):
+        # Define optimization problem.
+        optimization_problem = mesmo.solutions.OptimizationProblem()
+        optimization_problem.define_parameter("parameter_vector", np.array([[1.0], [2.0]]))
+        optimization_problem.define_variable("a_vector", a_index=range(2))
+        optimization_problem.define_constraint(
+            ("variable", 1.0, dict(name="a_vector")),
+            ">=",
+            ("constant", "parameter_vector"),
+        )
+        optimization_problem.define_objective(("variable", np.array([[3.0, 4.0]]), dict(name="a_vector")))
+
+        # Solve and re-solve with redefined parameter, which is expected to reuse the HiGHS problem.
+        # - The constraint is a bound row, i.e., duals are expected to be recovered from the reduced costs.
+        mesmo.utils.log_time("test_solve_highs", log_level="info", logger_object=logger)
+        optimization_problem.solve_highs(optimization_problem.update_highs_problem())
+        highs_problem = optimization_problem.highs_problem
+        self.assertAlmostEqual(optimization_problem.objective, 11.0)
+        optimization_problem.define_parameter("parameter_vector", np.array([[5.0], [6.0]]))
+        optimization_problem.solve_highs(optimization_problem.update_highs_problem())
+        mesmo.utils.log_time("test_solve_highs", log_level="info", logger_object=logger)
+        self.assertIs(optimization_problem.highs_problem, highs_problem)
+        self.assertAlmostEqual(optimization_problem.objective, 39.0)
+        np.testing.assert_array_almost_equal(optimization_problem.x_vector, np.array([[5.0], [6.0]]))
+        np.testing.assert_array_almost_equal(optimization_problem.mu_vector, np.array([[-3.0], [-4.0]]))
+
+    @unittest.skipIf(mesmo.solutions.highspy is None, "HiGHS Python interface is not installed.")
+    def test_solve_highs_parameter_assignment(self):
+        # Define optimization problem.
+        optimization_problem = mesmo.solutions.OptimizationProblem()
+        optimization_problem.define_parameter("parameter_vector", np.array([[1.0], [0.0]]))
+        optimization_problem.define_variable("a_vector", a_index=range(2))
+        optimization_problem.define_constraint(
+            ("variable", np.array([[1.0, 1.0], [1.0, -1.0]]), dict(name="a_vector")),
+            ">=",
+            ("constant", "parameter_vector"),
+        )
+        optimization_problem.define_constraint(("variable", 1.0, dict(name="a_vector")), ">=", ("constant", 0.0))
+        optimization_problem.define_objective(("variable", np.array([[3.0, 4.0]]), dict(name="a_vector")))
+
+        # Solve and re-solve with parameter redefined via direct assignment to the parameters dictionary.
+        # - The assignment is expected to be tracked, i.e., the re-solve is expected to use the updated parameter.
+        mesmo.utils.log_time("test_solve_highs_parameter_assignment", log_level="info", logger_object=logger)
+        optimization_problem.solve_highs(optimization_problem.update_highs_problem())
+        self.assertAlmostEqual(optimization_problem.objective, 3.0)
+        optimization_problem.parameters["parameter_vector"] = np.array([[2.0], [1.0]])
+        self.assertEqual(optimization_problem.parameters.redefined_names, {"parameter_vector"})
+        optimization_problem.solve_highs(optimization_problem.update_highs_problem())
+        mesmo.utils.log_time("test_solve_highs_parameter_assignment", log_level="info", logger_object=logger)
+        self.assertAlmostEqual(optimization_problem.objective, 6.0)
+        np.testing.assert_array_almost_equal(optimization_problem.x_vector, np.array([[2.0], [0.0]]))
+        self.assertEqual(optimization_problem.parameters.redefined_names, set())
+
+    @unittest.skipIf(mesmo.solutions.highspy is None, "HiGHS Python interface is not installed.")
+    def test_solve_highs_equality(self):
+        # Define optimization problem.
+        # - The second constraint is an equality bound row, i.e., it is expected to fix the lower and upper bound.
+        optimization_problem = mesmo.solutions.OptimizationProblem()
+        optimization_problem.define_variable("a_vector", a_index=range(2))
+        optimization_problem.define_constraint(
+            ("variable", np.array([[1.0, 1.0]]), dict(name="a_vector")), "==", ("constant", 4.0)
+        )
+        optimization_problem.define_constraint(
+            ("variable", np.array([[1.0, 0.0]]), dict(name="a_vector")), "==", ("constant", 1.0)
+        )
+        optimization_problem.define_objective(("variable", np.array([[3.0, 4.0]]), dict(name="a_vector")))
+
+        # Solve optimization problem.
+        # - Native equality duals in the dual vector follow the convention of greater-than-equal constraints.
+        mesmo.utils.log_time("test_solve_highs_equality", log_level="info", logger_object=logger)
+        optimization_problem.solve_highs(optimization_problem.update_highs_problem())
+        mesmo.utils.log_time("test_solve_highs_equality", log_level="info", logger_object=logger)
+        self.assertEqual(optimization_problem.constraints_len, 2)
+        self.assertAlmostEqual(optimization_problem.objective, 15.0)
+        np.testing.assert_array_almost_equal(optimization_problem.x_vector, np.array([[1.0], [3.0]]))
+        np.testing.assert_array_almost_equal(optimization_problem.mu_vector, np.array([[-4.0], [1.0]]))
+
+    @unittest.skipIf(mesmo.solutions.highspy is None, "HiGHS Python interface is not installed.")
+    def test_get_duals_equality(self):
+        # Define optimization problem for both binding directions of the equality constraint, i.e., maximizing and
+        # minimizing the first variable, which binds the less-than-equal and greater-than-equal direction respectively.
+        timesteps = pd.Index([pd.Timestamp("2020-01-01")], name="timestep")
+        for objective_coefficient in [-1.0, 1.0]:
+            optimization_problem = mesmo.solutions.OptimizationProblem()
+            optimization_problem.define_variable("x", timestep=timesteps)
+            optimization_problem.define_variable("y", timestep=timesteps)
+            optimization_problem.define_constraint(
+                ("variable", 1.0, dict(name="x")),
+                ("variable", 1.0, dict(name="y")),
+                "==",
+                ("constant", 1.0),
+                keys=dict(name="equality", timestep=timesteps),
+            )
+            optimization_problem.define_constraint(
+                ("variable", 1.0, dict(name="y")), ">=", ("constant", 0.0), keys=dict(name="lower", timestep=timesteps)
+            )
+            optimization_problem.define_constraint(
+                ("variable", 1.0, dict(name="y")), "<=", ("constant", 5.0), keys=dict(name="upper", timestep=timesteps)
+            )
+            optimization_problem.define_objective(("variable", objective_coefficient, dict(name="x")))
+
+            # Get actual result.
+            # - Equality duals are expected to follow the convention of equality constraints being split into
+            #   greater-than-equal and less-than-equal constraints, i.e., both binding directions yield a positive dual.
+            mesmo.utils.log_time("test_get_duals_equality", log_level="info", logger_object=logger)
+            optimization_problem.solve_highs(optimization_problem.update_highs_problem())
+            duals = optimization_problem.get_duals()
+            mesmo.utils.log_time("test_get_duals_equality", log_level="info", logger_object=logger)
+            np.testing.assert_array_almost_equal(duals["equality"].values, np.array([[1.0]]))
+            np.testing.assert_array_almost_equal(
+                duals["lower"].values, np.array([[1.0 if objective_coefficient < 0.0 else 0.0]])
+            )
+            np.testing.assert_array_almost_equal(
+                duals["upper"].values, np.array([[0.0 if objective_coefficient < 0.0 else 1.0]])
+            )
+
+    @unittest.skipIf(not mesmo.config.config["paths"]["highs_solver"].exists(), "HiGHS binary is not installed.")
+    def test_solve_highs_binary(self):
+        # Define optimization problem.
+        # - The first, second and fourth constraint rows are bound rows, i.e., these are defined as variable bounds
+        #   in the model file, and the third constraint row is the only reduced constraint row.
+        optimization_problem = mesmo.solutions.OptimizationProblem()
+        optimization_problem.define_parameter("parameter_vector", np.array([[1.0], [2.0]]))
+        optimization_problem.define_variable("a_vector", a_index=range(3))
+        optimization_problem.define_constraint(
+            ("variable", 1.0, dict(name="a_vector", a_index=[0, 1])),
+            ">=",
+            ("constant", "parameter_vector"),
+        )
+        optimization_problem.define_constraint(
+            ("variable", np.array([[1.0, 1.0, 1.0]]), dict(name="a_vector")), ">=", ("constant", 6.0)
+        )
+        optimization_problem.define_constraint(
+            ("variable", np.array([[0.0, 0.0, 2.0]]), dict(name="a_vector")), "<=", ("constant", 4.0)
+        )
+        optimization_problem.define_objective(("variable", np.array([[3.0, 4.0, 1.0]]), dict(name="a_vector")))
+
+        # Solve optimization problem.
+        # - Duals of the bound rows are expected to be recovered from the reduced costs.
+        mesmo.utils.log_time("test_solve_highs_binary", log_level="info", logger_object=logger)
+        optimization_problem.solve_highs_binary()
+        mesmo.utils.log_time("test_solve_highs_binary", log_level="info", logger_object=logger)
+        self.assertEqual(len(optimization_problem.get_standard_form().constraint_rows), 1)
+        self.assertAlmostEqual(optimization_problem.objective, 16.0)
+        np.testing.assert_array_almost_equal(optimization_problem.x_vector, np.array([[2.0], [2.0], [2.0]]))
+        np.testing.assert_array_almost_equal(optimization_problem.mu_vector, np.array([[0.0], [-1.0], [-3.0], [-1.0]]))
+
+    def test_save_load(self):
+        # Define optimization problem.
+        optimization_problem = mesmo.solutions.OptimizationProblem()
+        optimization_problem.define_parameter("parameter_vector", np.array([[1.0], [2.0]]))
+        optimization_problem.define_variable("a_vector", a_index=range(2))
+        optimization_problem.define_constraint(
+            ("variable", np.array([[1.0, 1.0], [1.0, -1.0]]), dict(name="a_vector")),
+            ">=",
+            ("constant", "parameter_vector"),
+        )
+        optimization_problem.define_objective(("variable", np.array([[3.0, 4.0]]), dict(name="a_vector")))
+        optimization_problem.get_standard_form()
+
+        # Store and load optimization problem, then redefine parameter.
+        # - The loaded standard form is expected to be updated in place.
+        mesmo.utils.log_time("test_save_load", log_level="info", logger_object=logger)
+        with tempfile.TemporaryDirectory() as temporary_path:
+            optimization_problem.save(pathlib.Path(temporary_path) / "optimization_problem.pkl")
+            actual = mesmo.solutions.OptimizationProblem.load(pathlib.Path(temporary_path) / "optimization_problem.pkl")
+        standard_form = actual.standard_form
+        actual.define_parameter("parameter_vector", np.array([[5.0], [6.0]]))
+        optimization_problem.define_parameter("parameter_vector", np.array([[5.0], [6.0]]))
+        mesmo.utils.log_time("test_save_load", log_level="info", logger_object=logger)
+
+        # Compare expected and actual.
+        self.assertIs(actual.get_standard_form(), standard_form)
+        self.assertEqual(actual.variables_len, optimization_problem.variables_len)
+        pd.testing.assert_frame_equal(actual.constraints, optimization_problem.constraints)
+        np.testing.assert_array_equal(actual.get_a_matrix().toarray(), optimization_problem.get_a_matrix().toarray())
+        np.testing.assert_array_equal(actual.get_b_vector(), optimization_problem.get_b_vector())
+        np.testing.assert_array_equal(actual.get_c_vector(), optimization_problem.get_c_vector())
+
+    def test_get_bounds(self):
+        # Define optimization problem.
+        optimization_problem = mesmo.solutions.OptimizationProblem()
+        optimization_problem.define_variable("a_vector", a_index=range(3))
+        optimization_problem.define_constraint(
+            ("variable", np.array([[2.0, 0.0, 0.0], [0.0, 1.0, 0.0]]), dict(name="a_vector")), "<=", ("constant", 4.0)
+        )
+        optimization_problem.define_constraint(
+            ("variable", np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 1.0]]), dict(name="a_vector")), ">=", ("constant", -1.0)
+        )
+        optimization_problem.define_constraint(("variable", 1.0, dict(name="a_vector")), "<=", ("constant", 3.0))
+
+        # Define expected result.
+        expected_lower_bounds = np.array([-1.0, -np.inf, -np.inf])
+        expected_upper_bounds = np.array([2.0, 3.0, 3.0])
+        expected_constraint_rows = np.array([3])
+
+        # Get actual result.
+        mesmo.utils.log_time("test_get_bounds", log_level="info", logger_object=logger)
+        standard_form = optimization_problem.get_standard_form()
+        actual_lower_bounds, actual_upper_bounds = standard_form.get_bounds()
+        mesmo.utils.log_time("test_get_bounds", log_level="info", logger_object=logger)
+
+        # Compare expected and actual.
+        np.testing.assert_array_equal(actual_lower_bounds, expected_lower_bounds)
+        np.testing.assert_array_equal(actual_upper_bounds, expected_upper_bounds)
+        np.testing.assert_array_equal(standard_form.constraint_rows, expected_constraint_rows)
+        self.assertEqual(standard_form.get_a_matrix_reduced().shape, (1, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
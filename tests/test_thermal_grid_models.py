@@ -1,7 +1,9 @@
 """Test thermal grid models."""
 
 import inspect
+import numpy as np
 from parameterized import parameterized
+import scipy.sparse as sp
 import unittest
 
 import mesmo
@@ -41,6 +43,206 @@ class TestThermalGridModels(unittest.TestCase):
             object_handle(mesmo.config.config["tests"]["thermal_grid_scenario_name"])
         mesmo.utils.log_time(f"test `{object_name}`", log_level="info", logger_object=logger)
 
+    def test_thermal_grid_model_matrices(self):
+        # Get actual result.
+        mesmo.utils.log_time("test_thermal_grid_model_matrices", log_level="info", logger_object=logger)
+        thermal_grid_model = mesmo.thermal_grid_models.ThermalGridModel(
+            mesmo.config.config["tests"]["thermal_grid_scenario_name"]
+        )
+        mesmo.utils.log_time("test_thermal_grid_model_matrices", log_level="info", logger_object=logger)
+
+        # Compare expected and actual.
+        # - Each branch connects two nodes.
+        np.testing.assert_array_equal(thermal_grid_model.branch_incidence_1_matrix.sum(axis=1), 1)
+        np.testing.assert_array_equal(thermal_grid_model.branch_incidence_2_matrix.sum(axis=1), 1)
+        np.testing.assert_array_equal(thermal_grid_model.branch_incidence_matrix.sum(axis=1), 0)
+        # - Each DER is connected to one node.
+        np.testing.assert_array_equal(thermal_grid_model.der_node_incidence_matrix.sum(axis=0), 1)
+        # - Radial network has no loops, hence the number of branches equals the number of no-source nodes.
+        self.assertEqual(len(thermal_grid_model.branch_loops), 0)
+        self.assertEqual(
+            thermal_grid_model.branch_incidence_matrix_no_source_no_loop.shape[0], len(thermal_grid_model.nodes) - 1
+        )
+        self.assertEqual(thermal_grid_model.branch_loop_incidence_matrix.shape, (len(thermal_grid_model.branches), 0))
+
+    def test_thermal_grid_model_loops(self):
+        # Obtain thermal grid data for a meshed network of four nodes, based on the test scenario.
+        # - Lines are defined such that two disjoint sections {2, 3} and {0, 1} are constructed first, which are then
+        #   connected by line "b", and line "c" closes the loop 0-1-2-0.
+        thermal_grid_data = mesmo.data_interface.ThermalGridData(
+            mesmo.config.config["tests"]["thermal_grid_scenario_name"]
+        )
+        thermal_grid_data.thermal_grid.at["source_node_name"] = "0"
+        thermal_grid_data.thermal_grid_nodes = thermal_grid_data.thermal_grid_nodes.iloc[:4, :].copy()
+        thermal_grid_data.thermal_grid_nodes.loc[:, "node_name"] = ["0", "1", "2", "3"]
+        thermal_grid_data.thermal_grid_nodes.index = thermal_grid_data.thermal_grid_nodes.loc[:, "node_name"]
+        thermal_grid_data.thermal_grid_lines = thermal_grid_data.thermal_grid_lines.iloc[:4, :].copy()
+        thermal_grid_data.thermal_grid_lines.loc[:, "line_name"] = ["d", "a", "b", "c"]
+        thermal_grid_data.thermal_grid_lines.loc[:, "node_1_name"] = ["2", "0", "1", "2"]
+        thermal_grid_data.thermal_grid_lines.loc[:, "node_2_name"] = ["3", "1", "2", "0"]
+        thermal_grid_data.thermal_grid_lines.index = thermal_grid_data.thermal_grid_lines.loc[:, "line_name"]
+        thermal_grid_data.thermal_grid_ders = thermal_grid_data.thermal_grid_ders.iloc[:3, :].copy()
+        thermal_grid_data.thermal_grid_ders.loc[:, "node_name"] = ["1", "2", "3"]
+
+        # Get actual result.
+        mesmo.utils.log_time("test_thermal_grid_model_loops", log_level="info", logger_object=logger)
+        thermal_grid_model = mesmo.thermal_grid_models.ThermalGridModel(thermal_grid_data)
+        mesmo.utils.log_time("test_thermal_grid_model_loops", log_level="info", logger_object=logger)
+
+        # Compare expected and actual.
+        # - Only line "c" is marked as loop, because all other lines connect nodes of different sections.
+        # - Branch-to-loop incidence matrix rows are ordered as no-loop branches "d", "a", "b" followed by loop
+        #   branch "c", where the loop flow passes through "a" and "b" in forward direction but not through "d".
+        self.assertEqual(
+            thermal_grid_model.branches.tolist(), [("d", "no_loop"), ("a", "no_loop"), ("b", "no_loop"), ("c", "loop")]
+        )
+        self.assertEqual(thermal_grid_model.branch_loops.tolist(), [(0, "c")])
+        np.testing.assert_allclose(
+            thermal_grid_model.branch_loop_incidence_matrix.toarray(), np.array([[0.0], [1.0], [1.0], [1.0]])
+        )
+
+        # Obtain thermal grid data for disjoint sections {0, 1} and {2, 3}, which is expected to raise an error.
+        thermal_grid_data.thermal_grid_lines = thermal_grid_data.thermal_grid_lines.loc[["d", "a"], :]
+        with self.assertRaisesRegex(ValueError, "disjoint sections"):
+            mesmo.thermal_grid_models.ThermalGridModel(thermal_grid_data)
+
+    def test_get_branch_loss_coefficient_vector(self):
+        # Obtain thermal grid model and branch flow timeseries, including zero, laminar and turbulent flows.
+        thermal_grid_model = mesmo.thermal_grid_models.ThermalGridModel(
+            mesmo.config.config["tests"]["thermal_grid_scenario_name"]
+        )
+        branch_flow_vectors = np.outer(
+            thermal_grid_model.branch_flow_vector_reference, np.array([0.0, 1.0e-6, 1.0e-3, 0.1, -1.0])
+        )
+
+        # Define expected result.
+        expected = np.transpose(
+            [
+                thermal_grid_model.get_branch_loss_coefficient_vector(branch_flow_vector)
+                for branch_flow_vector in np.transpose(branch_flow_vectors)
+            ]
+        )
+
+        # Get actual result.
+        mesmo.utils.log_time("test_get_branch_loss_coefficient_vector", log_level="info", logger_object=logger)
+        actual = thermal_grid_model.get_branch_loss_coefficient_vector(branch_flow_vectors)
+        mesmo.utils.log_time("test_get_branch_loss_coefficient_vector", log_level="info", logger_object=logger)
+
+        # Compare expected and actual.
+        np.testing.assert_array_equal(actual, expected)
+        np.testing.assert_array_equal(actual[:, 0], 0.0)
+        self.assertTrue((actual[:, 1:] > 0.0).all())
+
+    @parameterized.expand(
+        [
+            ("explicit", mesmo.thermal_grid_models.ThermalPowerFlowSolutionExplicit),
+            ("newton_raphson", mesmo.thermal_grid_models.ThermalPowerFlowSolutionNewtonRaphson),
+        ]
+    )
+    def test_thermal_power_flow_solution_batch(self, method_name, power_flow_solution_method):
+        # Obtain thermal grid model and DER thermal power timeseries, including zero thermal power.
+        thermal_grid_model = mesmo.thermal_grid_models.ThermalGridModel(
+            mesmo.config.config["tests"]["thermal_grid_scenario_name"]
+        )
+        der_thermal_power_vectors = np.outer(
+            np.array([0.0, 0.5, 1.0, 1.5]), thermal_grid_model.der_thermal_power_vector_reference
+        )
+
+        # Define expected result.
+        power_flow_solutions = [
+            power_flow_solution_method(thermal_grid_model, der_thermal_power_vector)
+            for der_thermal_power_vector in der_thermal_power_vectors
+        ]
+
+        # Get actual result.
+        mesmo.utils.log_time(f"test_thermal_power_flow_solution_batch_{method_name}")
+        node_head_vectors, branch_flow_vectors, pump_powers = power_flow_solution_method.get_solution_batch(
+            thermal_grid_model, der_thermal_power_vectors
+        )
+        mesmo.utils.log_time(f"test_thermal_power_flow_solution_batch_{method_name}")
+
+        # Compare expected and actual.
+        # - Absolute tolerance accounts for numerical noise of the solution for zero thermal power.
+        np.testing.assert_allclose(
+            node_head_vectors,
+            [power_flow_solution.node_head_vector for power_flow_solution in power_flow_solutions],
+            atol=1e-9,
+        )
+        np.testing.assert_allclose(
+            branch_flow_vectors,
+            [power_flow_solution.branch_flow_vector for power_flow_solution in power_flow_solutions],
+            atol=1e-9,
+        )
+        np.testing.assert_allclose(
+            pump_powers, [power_flow_solution.pump_power for power_flow_solution in power_flow_solutions], atol=1e-9
+        )
+
+    def test_linear_thermal_grid_model_global_sensitivity_matrices(self):
+        # Obtain thermal grid model and thermal power flow solution.
+        thermal_grid_model = mesmo.thermal_grid_models.ThermalGridModel(
+            mesmo.config.config["tests"]["thermal_grid_scenario_name"]
+        )
+        thermal_power_flow_solution = mesmo.thermal_grid_models.ThermalPowerFlowSolution(thermal_grid_model)
+
+        # Get actual result.
+        mesmo.utils.log_time(
+            "test_linear_thermal_grid_model_global_sensitivity_matrices", log_level="info", logger_object=logger
+        )
+        linear_thermal_grid_model = mesmo.thermal_grid_models.LinearThermalGridModelGlobal(
+            thermal_grid_model, thermal_power_flow_solution
+        )
+        mesmo.utils.log_time(
+            "test_linear_thermal_grid_model_global_sensitivity_matrices", log_level="info", logger_object=logger
+        )
+
+        # Compare nodal head sensitivity matrix by nodal power with explicit inverse of nodal head jacobian matrix.
+        node_index_no_source = mesmo.utils.get_index(thermal_grid_model.nodes, node_type="no_source")
+        expected = (
+            (2.0**-1.5)
+            * np.linalg.inv(
+                (
+                    np.transpose(thermal_grid_model.branch_incidence_matrix_no_source)
+                    @ linear_thermal_grid_model.jacobian_branch_head_loss_inverse
+                    @ thermal_grid_model.branch_incidence_matrix_no_source
+                ).toarray()
+            )
+            * thermal_grid_model.enthalpy_difference_distribution_water
+        )
+        actual = linear_thermal_grid_model.sensitivity_node_head_by_node_power.toarray()
+        np.testing.assert_allclose(actual[np.ix_(node_index_no_source, node_index_no_source)], expected, rtol=1e-9)
+
+        # Compare sensitivity matrices by DER power with sensitivity matrices by nodal power, which are
+        # obtained on demand.
+        for sensitivity_type in ["node_head", "branch_flow", "pump_power"]:
+            with self.subTest(sensitivity_type=sensitivity_type):
+                expected = (
+                    getattr(linear_thermal_grid_model, f"sensitivity_{sensitivity_type}_by_node_power")
+                    @ thermal_grid_model.der_node_incidence_matrix
+                )
+                actual = getattr(linear_thermal_grid_model, f"sensitivity_{sensitivity_type}_by_der_power")
+                np.testing.assert_allclose(
+                    actual.toarray() if sp.issparse(actual) else actual.ravel(),
+                    expected.toarray() if sp.issparse(expected) else np.ravel(expected),
+                    rtol=1e-9,
+                    atol=1e-12,
+                )
+        # Nodal sensitivity matrices are not stored as attributes, but retained upon first access, such that repeated
+        # access does not recompute the sensitivity matrices.
+        self.assertNotIn("sensitivity_node_head_by_node_power", vars(linear_thermal_grid_model))
+        sensitivity_matrices_by_node_power = linear_thermal_grid_model.sensitivity_matrices_by_node_power
+        self.assertIsNotNone(sensitivity_matrices_by_node_power)
+        self.assertIs(
+            linear_thermal_grid_model.sensitivity_node_head_by_node_power,
+            sensitivity_matrices_by_node_power["node_head"],
+        )
+        self.assertIs(
+            linear_thermal_grid_model.sensitivity_branch_flow_by_node_power,
+            sensitivity_matrices_by_node_power["branch_flow"],
+        )
+        self.assertIs(linear_thermal_grid_model.sensitivity_matrices_by_node_power, sensitivity_matrices_by_node_power)
+        # Retained sensitivity matrices are excluded from copies.
+        self.assertIsNone(linear_thermal_grid_model.copy().sensitivity_matrices_by_node_power)
+
 
 if __name__ == "__main__":
     unittest.main()